@@ -1,5 +1,130 @@
+import os
+
 CLI_CONFIG = {}
-CONFIG = {}
+CONFIG = {
+    'azurerm_client_pool_size': {
+        'default': 32,
+        'help': 'The maximum number of Azure management clients to keep pooled for reuse',
+        'dyne': 'idem',
+    },
+    'azurerm_client_idle_timeout': {
+        'default': 300,
+        'help': 'The number of seconds a pooled Azure management client may sit idle before it is evicted',
+        'dyne': 'idem',
+    },
+    'azurerm_token_refresh_margin': {
+        'default': 300,
+        'help': 'The number of seconds before expiry at which cached Azure tokens are refreshed in the background',
+        'dyne': 'idem',
+    },
+    'azurerm_cache_dir': {
+        'default': os.path.join(os.path.expanduser('~'), '.cache', 'idem_azurerm'),
+        'help': 'The directory used to persist Azure provider caches between runs',
+        'dyne': 'idem',
+    },
+    'azurerm_cloud_cache_ttl': {
+        'default': 86400,
+        'help': 'The number of seconds a cloud environment resolved from a metadata endpoint is cached',
+        'dyne': 'idem',
+    },
+    'azurerm_executor_threads': {
+        'default': 32,
+        'help': 'The number of threads available for running blocking Azure SDK calls',
+        'dyne': 'idem',
+    },
+    'azurerm_subscription_concurrency': {
+        'default': 16,
+        'help': 'The maximum number of concurrent Azure SDK calls made against a single subscription',
+        'dyne': 'idem',
+    },
+    'azurerm_lro_initial_delay': {
+        'default': 2,
+        'help': 'The initial number of seconds between status checks of a long-running Azure operation',
+        'dyne': 'idem',
+    },
+    'azurerm_lro_max_delay': {
+        'default': 30,
+        'help': 'The maximum number of seconds between status checks of a long-running Azure operation',
+        'dyne': 'idem',
+    },
+    'azurerm_page_prefetch': {
+        'default': 1,
+        'help': 'The number of pages of a paged Azure listing to fetch ahead of the page being processed',
+        'dyne': 'idem',
+    },
+    'azurerm_throttle_read_threshold': {
+        'default': 500,
+        'help': 'The remaining ARM subscription read budget below which requests are slowed down',
+        'dyne': 'idem',
+    },
+    'azurerm_throttle_write_threshold': {
+        'default': 100,
+        'help': 'The remaining ARM subscription write budget below which requests are slowed down',
+        'dyne': 'idem',
+    },
+    'azurerm_throttle_max_delay': {
+        'default': 30,
+        'help': 'The maximum number of seconds to delay a request when the ARM budget is exhausted or throttled',
+        'dyne': 'idem',
+    },
+    'azurerm_throttle_max_retries': {
+        'default': 5,
+        'help': 'The number of times a request throttled by ARM with a 429 or 503 is retried',
+        'dyne': 'idem',
+    },
+    'azurerm_get_cache_ttl': {
+        'default': 60,
+        'help': 'The number of seconds a resource read by an exec get function is cached for the run',
+        'dyne': 'idem',
+    },
+    'azurerm_get_cache_size': {
+        'default': 1024,
+        'help': 'The maximum number of resources held in the exec get cache',
+        'dyne': 'idem',
+    },
+    'azurerm_location_index_ttl': {
+        'default': 300,
+        'help': 'The number of seconds the resource group location index is used before it is refreshed',
+        'dyne': 'idem',
+    },
+    'azurerm_batch_window': {
+        'default': 0.05,
+        'help': 'The number of seconds reads made through the ARM batch endpoint are collected before being sent',
+        'dyne': 'idem',
+    },
+    'azurerm_batch_gets': {
+        'default': False,
+        'help': 'Read resources for exec get functions through the ARM batch endpoint, so reads made within '
+                'azurerm_batch_window seconds of each other share a request',
+        'dyne': 'idem',
+    },
+    'azurerm_list_backend': {
+        'default': 'arm',
+        'help': 'The backend used by list_all functions, either arm or resource_graph',
+        'dyne': 'idem',
+    },
+    'azurerm_fast_present': {
+        'default': False,
+        'help': 'Skip the full read and diff in present states whose arguments and resource ETag are unchanged since '
+                'the state last succeeded',
+        'dyne': 'idem',
+    },
+    'azurerm_inventory': {
+        'default': False,
+        'help': 'Record every resource read by exec get and list functions in a SQLite inventory in azurerm_cache_dir',
+        'dyne': 'idem',
+    },
+    'azurerm_inventory_test_reads': {
+        'default': False,
+        'help': 'Read resources from the SQLite inventory instead of from ARM during test runs',
+        'dyne': 'idem',
+    },
+    'azurerm_metrics_textfile': {
+        'default': None,
+        'help': 'A file to periodically write Azure SDK call metrics to in the Prometheus text format',
+        'dyne': 'idem',
+    },
+}
 GLOBAL = {}
 SUBS = {}
 DYNE = {
@@ -83,7 +83,8 @@ async def operations_metadata_get(hub, resource_provider_namespace, api_version=
     result = {}
     authconn = await hub.exec.utils.azurerm.get_client('authorization', **kwargs)
     try:
-        data = authconn.provider_operations_metadata.get(
+        data = await hub.exec.utils.azurerm.run(
+            authconn.provider_operations_metadata.get,
             resource_provider_namespace=resource_provider_namespace,
             api_version=api_version,
             **kwargs
@@ -84,7 +84,8 @@ async def definitions_get(hub, role_id, scope, **kwargs):
     authconn = await hub.exec.utils.azurerm.get_client('authorization', **kwargs)
 
     try:
-        defs = authconn.role_definitions.get(
+        defs = await hub.exec.utils.azurerm.run(
+            authconn.role_definitions.get,
             scope=scope,
             role_definition_id=role_id,
             **kwargs
@@ -120,7 +121,8 @@ async def definitions_get_by_id(hub, role_id, **kwargs):
     authconn = await hub.exec.utils.azurerm.get_client('authorization', **kwargs)
 
     try:
-        defs = authconn.role_definitions.get_by_id(
+        defs = await hub.exec.utils.azurerm.run(
+            authconn.role_definitions.get_by_id,
             role_definition_id=role_id,
             **kwargs
         )
@@ -189,7 +191,8 @@ async def assignments_get(hub, name, scope, **kwargs):
     authconn = await hub.exec.utils.azurerm.get_client('authorization', **kwargs)
 
     try:
-        assigns = authconn.role_assignments.get(
+        assigns = await hub.exec.utils.azurerm.run(
+            authconn.role_assignments.get,
             role_assignment_name=name,
             scope=scope,
             **kwargs
@@ -224,7 +227,8 @@ async def assignments_get_by_id(hub, assignment_id, **kwargs):
     authconn = await hub.exec.utils.azurerm.get_client('authorization', **kwargs)
 
     try:
-        assigns = authconn.role_assignments.get_by_id(
+        assigns = await hub.exec.utils.azurerm.run(
+            authconn.role_assignments.get_by_id,
             role_assignment_id=assignment_id,
             **kwargs
             )
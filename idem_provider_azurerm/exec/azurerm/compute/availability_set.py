@@ -82,17 +82,18 @@ async def create_or_update(hub, name, resource_group, **kwargs):
         azurerm.compute.availability_set.create_or_update testset testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Compute', 'availabilitySets', name, **kwargs
+    )
     if 'location' not in kwargs:
-        rg_props = await hub.exec.azurerm.resource.group.get(
-            resource_group, **kwargs
-        )
+        location = await hub.exec.azurerm.resource.group.get_location(resource_group, **kwargs)
 
-        if 'error' in rg_props:
+        if not location:
             log.error(
                 'Unable to determine location from resource group specified.'
             )
             return False
-        kwargs['location'] = rg_props['location']
+        kwargs['location'] = location
 
     compconn = await hub.exec.utils.azurerm.get_client('compute', **kwargs)
 
@@ -116,7 +117,8 @@ async def create_or_update(hub, name, resource_group, **kwargs):
         return result
 
     try:
-        av_set = compconn.availability_sets.create_or_update(
+        av_set = await hub.exec.utils.azurerm.run(
+            compconn.availability_sets.create_or_update,
             resource_group_name=resource_group,
             availability_set_name=name,
             parameters=setmodel
@@ -129,6 +131,8 @@ async def create_or_update(hub, name, resource_group, **kwargs):
     except SerializationError as exc:
         result = {'error': 'The object model could not be parsed. ({0})'.format(str(exc))}
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
 
 
@@ -150,10 +154,14 @@ async def delete(hub, name, resource_group, **kwargs):
         azurerm.compute.availability_set.delete testset testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Compute', 'availabilitySets', name, **kwargs
+    )
     result = False
     compconn = await hub.exec.utils.azurerm.get_client('compute', **kwargs)
     try:
-        compconn.availability_sets.delete(
+        await hub.exec.utils.azurerm.run(
+            compconn.availability_sets.delete,
             resource_group_name=resource_group,
             availability_set_name=name
         )
@@ -162,6 +170,8 @@ async def delete(hub, name, resource_group, **kwargs):
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('compute', str(exc), **kwargs)
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
 
 
@@ -183,13 +193,19 @@ async def get(hub, name, resource_group, **kwargs):
         azurerm.compute.availability_set.get testset testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Compute', 'availabilitySets', name, **kwargs
+    )
     compconn = await hub.exec.utils.azurerm.get_client('compute', **kwargs)
     try:
-        av_set = compconn.availability_sets.get(
+        result = await hub.exec.utils.azurerm.cached_get(
+            arm_id,
+            compconn.availability_sets.get,
             resource_group_name=resource_group,
-            availability_set_name=name
+            availability_set_name=name,
+            ctx=kwargs.get('ctx'),
+            batch_model='AvailabilitySet'
         )
-        result = av_set.as_dict()
 
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('compute', str(exc), **kwargs)
@@ -198,7 +214,7 @@ async def get(hub, name, resource_group, **kwargs):
     return result
 
 
-async def list_(hub, resource_group, **kwargs):
+async def list_(hub, resource_group, stream=False, limit=None, **kwargs):
     '''
     .. versionadded:: 1.0.0
 
@@ -207,6 +223,11 @@ async def list_(hub, resource_group, **kwargs):
     :param resource_group: The resource group name to list availability
         sets within.
 
+    :param stream: If True, return an asynchronous generator which yields each item as its page is retrieved,
+        instead of a dictionary keyed by name. Errors are raised to the consumer while iterating.
+
+    :param limit: The maximum number of items to yield when streaming.
+
     CLI Example:
 
     .. code-block:: bash
@@ -216,6 +237,14 @@ async def list_(hub, resource_group, **kwargs):
     '''
     result = {}
     compconn = await hub.exec.utils.azurerm.get_client('compute', **kwargs)
+    if stream:
+        return hub.exec.utils.azurerm.paged_object_to_iter(
+            compconn.availability_sets.list(
+                resource_group_name=resource_group
+            ),
+            limit=limit
+        )
+
     try:
         avail_sets = await hub.exec.utils.azurerm.paged_object_to_list(
             compconn.availability_sets.list(
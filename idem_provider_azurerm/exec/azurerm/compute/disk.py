@@ -84,7 +84,8 @@ async def delete(hub, name, resource_group, **kwargs):
     result = False
     compconn = await hub.exec.utils.azurerm.get_client('compute', **kwargs)
     try:
-        compconn.disks.delete(
+        await hub.exec.utils.azurerm.run(
+            compconn.disks.delete,
             resource_group_name=resource_group,
             disk_name=name
         )
@@ -96,17 +96,16 @@ async def create_or_update(hub, name, resource_group, source_vm=None, source_vm_
         azurerm.compute.image.create_or_update testimage testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(resource_group, 'Microsoft.Compute', 'images', name, **kwargs)
     if 'location' not in kwargs:
-        rg_props = await hub.exec.azurerm.resource.group.get(
-            resource_group, **kwargs
-        )
+        location = await hub.exec.azurerm.resource.group.get_location(resource_group, **kwargs)
 
-        if 'error' in rg_props:
+        if not location:
             log.error(
                 'Unable to determine location from resource group specified.'
             )
             return False
-        kwargs['location'] = rg_props['location']
+        kwargs['location'] = location
 
     compconn = await hub.exec.utils.azurerm.get_client('compute', **kwargs)
 
@@ -174,12 +173,12 @@ async def create_or_update(hub, name, resource_group, source_vm=None, source_vm_
         return result
 
     try:
-        image = compconn.images.create_or_update(
+        image = await hub.exec.utils.azurerm.run_lro(
+            compconn.images.create_or_update,
             resource_group_name=resource_group,
             image_name=name,
             parameters=imagemodel
         )
-        image.wait()
         image_result = image.result()
         result = image_result.as_dict()
 
@@ -189,6 +188,8 @@ async def create_or_update(hub, name, resource_group, source_vm=None, source_vm_
     except SerializationError as exc:
         result = {'error': 'The object model could not be parsed. ({0})'.format(str(exc))}
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
 
 
@@ -209,10 +210,12 @@ async def delete(hub, name, resource_group, **kwargs):
         azurerm.compute.image.delete testimage testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(resource_group, 'Microsoft.Compute', 'images', name, **kwargs)
     result = False
     compconn = await hub.exec.utils.azurerm.get_client('compute', **kwargs)
     try:
-        compconn.images.delete(
+        await hub.exec.utils.azurerm.run(
+            compconn.images.delete,
             resource_group_name=resource_group,
             image_name=name
         )
@@ -221,6 +224,8 @@ async def delete(hub, name, resource_group, **kwargs):
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('compute', str(exc), **kwargs)
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
 
 
@@ -241,13 +246,17 @@ async def get(hub, name, resource_group, **kwargs):
         azurerm.compute.image.get testimage testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(resource_group, 'Microsoft.Compute', 'images', name, **kwargs)
     compconn = await hub.exec.utils.azurerm.get_client('compute', **kwargs)
     try:
-        image = compconn.images.get(
+        result = await hub.exec.utils.azurerm.cached_get(
+            arm_id,
+            compconn.images.get,
             resource_group_name=resource_group,
-            image_name=name
+            image_name=name,
+            ctx=kwargs.get('ctx'),
+            batch_model='Image'
         )
-        result = image.as_dict()
 
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('compute', str(exc), **kwargs)
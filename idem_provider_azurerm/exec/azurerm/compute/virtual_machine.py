@@ -95,17 +95,18 @@ async def create_or_update(hub, name, resource_group, vm_size, admin_username='i
         azurerm.compute.virtual_machine.create_or_update testvm testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Compute', 'virtualMachines', name, **kwargs
+    )
     if 'location' not in kwargs:
-        rg_props = await hub.exec.azurerm.resource.group.get(
-            resource_group, **kwargs
-        )
+        location = await hub.exec.azurerm.resource.group.get_location(resource_group, **kwargs)
 
-        if 'error' in rg_props:
+        if not location:
             log.error(
                 'Unable to determine location from resource group specified.'
             )
             return False
-        kwargs['location'] = rg_props['location']
+        kwargs['location'] = location
 
     if not network_interfaces:
         network_interfaces = []
@@ -303,13 +304,13 @@ async def create_or_update(hub, name, resource_group, vm_size, admin_username='i
         return result
 
     try:
-        vm = compconn.virtual_machines.create_or_update(
+        vm = await hub.exec.utils.azurerm.run_lro(
+            compconn.virtual_machines.create_or_update,
             resource_group_name=resource_group,
             vm_name=name,
             parameters=vmmodel
         )
 
-        vm.wait()
         vm_result = vm.result()
         result = vm_result.as_dict()
 
@@ -337,6 +338,8 @@ async def create_or_update(hub, name, resource_group, vm_size, admin_username='i
     except SerializationError as exc:
         result = {'error': 'The object model could not be parsed. ({0})'.format(str(exc))}
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
 
 
@@ -358,6 +361,9 @@ async def delete(hub, name, resource_group, cleanup_disks=False, cleanup_data_di
         azurerm.compute.virtual_machine.delete testvm testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Compute', 'virtualMachines', name, **kwargs
+    )
     result = False
     compconn = await hub.exec.utils.azurerm.get_client('compute', **kwargs)
 
@@ -368,13 +374,12 @@ async def delete(hub, name, resource_group, cleanup_disks=False, cleanup_data_di
     )
 
     try:
-        poller = compconn.virtual_machines.delete(
+        poller = await hub.exec.utils.azurerm.run_lro(
+            compconn.virtual_machines.delete,
             resource_group_name=resource_group,
             vm_name=name
         )
 
-        poller.wait()
-
         if cleanup_disks:
             os_disk = parse_resource_id(
                 vm['storage_profile']['os_disk'].get('managed_disk', {}).get('id')
@@ -433,6 +438,8 @@ async def delete(hub, name, resource_group, cleanup_disks=False, cleanup_data_di
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('compute', str(exc), **kwargs)
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
 
 
@@ -461,6 +468,9 @@ async def capture(hub, name, destination_name, resource_group, prefix='capture-'
         azurerm.compute.virtual_machine.capture testvm testcontainer testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Compute', 'virtualMachines', name, **kwargs
+    )
     # pylint: disable=invalid-name
     VirtualMachineCaptureParameters = getattr(
         azure.mgmt.compute.models, 'VirtualMachineCaptureParameters'
@@ -469,7 +479,8 @@ async def capture(hub, name, destination_name, resource_group, prefix='capture-'
     compconn = await hub.exec.utils.azurerm.get_client('compute', **kwargs)
     try:
         # pylint: disable=invalid-name
-        vm = compconn.virtual_machines.capture(
+        vm = await hub.exec.utils.azurerm.run_lro(
+            compconn.virtual_machines.capture,
             resource_group_name=resource_group,
             vm_name=name,
             parameters=VirtualMachineCaptureParameters(
@@ -478,13 +489,14 @@ async def capture(hub, name, destination_name, resource_group, prefix='capture-'
                 overwrite_vhds=overwrite
             )
         )
-        vm.wait()
         vm_result = vm.result()
         result = vm_result.as_dict()
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('compute', str(exc), **kwargs)
         result = {'error': str(exc)}
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
 
 
@@ -507,17 +519,24 @@ async def get(hub, name, resource_group, **kwargs):
         azurerm.compute.virtual_machine.get testvm testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Compute', 'virtualMachines', name, **kwargs
+    )
     expand = kwargs.get('expand')
+    if expand:
+        arm_id = '{0}?$expand={1}'.format(arm_id, expand)
 
     compconn = await hub.exec.utils.azurerm.get_client('compute', **kwargs)
     try:
-        # pylint: disable=invalid-name
-        vm = compconn.virtual_machines.get(
+        result = await hub.exec.utils.azurerm.cached_get(
+            arm_id,
+            compconn.virtual_machines.get,
             resource_group_name=resource_group,
             vm_name=name,
-            expand=expand
+            expand=expand,
+            ctx=kwargs.get('ctx'),
+            batch_model=None if expand else 'VirtualMachine'
         )
-        result = vm.as_dict()
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('compute', str(exc), **kwargs)
         result = {'error': str(exc)}
@@ -544,20 +563,25 @@ async def convert_to_managed_disks(hub, name, resource_group, **kwargs):  # pyli
         azurerm.compute.virtual_machine.convert_to_managed_disks testvm testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Compute', 'virtualMachines', name, **kwargs
+    )
     compconn = await hub.exec.utils.azurerm.get_client('compute', **kwargs)
     try:
         # pylint: disable=invalid-name
-        vm = compconn.virtual_machines.convert_to_managed_disks(
+        vm = await hub.exec.utils.azurerm.run_lro(
+            compconn.virtual_machines.convert_to_managed_disks,
             resource_group_name=resource_group,
             vm_name=name
         )
-        vm.wait()
         vm_result = vm.result()
         result = vm_result.as_dict()
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('compute', str(exc), **kwargs)
         result = {'error': str(exc)}
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
 
 
@@ -579,20 +603,25 @@ async def deallocate(hub, name, resource_group, **kwargs):
         azurerm.compute.virtual_machine.deallocate testvm testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Compute', 'virtualMachines', name, **kwargs
+    )
     compconn = await hub.exec.utils.azurerm.get_client('compute', **kwargs)
     result = False
     try:
         # pylint: disable=invalid-name
-        vm = compconn.virtual_machines.deallocate(
+        vm = await hub.exec.utils.azurerm.run_lro(
+            compconn.virtual_machines.deallocate,
             resource_group_name=resource_group,
             vm_name=name
         )
-        vm.wait()
         result = True
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('compute', str(exc), **kwargs)
         result = {'error': str(exc)}
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
 
 
@@ -614,10 +643,14 @@ async def generalize(hub, name, resource_group, **kwargs):
         azurerm.compute.virtual_machine.generalize testvm testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Compute', 'virtualMachines', name, **kwargs
+    )
     result = False
     compconn = await hub.exec.utils.azurerm.get_client('compute', **kwargs)
     try:
-        compconn.virtual_machines.generalize(
+        await hub.exec.utils.azurerm.run(
+            compconn.virtual_machines.generalize,
             resource_group_name=resource_group,
             vm_name=name
         )
@@ -625,10 +658,12 @@ async def generalize(hub, name, resource_group, **kwargs):
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('compute', str(exc), **kwargs)
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
 
 
-async def list_(hub, resource_group, **kwargs):
+async def list_(hub, resource_group, stream=False, limit=None, **kwargs):
     '''
     .. versionadded:: 1.0.0
 
@@ -637,6 +672,11 @@ async def list_(hub, resource_group, **kwargs):
     :param resource_group: The resource group name to list virtual
         machines within.
 
+    :param stream: If True, return an asynchronous generator which yields each item as its page is retrieved,
+        instead of a dictionary keyed by name. Errors are raised to the consumer while iterating.
+
+    :param limit: The maximum number of items to yield when streaming.
+
     CLI Example:
 
     .. code-block:: bash
@@ -646,6 +686,14 @@ async def list_(hub, resource_group, **kwargs):
     '''
     result = {}
     compconn = await hub.exec.utils.azurerm.get_client('compute', **kwargs)
+    if stream:
+        return hub.exec.utils.azurerm.paged_object_to_iter(
+            compconn.virtual_machines.list(
+                resource_group_name=resource_group
+            ),
+            limit=limit
+        )
+
     try:
         vms = await hub.exec.utils.azurerm.paged_object_to_list(
             compconn.virtual_machines.list(
@@ -661,12 +709,23 @@ async def list_(hub, resource_group, **kwargs):
     return result
 
 
-async def list_all(hub, **kwargs):
+async def list_all(hub, stream=False, limit=None, backend=None, subscriptions=None, **kwargs):
     '''
     .. versionadded:: 1.0.0
 
     List all virtual machines within a subscription.
 
+    :param stream: If True, return an asynchronous generator which yields each item as its page is retrieved,
+        instead of a dictionary keyed by name. Errors are raised to the consumer while iterating.
+
+    :param limit: The maximum number of items to yield when streaming.
+
+    :param backend: The backend used to list the resources when not streaming, either ``arm`` or
+        ``resource_graph``. Defaults to the ``azurerm_list_backend`` option.
+
+    :param subscriptions: A list of subscription IDs to list the resources across when using the
+        ``resource_graph`` backend. Defaults to the subscription of the provider credentials.
+
     CLI Example:
 
     .. code-block:: bash
@@ -676,10 +735,20 @@ async def list_all(hub, **kwargs):
     '''
     result = {}
     compconn = await hub.exec.utils.azurerm.get_client('compute', **kwargs)
+    if stream:
+        return hub.exec.utils.azurerm.paged_object_to_iter(compconn.virtual_machines.list_all(), limit=limit)
+
     try:
-        vms = await hub.exec.utils.azurerm.paged_object_to_list(
-            compconn.virtual_machines.list_all()
-        )
+        if await hub.exec.utils.azurerm.resource_graph_enabled(backend):
+            vms = await hub.exec.utils.azurerm.resource_graph_list(
+                'Microsoft.Compute/virtualMachines',
+                compconn.virtual_machines,
+                'VirtualMachine',
+                subscriptions=subscriptions,
+                **kwargs
+            )
+        else:
+            vms = await hub.exec.utils.azurerm.paged_object_to_list(compconn.virtual_machines.list_all())
         for vm in vms:  # pylint: disable=invalid-name
             result[vm['name']] = vm
     except CloudError as exc:
@@ -744,20 +813,25 @@ async def power_off(hub, name, resource_group, **kwargs):
         azurerm.compute.virtual_machine.power_off testvm testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Compute', 'virtualMachines', name, **kwargs
+    )
     compconn = await hub.exec.utils.azurerm.get_client('compute', **kwargs)
     try:
         # pylint: disable=invalid-name
-        vm = compconn.virtual_machines.power_off(
+        vm = await hub.exec.utils.azurerm.run_lro(
+            compconn.virtual_machines.power_off,
             resource_group_name=resource_group,
             vm_name=name
         )
-        vm.wait()
         vm_result = vm.result()
         result = vm_result.as_dict()
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('compute', str(exc), **kwargs)
         result = {'error': str(exc)}
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
 
 
@@ -779,20 +853,25 @@ async def restart(hub, name, resource_group, **kwargs):
         azurerm.compute.virtual_machine.restart testvm testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Compute', 'virtualMachines', name, **kwargs
+    )
     compconn = await hub.exec.utils.azurerm.get_client('compute', **kwargs)
     try:
         # pylint: disable=invalid-name
-        vm = compconn.virtual_machines.restart(
+        vm = await hub.exec.utils.azurerm.run_lro(
+            compconn.virtual_machines.restart,
             resource_group_name=resource_group,
             vm_name=name
         )
-        vm.wait()
         vm_result = vm.result()
         result = vm_result.as_dict()
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('compute', str(exc), **kwargs)
         result = {'error': str(exc)}
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
 
 
@@ -814,20 +893,25 @@ async def start(hub, name, resource_group, **kwargs):
         azurerm.compute.virtual_machine.start testvm testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Compute', 'virtualMachines', name, **kwargs
+    )
     compconn = await hub.exec.utils.azurerm.get_client('compute', **kwargs)
     try:
         # pylint: disable=invalid-name
-        vm = compconn.virtual_machines.start(
+        vm = await hub.exec.utils.azurerm.run_lro(
+            compconn.virtual_machines.start,
             resource_group_name=resource_group,
             vm_name=name
         )
-        vm.wait()
         vm_result = vm.result()
         result = vm_result.as_dict()
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('compute', str(exc), **kwargs)
         result = {'error': str(exc)}
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
 
 
@@ -849,18 +933,23 @@ async def redeploy(hub, name, resource_group, **kwargs):
         azurerm.compute.virtual_machine.redeploy testvm testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Compute', 'virtualMachines', name, **kwargs
+    )
     compconn = await hub.exec.utils.azurerm.get_client('compute', **kwargs)
     try:
         # pylint: disable=invalid-name
-        vm = compconn.virtual_machines.redeploy(
+        vm = await hub.exec.utils.azurerm.run_lro(
+            compconn.virtual_machines.redeploy,
             resource_group_name=resource_group,
             vm_name=name
         )
-        vm.wait()
         vm_result = vm.result()
         result = vm_result.as_dict()
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('compute', str(exc), **kwargs)
         result = {'error': str(exc)}
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
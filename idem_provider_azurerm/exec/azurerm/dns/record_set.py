@@ -87,6 +87,9 @@ async def create_or_update(hub, name, zone_name, resource_group, record_type, **
             arecords='[{ipv4_address: 10.0.0.1}]' ttl=300
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'dnsZones', zone_name, record_type, name, **kwargs
+    )
     dnsconn = await hub.exec.utils.azurerm.get_client('dns', **kwargs)
 
     try:
@@ -96,7 +99,8 @@ async def create_or_update(hub, name, zone_name, resource_group, record_type, **
         return result
 
     try:
-        record_set = dnsconn.record_sets.create_or_update(
+        record_set = await hub.exec.utils.azurerm.run(
+            dnsconn.record_sets.create_or_update,
             relative_record_set_name=name,
             zone_name=zone_name,
             resource_group_name=resource_group,
@@ -112,6 +116,8 @@ async def create_or_update(hub, name, zone_name, resource_group, record_type, **
     except SerializationError as exc:
         result = {'error': 'The object model could not be parsed. ({0})'.format(str(exc))}
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
 
 
@@ -138,10 +144,14 @@ async def delete(hub, name, zone_name, resource_group, record_type, **kwargs):
         azurerm.dns.record_set.delete myhost myzone testgroup A
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'dnsZones', zone_name, record_type, name, **kwargs
+    )
     result = False
     dnsconn = await hub.exec.utils.azurerm.get_client('dns', **kwargs)
     try:
-        record_set = dnsconn.record_sets.delete(
+        record_set = await hub.exec.utils.azurerm.run(
+            dnsconn.record_sets.delete,
             relative_record_set_name=name,
             zone_name=zone_name,
             resource_group_name=resource_group,
@@ -152,6 +162,8 @@ async def delete(hub, name, zone_name, resource_group, record_type, **kwargs):
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('dns', str(exc), **kwargs)
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
 
 
@@ -177,15 +189,21 @@ async def get(hub, name, zone_name, resource_group, record_type, **kwargs):
         azurerm.dns.record_set.get '@' myzone testgroup SOA
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'dnsZones', zone_name, record_type, name, **kwargs
+    )
     dnsconn = await hub.exec.utils.azurerm.get_client('dns', **kwargs)
     try:
-        record_set = dnsconn.record_sets.get(
+        result = await hub.exec.utils.azurerm.cached_get(
+            arm_id,
+            dnsconn.record_sets.get,
             relative_record_set_name=name,
             zone_name=zone_name,
             resource_group_name=resource_group,
-            record_type=record_type
+            record_type=record_type,
+            ctx=kwargs.get('ctx'),
+            batch_model='RecordSet'
         )
-        result = record_set.as_dict()
 
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('dns', str(exc), **kwargs)
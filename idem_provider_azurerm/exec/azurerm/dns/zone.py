@@ -80,6 +80,7 @@ async def create_or_update(hub, name, resource_group, **kwargs):
         azurerm.dns.zone.create_or_update myzone testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(resource_group, 'Microsoft.Network', 'dnsZones', name, **kwargs)
     # DNS zones are global objects
     kwargs['location'] = 'global'
 
@@ -99,7 +100,8 @@ async def create_or_update(hub, name, resource_group, **kwargs):
         return result
 
     try:
-        zone = dnsconn.zones.create_or_update(
+        zone = await hub.exec.utils.azurerm.run(
+            dnsconn.zones.create_or_update,
             zone_name=name,
             resource_group_name=resource_group,
             parameters=zone_model,
@@ -113,6 +115,8 @@ async def create_or_update(hub, name, resource_group, **kwargs):
     except SerializationError as exc:
         result = {'error': 'The object model could not be parsed. ({0})'.format(str(exc))}
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
 
 
@@ -133,19 +137,22 @@ async def delete(hub, name, resource_group, **kwargs):
         azurerm.dns.zone.delete myzone testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(resource_group, 'Microsoft.Network', 'dnsZones', name, **kwargs)
     result = False
     dnsconn = await hub.exec.utils.azurerm.get_client('dns', **kwargs)
     try:
-        zone = dnsconn.zones.delete(
+        zone = await hub.exec.utils.azurerm.run_lro(
+            dnsconn.zones.delete,
             zone_name=name,
             resource_group_name=resource_group,
             if_match=kwargs.get('if_match')
         )
-        zone.wait()
         result = True
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('dns', str(exc), **kwargs)
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
 
 
@@ -167,13 +174,17 @@ async def get(hub, name, resource_group, **kwargs):
         azurerm.dns.zone.get myzone testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(resource_group, 'Microsoft.Network', 'dnsZones', name, **kwargs)
     dnsconn = await hub.exec.utils.azurerm.get_client('dns', **kwargs)
     try:
-        zone = dnsconn.zones.get(
+        result = await hub.exec.utils.azurerm.cached_get(
+            arm_id,
+            dnsconn.zones.get,
             zone_name=name,
-            resource_group_name=resource_group
+            resource_group_name=resource_group,
+            ctx=kwargs.get('ctx'),
+            batch_model='Zone'
         )
-        result = zone.as_dict()
 
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('dns', str(exc), **kwargs)
@@ -219,7 +230,7 @@ async def list_by_resource_group(hub, resource_group, top=None, **kwargs):
     return result
 
 
-async def list_(hub, top=None, **kwargs):
+async def list_(hub, top=None, stream=False, limit=None, **kwargs):
     '''
     .. versionadded:: 1.0.0
 
@@ -228,6 +239,11 @@ async def list_(hub, top=None, **kwargs):
     :param top: The maximum number of DNS zones to return. If not specified,
     returns up to 100 zones.
 
+    :param stream: If True, return an asynchronous generator which yields each item as its page is retrieved,
+        instead of a dictionary keyed by name. Errors are raised to the consumer while iterating.
+
+    :param limit: The maximum number of items to yield when streaming.
+
     CLI Example:
 
     .. code-block:: bash
@@ -237,6 +253,9 @@ async def list_(hub, top=None, **kwargs):
     '''
     result = {}
     dnsconn = await hub.exec.utils.azurerm.get_client('dns', **kwargs)
+    if stream:
+        return hub.exec.utils.azurerm.paged_object_to_iter(dnsconn.zones.list(top=top), limit=limit)
+
     try:
         zones = await hub.exec.utils.azurerm.paged_object_to_list(dnsconn.zones.list(top=top))
 
@@ -127,7 +127,8 @@ async def create_or_update(hub, name, resource_uri, metrics, logs, workspace_id=
         return result
 
     try:
-        diag = moniconn.diagnostic_settings.create_or_update(
+        diag = await hub.exec.utils.azurerm.run(
+            moniconn.diagnostic_settings.create_or_update,
             name=name,
             resource_uri=resource_uri,
             parameters=diagmodel
@@ -161,7 +162,8 @@ async def delete(hub, name, resource_uri, **kwargs):
     result = False
     moniconn = await hub.exec.utils.azurerm.get_client('monitor', **kwargs)
     try:
-        diag = moniconn.diagnostic_settings.delete(
+        diag = await hub.exec.utils.azurerm.run(
+            moniconn.diagnostic_settings.delete,
             name=name,
             resource_uri=resource_uri,
             **kwargs
@@ -195,7 +197,8 @@ async def get(hub, name, resource_uri, **kwargs):
     result = {}
     moniconn = await hub.exec.utils.azurerm.get_client('monitor', **kwargs)
     try:
-        diag = moniconn.diagnostic_settings.get(
+        diag = await hub.exec.utils.azurerm.run(
+            moniconn.diagnostic_settings.get,
             name=name,
             resource_uri=resource_uri,
             **kwargs
@@ -227,7 +230,8 @@ async def list_(hub, resource_uri, **kwargs):
     result = {}
     moniconn = await hub.exec.utils.azurerm.get_client('monitor', **kwargs)
     try:
-        diag = moniconn.diagnostic_settings.list(
+        diag = await hub.exec.utils.azurerm.run(
+            moniconn.diagnostic_settings.list,
             resource_uri=resource_uri,
             **kwargs
         )
@@ -87,7 +87,8 @@ async def check_dns_name_availability(hub, name, region, **kwargs):
     '''
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        check_dns_name = netconn.check_dns_name_availability(
+        check_dns_name = await hub.exec.utils.azurerm.run(
+            netconn.check_dns_name_availability,
             location=region,
             domain_name_label=name
         )
@@ -123,7 +124,8 @@ async def check_ip_address_availability(hub, ip_address, virtual_network, resour
     '''
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        check_ip = netconn.virtual_networks.check_ip_address_availability(
+        check_ip = await hub.exec.utils.azurerm.run(
+            netconn.virtual_networks.check_ip_address_availability,
             resource_group_name=resource_group,
             virtual_network_name=virtual_network,
             ip_address=ip_address)
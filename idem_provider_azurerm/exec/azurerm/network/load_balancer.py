@@ -69,12 +69,23 @@ except ImportError:
 log = logging.getLogger(__name__)
 
 
-async def list_all(hub, **kwargs):
+async def list_all(hub, stream=False, limit=None, backend=None, subscriptions=None, **kwargs):
     '''
     .. versionadded:: 1.0.0
 
     List all load balancers within a subscription.
 
+    :param stream: If True, return an asynchronous generator which yields each item as its page is retrieved,
+        instead of a dictionary keyed by name. Errors are raised to the consumer while iterating.
+
+    :param limit: The maximum number of items to yield when streaming.
+
+    :param backend: The backend used to list the resources when not streaming, either ``arm`` or
+        ``resource_graph``. Defaults to the ``azurerm_list_backend`` option.
+
+    :param subscriptions: A list of subscription IDs to list the resources across when using the
+        ``resource_graph`` backend. Defaults to the subscription of the provider credentials.
+
     CLI Example:
 
     .. code-block:: bash
@@ -84,8 +95,20 @@ async def list_all(hub, **kwargs):
     '''
     result = {}
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
+    if stream:
+        return hub.exec.utils.azurerm.paged_object_to_iter(netconn.load_balancers.list_all(), limit=limit)
+
     try:
-        load_balancers = await hub.exec.utils.azurerm.paged_object_to_list(netconn.load_balancers.list_all())
+        if await hub.exec.utils.azurerm.resource_graph_enabled(backend):
+            load_balancers = await hub.exec.utils.azurerm.resource_graph_list(
+                'Microsoft.Network/loadBalancers',
+                netconn.load_balancers,
+                'LoadBalancer',
+                subscriptions=subscriptions,
+                **kwargs
+            )
+        else:
+            load_balancers = await hub.exec.utils.azurerm.paged_object_to_list(netconn.load_balancers.list_all())
 
         for load_balancer in load_balancers:
             result[load_balancer['name']] = load_balancer
@@ -96,7 +119,7 @@ async def list_all(hub, **kwargs):
     return result
 
 
-async def list_(hub, resource_group, **kwargs):
+async def list_(hub, resource_group, stream=False, limit=None, **kwargs):
     '''
     .. versionadded:: 1.0.0
 
@@ -105,6 +128,11 @@ async def list_(hub, resource_group, **kwargs):
     :param resource_group: The resource group name to list load balancers
         within.
 
+    :param stream: If True, return an asynchronous generator which yields each item as its page is retrieved,
+        instead of a dictionary keyed by name. Errors are raised to the consumer while iterating.
+
+    :param limit: The maximum number of items to yield when streaming.
+
     CLI Example:
 
     .. code-block:: bash
@@ -114,6 +142,14 @@ async def list_(hub, resource_group, **kwargs):
     '''
     result = {}
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
+    if stream:
+        return hub.exec.utils.azurerm.paged_object_to_iter(
+            netconn.load_balancers.list(
+                resource_group_name=resource_group
+            ),
+            limit=limit
+        )
+
     try:
         load_balancers = await hub.exec.utils.azurerm.paged_object_to_list(
             netconn.load_balancers.list(
@@ -148,13 +184,19 @@ async def get(hub, name, resource_group, **kwargs):
         azurerm.network.load_balancer.get testlb testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'loadBalancers', name, **kwargs
+    )
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        load_balancer = netconn.load_balancers.get(
+        result = await hub.exec.utils.azurerm.cached_get(
+            arm_id,
+            netconn.load_balancers.get,
             load_balancer_name=name,
-            resource_group_name=resource_group
+            resource_group_name=resource_group,
+            ctx=kwargs.get('ctx'),
+            batch_model='LoadBalancer'
         )
-        result = load_balancer.as_dict()
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('network', str(exc), **kwargs)
         result = {'error': str(exc)}
@@ -180,17 +222,18 @@ async def create_or_update(hub, name, resource_group, **kwargs):
         azurerm.network.load_balancer.create_or_update testlb testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'loadBalancers', name, **kwargs
+    )
     if 'location' not in kwargs:
-        rg_props = await hub.exec.azurerm.resource.group.get(
-            resource_group, **kwargs
-        )
+        location = await hub.exec.azurerm.resource.group.get_location(resource_group, **kwargs)
 
-        if 'error' in rg_props:
+        if not location:
             log.error(
                 'Unable to determine location from resource group specified.'
             )
             return False
-        kwargs['location'] = rg_props['location']
+        kwargs['location'] = location
 
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
 
@@ -198,31 +241,24 @@ async def create_or_update(hub, name, resource_group, **kwargs):
         for idx in six_range(0, len(kwargs['frontend_ip_configurations'])):
             # Use Public IP Address name to link to the ID of an existing Public IP
             if 'public_ip_address' in kwargs['frontend_ip_configurations'][idx]:
-                pub_ip = public_ip_address_get(
+                pub_ip = await hub.exec.azurerm.network.resolver.resolve(
+                    'public_ip_addresses',
                     name=kwargs['frontend_ip_configurations'][idx]['public_ip_address'],
                     resource_group=resource_group,
                     **kwargs
                 )
-                if 'error' not in pub_ip:
-                    kwargs['frontend_ip_configurations'][idx]['public_ip_address'] = {'id': str(pub_ip['id'])}
+                if pub_ip:
+                    kwargs['frontend_ip_configurations'][idx]['public_ip_address'] = {'id': str(pub_ip)}
             # Use Subnet name to link to the ID of an existing Subnet
             elif 'subnet' in kwargs['frontend_ip_configurations'][idx]:
-                vnets = virtual_networks_list(
+                subnet = await hub.exec.azurerm.network.resolver.resolve(
+                    'subnets',
+                    name=kwargs['frontend_ip_configurations'][idx]['subnet'],
                     resource_group=resource_group,
                     **kwargs
                 )
-                if 'error' not in vnets:
-                    for vnet in vnets:
-                        subnets = subnets_list(
-                            virtual_network=vnet,
-                            resource_group=resource_group,
-                            **kwargs
-                        )
-                        if kwargs['frontend_ip_configurations'][idx]['subnet'] in subnets:
-                            kwargs['frontend_ip_configurations'][idx]['subnet'] = {
-                                'id': str(subnets[kwargs['frontend_ip_configurations'][idx]['subnet']]['id'])
-                            }
-                            break
+                if subnet:
+                    kwargs['frontend_ip_configurations'][idx]['subnet'] = {'id': str(subnet)}
 
     id_url = '/subscriptions/{0}/resourceGroups/{1}/providers/Microsoft.Network/loadBalancers/{2}/{3}/{4}'
 
@@ -319,12 +355,12 @@ async def create_or_update(hub, name, resource_group, **kwargs):
         return result
 
     try:
-        load_balancer = netconn.load_balancers.create_or_update(
+        load_balancer = await hub.exec.utils.azurerm.run_lro(
+            netconn.load_balancers.create_or_update,
             resource_group_name=resource_group,
             load_balancer_name=name,
             parameters=lbmodel
         )
-        load_balancer.wait()
         lb_result = load_balancer.result()
         result = lb_result.as_dict()
     except CloudError as exc:
@@ -333,6 +369,8 @@ async def create_or_update(hub, name, resource_group, **kwargs):
     except SerializationError as exc:
         result = {'error': 'The object model could not be parsed. ({0})'.format(str(exc))}
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
 
 
@@ -354,16 +392,21 @@ async def delete(hub, name, resource_group, **kwargs):
         azurerm.network.load_balancer.delete testlb testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'loadBalancers', name, **kwargs
+    )
     result = False
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        load_balancer = netconn.load_balancers.delete(
+        load_balancer = await hub.exec.utils.azurerm.run_lro(
+            netconn.load_balancers.delete,
             load_balancer_name=name,
             resource_group_name=resource_group
         )
-        load_balancer.wait()
         result = True
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('network', str(exc), **kwargs)
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
@@ -88,17 +88,18 @@ async def create_or_update(hub, name, resource_group, gateway_ip_address, **kwar
         azurerm.network.local_network_gateway.create_or_update test_name test_group test_ip
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'localNetworkGateways', name, **kwargs
+    )
     if 'location' not in kwargs:
-        rg_props = await hub.exec.azurerm.resource.group.get(
-            resource_group, **kwargs
-        )
+        location = await hub.exec.azurerm.resource.group.get_location(resource_group, **kwargs)
 
-        if 'error' in rg_props:
+        if not location:
             log.error(
                 'Unable to determine location from resource group specified.'
             )
             return False
-        kwargs['location'] = rg_props['location']
+        kwargs['location'] = location
 
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
 
@@ -114,12 +115,12 @@ async def create_or_update(hub, name, resource_group, gateway_ip_address, **kwar
         return result
 
     try:
-        gateway = netconn.local_network_gateways.create_or_update(
+        gateway = await hub.exec.utils.azurerm.run_lro(
+            netconn.local_network_gateways.create_or_update,
             local_network_gateway_name=name,
             resource_group_name=resource_group,
             parameters=gatewaymodel
         )
-        gateway.wait()
         gateway_result = gateway.result()
         result = gateway_result.as_dict()
     except CloudError as exc:
@@ -128,6 +129,8 @@ async def create_or_update(hub, name, resource_group, gateway_ip_address, **kwar
     except SerializationError as exc:
         result = {'error': 'The object model could not be parsed. ({0})'.format(str(exc))}
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
 
 
@@ -148,14 +151,19 @@ async def get(hub, name, resource_group, **kwargs):
         azurerm.network.local_network_gateway.get test_name test_group
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'localNetworkGateways', name, **kwargs
+    )
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        gateway = netconn.local_network_gateways.get(
+        result = await hub.exec.utils.azurerm.cached_get(
+            arm_id,
+            netconn.local_network_gateways.get,
             resource_group_name=resource_group,
-            local_network_gateway_name=name
+            local_network_gateway_name=name,
+            ctx=kwargs.get('ctx'),
+            batch_model='LocalNetworkGateway'
         )
-
-        result = gateway.as_dict()
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('network', str(exc), **kwargs)
         result = {'error': str(exc)}
@@ -180,18 +188,23 @@ async def delete(hub, name, resource_group, **kwargs):
         azurerm.network.local_network_gateway.delete test_name test_group
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'localNetworkGateways', name, **kwargs
+    )
     result = False
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        gateway = netconn.local_network_gateways.delete(
+        gateway = await hub.exec.utils.azurerm.run_lro(
+            netconn.local_network_gateways.delete,
             resource_group_name=resource_group,
             local_network_gateway_name=name
         )
-        gateway.wait()
         result = True
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('network', str(exc), **kwargs)
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
 
 
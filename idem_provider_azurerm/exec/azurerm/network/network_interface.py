@@ -87,19 +87,24 @@ async def delete(hub, name, resource_group, **kwargs):
         azurerm.network.network_interface.delete test-iface0 testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'networkInterfaces', name, **kwargs
+    )
     result = False
 
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        nic = netconn.network_interfaces.delete(
+        nic = await hub.exec.utils.azurerm.run_lro(
+            netconn.network_interfaces.delete,
             network_interface_name=name,
             resource_group_name=resource_group
         )
-        nic.wait()
         result = True
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('network', str(exc), **kwargs)
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
 
 
@@ -121,13 +126,19 @@ async def get(hub, name, resource_group, **kwargs):
         azurerm.network.network_interface.get test-iface0 testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'networkInterfaces', name, **kwargs
+    )
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        nic = netconn.network_interfaces.get(
+        result = await hub.exec.utils.azurerm.cached_get(
+            arm_id,
+            netconn.network_interfaces.get,
             network_interface_name=name,
-            resource_group_name=resource_group
+            resource_group_name=resource_group,
+            ctx=kwargs.get('ctx'),
+            batch_model='NetworkInterface'
         )
-        result = nic.as_dict()
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('network', str(exc), **kwargs)
         result = {'error': str(exc)}
@@ -162,29 +173,31 @@ async def create_or_update(hub, name, ip_configurations, subnet, virtual_network
                   testsubnet testnet testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'networkInterfaces', name, **kwargs
+    )
     if 'location' not in kwargs:
-        rg_props = await hub.exec.azurerm.resource.group.get(
-            resource_group, **kwargs
-        )
+        location = await hub.exec.azurerm.resource.group.get_location(resource_group, **kwargs)
 
-        if 'error' in rg_props:
+        if not location:
             log.error(
                 'Unable to determine location from resource group specified.'
             )
             return False
-        kwargs['location'] = rg_props['location']
+        kwargs['location'] = location
 
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
 
     # Use NSG name to link to the ID of an existing NSG.
     if kwargs.get('network_security_group'):
-        nsg = await hub.exec.azurerm.network.network_security_group.get(
+        nsg = await hub.exec.azurerm.network.resolver.resolve(
+            'network_security_groups',
             name=kwargs['network_security_group'],
             resource_group=resource_group,
             **kwargs
         )
-        if 'error' not in nsg:
-            kwargs['network_security_group'] = {'id': str(nsg['id'])}
+        if nsg:
+            kwargs['network_security_group'] = {'id': str(nsg)}
 
     # Use VM name to link to the ID of an existing VM.
     if kwargs.get('virtual_machine'):
@@ -198,14 +211,15 @@ async def create_or_update(hub, name, ip_configurations, subnet, virtual_network
 
     # Loop through IP Configurations and build each dictionary to pass to model creation.
     if isinstance(ip_configurations, list):
-        subnet = await hub.exec.azurerm.network.virtual_network.subnet_get(
+        subnet = await hub.exec.azurerm.network.resolver.resolve(
+            'subnets',
             name=subnet,
-            virtual_network=virtual_network,
             resource_group=resource_group,
+            virtual_network=virtual_network,
             **kwargs
         )
-        if 'error' not in subnet:
-            subnet = {'id': str(subnet['id'])}
+        if subnet:
+            subnet = {'id': str(subnet)}
             for ipconfig in ip_configurations:
                 if 'name' in ipconfig:
                     ipconfig['subnet'] = subnet
@@ -219,13 +233,14 @@ async def create_or_update(hub, name, ip_configurations, subnet, virtual_network
                         # TODO: Add ID lookup for referenced object names
                         pass
                     if ipconfig.get('public_ip_address'):
-                        pub_ip = await hub.exec.azurerm.network.public_ip_address.get(
+                        pub_ip = await hub.exec.azurerm.network.resolver.resolve(
+                            'public_ip_addresses',
                             name=ipconfig['public_ip_address'],
                             resource_group=resource_group,
                             **kwargs
                         )
-                        if 'error' not in pub_ip:
-                            ipconfig['public_ip_address'] = {'id': str(pub_ip['id'])}
+                        if pub_ip:
+                            ipconfig['public_ip_address'] = {'id': str(pub_ip)}
 
     try:
         nicmodel = await hub.exec.utils.azurerm.create_object_model(
@@ -239,12 +254,12 @@ async def create_or_update(hub, name, ip_configurations, subnet, virtual_network
         return result
 
     try:
-        interface = netconn.network_interfaces.create_or_update(
+        interface = await hub.exec.utils.azurerm.run_lro(
+            netconn.network_interfaces.create_or_update,
             resource_group_name=resource_group,
             network_interface_name=name,
             parameters=nicmodel
         )
-        interface.wait()
         nic_result = interface.result()
         result = nic_result.as_dict()
     except CloudError as exc:
@@ -253,15 +268,28 @@ async def create_or_update(hub, name, ip_configurations, subnet, virtual_network
     except SerializationError as exc:
         result = {'error': 'The object model could not be parsed. ({0})'.format(str(exc))}
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
 
 
-async def list_all(hub, **kwargs):
+async def list_all(hub, stream=False, limit=None, backend=None, subscriptions=None, **kwargs):
     '''
     .. versionadded:: 1.0.0
 
     List all network interfaces within a subscription.
 
+    :param stream: If True, return an asynchronous generator which yields each item as its page is retrieved,
+        instead of a dictionary keyed by name. Errors are raised to the consumer while iterating.
+
+    :param limit: The maximum number of items to yield when streaming.
+
+    :param backend: The backend used to list the resources when not streaming, either ``arm`` or
+        ``resource_graph``. Defaults to the ``azurerm_list_backend`` option.
+
+    :param subscriptions: A list of subscription IDs to list the resources across when using the
+        ``resource_graph`` backend. Defaults to the subscription of the provider credentials.
+
     CLI Example:
 
     .. code-block:: bash
@@ -271,8 +299,20 @@ async def list_all(hub, **kwargs):
     '''
     result = {}
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
+    if stream:
+        return hub.exec.utils.azurerm.paged_object_to_iter(netconn.network_interfaces.list_all(), limit=limit)
+
     try:
-        nics = await hub.exec.utils.azurerm.paged_object_to_list(netconn.network_interfaces.list_all())
+        if await hub.exec.utils.azurerm.resource_graph_enabled(backend):
+            nics = await hub.exec.utils.azurerm.resource_graph_list(
+                'Microsoft.Network/networkInterfaces',
+                netconn.network_interfaces,
+                'NetworkInterface',
+                subscriptions=subscriptions,
+                **kwargs
+            )
+        else:
+            nics = await hub.exec.utils.azurerm.paged_object_to_list(netconn.network_interfaces.list_all())
 
         for nic in nics:
             result[nic['name']] = nic
@@ -283,7 +323,7 @@ async def list_all(hub, **kwargs):
     return result
 
 
-async def list_(hub, resource_group, **kwargs):
+async def list_(hub, resource_group, stream=False, limit=None, **kwargs):
     '''
     .. versionadded:: 1.0.0
 
@@ -292,6 +332,11 @@ async def list_(hub, resource_group, **kwargs):
     :param resource_group: The resource group name to list network
         interfaces within.
 
+    :param stream: If True, return an asynchronous generator which yields each item as its page is retrieved,
+        instead of a dictionary keyed by name. Errors are raised to the consumer while iterating.
+
+    :param limit: The maximum number of items to yield when streaming.
+
     CLI Example:
 
     .. code-block:: bash
@@ -301,6 +346,14 @@ async def list_(hub, resource_group, **kwargs):
     '''
     result = {}
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
+    if stream:
+        return hub.exec.utils.azurerm.paged_object_to_iter(
+            netconn.network_interfaces.list(
+                resource_group_name=resource_group
+            ),
+            limit=limit
+        )
+
     try:
         nics = await hub.exec.utils.azurerm.paged_object_to_list(
             netconn.network_interfaces.list(
@@ -337,11 +390,11 @@ async def get_effective_route_table(hub, name, resource_group, **kwargs):
     '''
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        nic = netconn.network_interfaces.get_effective_route_table(
+        nic = await hub.exec.utils.azurerm.run_lro(
+            netconn.network_interfaces.get_effective_route_table,
             network_interface_name=name,
             resource_group_name=resource_group
         )
-        nic.wait()
         tables = nic.result()
         tables = tables.as_dict()
         result = tables['value']
@@ -372,11 +425,11 @@ async def list_effective_network_security_groups(hub, name, resource_group, **kw
     '''
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        nic = netconn.network_interfaces.list_effective_network_security_groups(
+        nic = await hub.exec.utils.azurerm.run_lro(
+            netconn.network_interfaces.list_effective_network_security_groups,
             network_interface_name=name,
             resource_group_name=resource_group
         )
-        nic.wait()
         groups = nic.result()
         groups = groups.as_dict()
         result = groups['value']
@@ -491,7 +544,8 @@ async def get_virtual_machine_scale_set_network_interface(hub, name, scale_set,
 
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        nic = netconn.network_interfaces.list_virtual_machine_scale_set_vm_network_interfaces(
+        nic = await hub.exec.utils.azurerm.run(
+            netconn.network_interfaces.list_virtual_machine_scale_set_vm_network_interfaces,
             network_interface_name=name,
             virtual_machine_scale_set_name=scale_set,
             virtualmachine_index=vm_index,
@@ -178,7 +178,8 @@ async def security_rules_list(hub, security_group, resource_group, **kwargs):
     '''
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        secrules = netconn.security_rules.list(
+        secrules = await hub.exec.utils.azurerm.run(
+            netconn.security_rules.list,
             network_security_group_name=security_group,
             resource_group_name=resource_group
         )
@@ -263,6 +264,9 @@ async def security_rule_create_or_update(hub, name, access, direction, priority,
                   source_port_range='*' destination_port_range='1-1024'
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'networkSecurityGroups', security_group, 'securityRules', name, **kwargs
+    )
     exclusive_params = [
         ('source_port_ranges', 'source_port_range'),
         ('source_address_prefixes', 'source_address_prefix'),
@@ -308,13 +312,13 @@ async def security_rule_create_or_update(hub, name, access, direction, priority,
         return result
 
     try:
-        secrule = netconn.security_rules.create_or_update(
+        secrule = await hub.exec.utils.azurerm.run_lro(
+            netconn.security_rules.create_or_update,
             resource_group_name=resource_group,
             network_security_group_name=security_group,
             security_rule_name=name,
             security_rule_parameters=rulemodel
         )
-        secrule.wait()
         secrule_result = secrule.result()
         result = secrule_result.as_dict()
     except CloudError as exc:
@@ -323,6 +327,8 @@ async def security_rule_create_or_update(hub, name, access, direction, priority,
     except SerializationError as exc:
         result = {'error': 'The object model could not be parsed. ({0})'.format(str(exc))}
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
 
 
@@ -347,19 +353,24 @@ async def security_rule_delete(hub, security_rule, security_group, resource_grou
         azurerm.network.network_security_group.security_rule_delete testrule1 testnsg testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'networkSecurityGroups', security_group, 'securityRules', security_rule, **kwargs
+    )
     result = False
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        secrule = netconn.security_rules.delete(
+        secrule = await hub.exec.utils.azurerm.run_lro(
+            netconn.security_rules.delete,
             network_security_group_name=security_group,
             resource_group_name=resource_group,
             security_rule_name=security_rule
         )
-        secrule.wait()
         result = True
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('network', str(exc), **kwargs)
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
 
 
@@ -384,14 +395,20 @@ async def security_rule_get(hub, security_rule, security_group, resource_group,
         azurerm.network.network_security_group.security_rule_get testrule1 testnsg testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'networkSecurityGroups', security_group, 'securityRules', security_rule, **kwargs
+    )
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        secrule = netconn.security_rules.get(
+        result = await hub.exec.utils.azurerm.cached_get(
+            arm_id,
+            netconn.security_rules.get,
             network_security_group_name=security_group,
             resource_group_name=resource_group,
-            security_rule_name=security_rule
+            security_rule_name=security_rule,
+            ctx=kwargs.get('ctx'),
+            batch_model='SecurityRule'
         )
-        result = secrule.as_dict()
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('network', str(exc), **kwargs)
         result = {'error': str(exc)}
@@ -417,17 +434,18 @@ async def create_or_update(hub, name, resource_group, **kwargs):
         azurerm.network.network_security_group.create_or_update testnsg testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'networkSecurityGroups', name, **kwargs
+    )
     if 'location' not in kwargs:
-        rg_props = await hub.exec.azurerm.resource.group.get(
-            resource_group, **kwargs
-        )
+        location = await hub.exec.azurerm.resource.group.get_location(resource_group, **kwargs)
 
-        if 'error' in rg_props:
+        if not location:
             log.error(
                 'Unable to determine location from resource group specified.'
             )
             return False
-        kwargs['location'] = rg_props['location']
+        kwargs['location'] = location
 
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
 
@@ -438,12 +456,12 @@ async def create_or_update(hub, name, resource_group, **kwargs):
         return result
 
     try:
-        secgroup = netconn.network_security_groups.create_or_update(
+        secgroup = await hub.exec.utils.azurerm.run_lro(
+            netconn.network_security_groups.create_or_update,
             resource_group_name=resource_group,
             network_security_group_name=name,
             parameters=secgroupmodel
         )
-        secgroup.wait()
         secgroup_result = secgroup.result()
         result = secgroup_result.as_dict()
     except CloudError as exc:
@@ -452,6 +470,9 @@ async def create_or_update(hub, name, resource_group, **kwargs):
     except SerializationError as exc:
         result = {'error': 'The object model could not be parsed. ({0})'.format(str(exc))}
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+    await hub.exec.azurerm.network.resolver.forget('network_security_groups', resource_group, **kwargs)
+
     return result
 
 
@@ -473,18 +494,24 @@ async def delete(hub, name, resource_group, **kwargs):
         azurerm.network.network_security_group.delete testnsg testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'networkSecurityGroups', name, **kwargs
+    )
     result = False
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        secgroup = netconn.network_security_groups.delete(
+        secgroup = await hub.exec.utils.azurerm.run_lro(
+            netconn.network_security_groups.delete,
             resource_group_name=resource_group,
             network_security_group_name=name
         )
-        secgroup.wait()
         result = True
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('network', str(exc), **kwargs)
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+    await hub.exec.azurerm.network.resolver.forget('network_security_groups', resource_group, **kwargs)
+
     return result
 
 
@@ -506,13 +533,19 @@ async def get(hub, name, resource_group, **kwargs):
         azurerm.network.network_security_group.get testnsg testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'networkSecurityGroups', name, **kwargs
+    )
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        secgroup = netconn.network_security_groups.get(
+        result = await hub.exec.utils.azurerm.cached_get(
+            arm_id,
+            netconn.network_security_groups.get,
             resource_group_name=resource_group,
-            network_security_group_name=name
+            network_security_group_name=name,
+            ctx=kwargs.get('ctx'),
+            batch_model='NetworkSecurityGroup'
         )
-        result = secgroup.as_dict()
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('network', str(exc), **kwargs)
         result = {'error': str(exc)}
@@ -520,7 +553,7 @@ async def get(hub, name, resource_group, **kwargs):
     return result
 
 
-async def list_(hub, resource_group, **kwargs):
+async def list_(hub, resource_group, stream=False, limit=None, **kwargs):
     '''
     .. versionadded:: 1.0.0
 
@@ -529,6 +562,11 @@ async def list_(hub, resource_group, **kwargs):
     :param resource_group: The resource group name to list network security \
         groups within.
 
+    :param stream: If True, return an asynchronous generator which yields each item as its page is retrieved,
+        instead of a dictionary keyed by name. Errors are raised to the consumer while iterating.
+
+    :param limit: The maximum number of items to yield when streaming.
+
     CLI Example:
 
     .. code-block:: bash
@@ -538,6 +576,14 @@ async def list_(hub, resource_group, **kwargs):
     '''
     result = {}
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
+    if stream:
+        return hub.exec.utils.azurerm.paged_object_to_iter(
+            netconn.network_security_groups.list(
+                resource_group_name=resource_group
+            ),
+            limit=limit
+        )
+
     try:
         secgroups = await hub.exec.utils.azurerm.paged_object_to_list(
             netconn.network_security_groups.list(
@@ -553,12 +599,23 @@ async def list_(hub, resource_group, **kwargs):
     return result
 
 
-async def list_all(hub, **kwargs):
+async def list_all(hub, stream=False, limit=None, backend=None, subscriptions=None, **kwargs):
     '''
     .. versionadded:: 1.0.0
 
     List all network security groups within a subscription.
 
+    :param stream: If True, return an asynchronous generator which yields each item as its page is retrieved,
+        instead of a dictionary keyed by name. Errors are raised to the consumer while iterating.
+
+    :param limit: The maximum number of items to yield when streaming.
+
+    :param backend: The backend used to list the resources when not streaming, either ``arm`` or
+        ``resource_graph``. Defaults to the ``azurerm_list_backend`` option.
+
+    :param subscriptions: A list of subscription IDs to list the resources across when using the
+        ``resource_graph`` backend. Defaults to the subscription of the provider credentials.
+
     CLI Example:
 
     .. code-block:: bash
@@ -568,10 +625,20 @@ async def list_all(hub, **kwargs):
     '''
     result = {}
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
+    if stream:
+        return hub.exec.utils.azurerm.paged_object_to_iter(netconn.network_security_groups.list_all(), limit=limit)
+
     try:
-        secgroups = await hub.exec.utils.azurerm.paged_object_to_list(
-            netconn.network_security_groups.list_all()
-        )
+        if await hub.exec.utils.azurerm.resource_graph_enabled(backend):
+            secgroups = await hub.exec.utils.azurerm.resource_graph_list(
+                'Microsoft.Network/networkSecurityGroups',
+                netconn.network_security_groups,
+                'NetworkSecurityGroup',
+                subscriptions=subscriptions,
+                **kwargs
+            )
+        else:
+            secgroups = await hub.exec.utils.azurerm.paged_object_to_list(netconn.network_security_groups.list_all())
         for secgroup in secgroups:
             result[secgroup['name']] = secgroup
     except CloudError as exc:
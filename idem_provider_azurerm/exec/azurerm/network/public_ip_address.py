@@ -87,18 +87,24 @@ async def delete(hub, name, resource_group, **kwargs):
         azurerm.network.public_ip_address.delete test-pub-ip testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'publicIPAddresses', name, **kwargs
+    )
     result = False
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        pub_ip = netconn.public_ip_addresses.delete(
+        pub_ip = await hub.exec.utils.azurerm.run_lro(
+            netconn.public_ip_addresses.delete,
             public_ip_address_name=name,
             resource_group_name=resource_group
         )
-        pub_ip.wait()
         result = True
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('network', str(exc), **kwargs)
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+    await hub.exec.azurerm.network.resolver.forget('public_ip_addresses', resource_group, **kwargs)
+
     return result
 
 
@@ -120,17 +126,23 @@ async def get(hub, name, resource_group, **kwargs):
         azurerm.network.public_ip_address.get test-pub-ip testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'publicIPAddresses', name, **kwargs
+    )
     expand = kwargs.get('expand')
 
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
 
     try:
-        pub_ip = netconn.public_ip_addresses.get(
+        result = await hub.exec.utils.azurerm.cached_get(
+            arm_id,
+            netconn.public_ip_addresses.get,
             public_ip_address_name=name,
             resource_group_name=resource_group,
-            expand=expand
+            expand=expand,
+            ctx=kwargs.get('ctx'),
+            batch_model=None if expand else 'PublicIPAddress'
         )
-        result = pub_ip.as_dict()
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('network', str(exc), **kwargs)
         result = {'error': str(exc)}
@@ -156,17 +168,18 @@ async def create_or_update(hub, name, resource_group, **kwargs):
         azurerm.network.public_ip_address.create_or_update test-ip-0 testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'publicIPAddresses', name, **kwargs
+    )
     if 'location' not in kwargs:
-        rg_props = await hub.exec.azurerm.resource.group.get(
-            resource_group, **kwargs
-        )
+        location = await hub.exec.azurerm.resource.group.get_location(resource_group, **kwargs)
 
-        if 'error' in rg_props:
+        if not location:
             log.error(
                 'Unable to determine location from resource group specified.'
             )
             return False
-        kwargs['location'] = rg_props['location']
+        kwargs['location'] = location
 
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
 
@@ -177,12 +190,12 @@ async def create_or_update(hub, name, resource_group, **kwargs):
         return result
 
     try:
-        ip = netconn.public_ip_addresses.create_or_update(
+        ip = await hub.exec.utils.azurerm.run_lro(
+            netconn.public_ip_addresses.create_or_update,
             resource_group_name=resource_group,
             public_ip_address_name=name,
             parameters=pub_ip_model
         )
-        ip.wait()
         ip_result = ip.result()
         result = ip_result.as_dict()
     except CloudError as exc:
@@ -191,15 +204,29 @@ async def create_or_update(hub, name, resource_group, **kwargs):
     except SerializationError as exc:
         result = {'error': 'The object model could not be parsed. ({0})'.format(str(exc))}
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+    await hub.exec.azurerm.network.resolver.forget('public_ip_addresses', resource_group, **kwargs)
+
     return result
 
 
-async def list_all(hub, **kwargs):
+async def list_all(hub, stream=False, limit=None, backend=None, subscriptions=None, **kwargs):
     '''
     .. versionadded:: 1.0.0
 
     List all public IP addresses within a subscription.
 
+    :param stream: If True, return an asynchronous generator which yields each item as its page is retrieved,
+        instead of a dictionary keyed by name. Errors are raised to the consumer while iterating.
+
+    :param limit: The maximum number of items to yield when streaming.
+
+    :param backend: The backend used to list the resources when not streaming, either ``arm`` or
+        ``resource_graph``. Defaults to the ``azurerm_list_backend`` option.
+
+    :param subscriptions: A list of subscription IDs to list the resources across when using the
+        ``resource_graph`` backend. Defaults to the subscription of the provider credentials.
+
     CLI Example:
 
     .. code-block:: bash
@@ -209,8 +236,20 @@ async def list_all(hub, **kwargs):
     '''
     result = {}
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
+    if stream:
+        return hub.exec.utils.azurerm.paged_object_to_iter(netconn.public_ip_addresses.list_all(), limit=limit)
+
     try:
-        pub_ips = await hub.exec.utils.azurerm.paged_object_to_list(netconn.public_ip_addresses.list_all())
+        if await hub.exec.utils.azurerm.resource_graph_enabled(backend):
+            pub_ips = await hub.exec.utils.azurerm.resource_graph_list(
+                'Microsoft.Network/publicIPAddresses',
+                netconn.public_ip_addresses,
+                'PublicIPAddress',
+                subscriptions=subscriptions,
+                **kwargs
+            )
+        else:
+            pub_ips = await hub.exec.utils.azurerm.paged_object_to_list(netconn.public_ip_addresses.list_all())
 
         for ip in pub_ips:
             result[ip['name']] = ip
@@ -221,7 +260,7 @@ async def list_all(hub, **kwargs):
     return result
 
 
-async def list_(hub, resource_group, **kwargs):
+async def list_(hub, resource_group, stream=False, limit=None, **kwargs):
     '''
     .. versionadded:: 1.0.0
 
@@ -230,6 +269,11 @@ async def list_(hub, resource_group, **kwargs):
     :param resource_group: The resource group name to list public IP
         addresses within.
 
+    :param stream: If True, return an asynchronous generator which yields each item as its page is retrieved,
+        instead of a dictionary keyed by name. Errors are raised to the consumer while iterating.
+
+    :param limit: The maximum number of items to yield when streaming.
+
     CLI Example:
 
     .. code-block:: bash
@@ -239,6 +283,14 @@ async def list_(hub, resource_group, **kwargs):
     '''
     result = {}
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
+    if stream:
+        return hub.exec.utils.azurerm.paged_object_to_iter(
+            netconn.public_ip_addresses.list(
+                resource_group_name=resource_group
+            ),
+            limit=limit
+        )
+
     try:
         pub_ips = await hub.exec.utils.azurerm.paged_object_to_list(
             netconn.public_ip_addresses.list(
@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+'''
+Azure Resource Manager (ARM) Network Resource ID Resolver Execution Module
+
+.. versionadded:: 1.0.0
+
+:maintainer: <devops@eitr.tech>
+:maturity: new
+:depends:
+    * `azure <https://pypi.python.org/pypi/azure>`_ >= 4.0.0
+    * `azure-common <https://pypi.python.org/pypi/azure-common>`_ >= 1.1.23
+    * `azure-mgmt <https://pypi.python.org/pypi/azure-mgmt>`_ >= 4.0.0
+    * `azure-mgmt-compute <https://pypi.python.org/pypi/azure-mgmt-compute>`_ >= 4.6.2
+    * `azure-mgmt-network <https://pypi.python.org/pypi/azure-mgmt-network>`_ >= 4.0.0
+    * `azure-mgmt-resource <https://pypi.python.org/pypi/azure-mgmt-resource>`_ >= 2.2.0
+    * `azure-mgmt-storage <https://pypi.python.org/pypi/azure-mgmt-storage>`_ >= 2.0.0
+    * `azure-mgmt-web <https://pypi.python.org/pypi/azure-mgmt-web>`_ >= 0.35.0
+    * `azure-storage <https://pypi.python.org/pypi/azure-storage>`_ >= 0.36.0
+    * `msrestazure <https://pypi.python.org/pypi/msrestazure>`_ >= 0.6.1
+:platform: linux
+
+:configuration: This module requires Azure Resource Manager credentials to be passed as keyword arguments
+    to every function in order to work properly.
+
+    Required provider parameters:
+
+    if using username and password:
+      * ``subscription_id``
+      * ``username``
+      * ``password``
+
+    if using a service principal:
+      * ``subscription_id``
+      * ``tenant``
+      * ``client_id``
+      * ``secret``
+
+    Optional provider parameters:
+
+**cloud_environment**: Used to point the cloud driver to different API endpoints, such as Azure GovCloud.
+    Possible values:
+      * ``AZURE_PUBLIC_CLOUD`` (default)
+      * ``AZURE_CHINA_CLOUD``
+      * ``AZURE_US_GOV_CLOUD``
+      * ``AZURE_GERMAN_CLOUD``
+
+'''
+
+# Python libs
+from __future__ import absolute_import
+import asyncio
+import logging
+
+# Azure libs
+HAS_LIBS = False
+try:
+    import azure.mgmt.network.models  # pylint: disable=unused-import
+    from msrestazure.azure_exceptions import CloudError
+    HAS_LIBS = True
+except ImportError:
+    pass
+
+log = logging.getLogger(__name__)
+
+KINDS = ('virtual_networks', 'subnets', 'network_security_groups', 'public_ip_addresses')
+
+# Subnets are listed with the virtual networks containing them
+COLLECTIONS = {
+    'virtual_networks': 'virtual_networks',
+    'subnets': 'virtual_networks',
+    'network_security_groups': 'network_security_groups',
+    'public_ip_addresses': 'public_ip_addresses',
+}
+
+
+def __init__(hub):
+    '''
+    Set up the per resource group name to ID index
+    '''
+    hub.exec.azurerm.network.resolver.INDEX = {}
+
+
+async def _load(hub, collection, resource_group, **kwargs):
+    '''
+    Load the virtual networks and their subnets, the network security groups or the public IP addresses of a
+    resource group with a single list call
+    '''
+    netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
+
+    resources = await hub.exec.utils.azurerm.paged_object_to_list(
+        getattr(netconn, collection).list(resource_group_name=resource_group)
+    )
+
+    if collection != 'virtual_networks':
+        return {collection: dict((resource['name'].lower(), resource['id']) for resource in resources)}
+
+    index = {'virtual_networks': {}, 'subnets': {}}
+    for vnet in resources:
+        index['virtual_networks'][vnet['name'].lower()] = vnet['id']
+        index['subnets'][vnet['name'].lower()] = dict(
+            (subnet['name'].lower(), subnet['id']) for subnet in vnet.get('subnets', [])
+        )
+
+    return index
+
+
+def _lookup(index, kind, name, virtual_network=None):
+    '''
+    Find a name in a loaded index. Subnets are looked up within the given virtual network, or within the first
+    virtual network containing a subnet of that name if none is given.
+    '''
+    if kind != 'subnets':
+        return index[kind].get(name.lower())
+
+    if virtual_network:
+        return index['subnets'].get(virtual_network.lower(), {}).get(name.lower())
+
+    for subnets in index['subnets'].values():
+        if name.lower() in subnets:
+            return subnets[name.lower()]
+
+    return None
+
+
+async def resolve(hub, kind, name, resource_group, virtual_network=None, **kwargs):
+    '''
+    .. versionadded:: 1.0.0
+
+    Resolve the name of a network resource to its resource ID. The resources of the requested type in the resource
+    group are loaded in bulk on first use and kept for the rest of the run. Only that type is loaded again if a name
+    is not found, so resources created during the run are picked up, and the exec modules which create and delete
+    these resources drop their type from the index. Returns None if the name cannot be resolved.
+
+    :param kind: The type of resource to resolve. One of ``virtual_networks``, ``subnets``,
+        ``network_security_groups`` or ``public_ip_addresses``.
+
+    :param name: The name of the resource.
+
+    :param resource_group: The resource group name assigned to the resource.
+
+    :param virtual_network: The virtual network containing the subnet. Only used when resolving subnets.
+
+    CLI Example:
+
+    .. code-block:: bash
+
+        azurerm.network.resolver.resolve subnets testsubnet testgroup virtual_network=testnet
+
+    '''
+    if kind not in KINDS:
+        log.error('Unable to resolve resource type %s. Supported types are: %s', kind, ', '.join(KINDS))
+        return None
+
+    key = (str(kwargs.get('subscription_id')), resource_group.lower())
+    indexes = hub.exec.azurerm.network.resolver.INDEX
+    if key not in indexes:
+        indexes[key] = {'index': {}, 'lock': asyncio.Lock()}
+    entry = indexes[key]
+    collection = COLLECTIONS[kind]
+
+    async with entry['lock']:
+        if collection in entry['index']:
+            result = _lookup(entry['index'], kind, name, virtual_network)
+            if result:
+                return result
+
+        try:
+            entry['index'].update(await _load(hub, collection, resource_group, **kwargs))
+        except CloudError as exc:
+            await hub.exec.utils.azurerm.log_cloud_error('network', str(exc), **kwargs)
+            return None
+
+        return _lookup(entry['index'], kind, name, virtual_network)
+
+
+async def clear(hub, resource_group=None, **kwargs):
+    '''
+    .. versionadded:: 1.0.0
+
+    Drop the name to ID index for a resource group, or for every resource group if none is given.
+
+    :param resource_group: The resource group name whose index is dropped.
+
+    CLI Example:
+
+    .. code-block:: bash
+
+        azurerm.network.resolver.clear testgroup
+
+    '''
+    if resource_group is None:
+        hub.exec.azurerm.network.resolver.INDEX.clear()
+    else:
+        hub.exec.azurerm.network.resolver.INDEX.pop(
+            (str(kwargs.get('subscription_id')), resource_group.lower()), None
+        )
+
+    return True
+
+
+async def forget(hub, kind, resource_group, **kwargs):
+    '''
+    .. versionadded:: 1.0.0
+
+    Drop the loaded names of a type of network resource in a resource group, so the next lookup loads them again.
+    Virtual networks and subnets are loaded together, so forgetting either drops both.
+
+    :param kind: The type of resource to forget. One of ``virtual_networks``, ``subnets``,
+        ``network_security_groups`` or ``public_ip_addresses``.
+
+    :param resource_group: The resource group name whose names are dropped.
+
+    CLI Example:
+
+    .. code-block:: bash
+
+        azurerm.network.resolver.forget public_ip_addresses testgroup
+
+    '''
+    entry = hub.exec.azurerm.network.resolver.INDEX.get((str(kwargs.get('subscription_id')), resource_group.lower()))
+    if entry is not None:
+        collection = COLLECTIONS.get(kind)
+        # Wait for a load already under way, which may have started before the change being recorded
+        async with entry['lock']:
+            for loaded in [loaded for loaded in entry['index'] if COLLECTIONS.get(loaded) == collection]:
+                del entry['index'][loaded]
+
+    return True
@@ -89,19 +89,24 @@ async def filter_rule_delete(hub, name, route_filter, resource_group, **kwargs):
         azurerm.network.route.filter_rule_delete test-rule test-filter testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'routeFilters', route_filter, 'routeFilterRules', name, **kwargs
+    )
     result = False
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        rule = netconn.route_filter_rules.delete(
+        rule = await hub.exec.utils.azurerm.run_lro(
+            netconn.route_filter_rules.delete,
             resource_group_name=resource_group,
             route_filter_name=route_filter,
             rule_name=name
         )
-        rule.wait()
         result = True
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('network', str(exc), **kwargs)
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
 
 
@@ -125,16 +130,21 @@ async def filter_rule_get(hub, name, route_filter, resource_group, **kwargs):
         azurerm.network.route.filter_rule_get test-rule test-filter testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'routeFilters', route_filter, 'routeFilterRules', name, **kwargs
+    )
     result = {}
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        rule = netconn.route_filter_rules.get(
+        result = await hub.exec.utils.azurerm.cached_get(
+            arm_id,
+            netconn.route_filter_rules.get,
             resource_group_name=resource_group,
             route_filter_name=route_filter,
-            rule_name=name
+            rule_name=name,
+            ctx=kwargs.get('ctx'),
+            batch_model='RouteFilterRule'
         )
-
-        result = rule.as_dict()
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('network', str(exc), **kwargs)
         result = {'error': str(exc)}
@@ -167,6 +177,9 @@ async def filter_rule_create_or_update(hub, name, access, communities, route_fil
                   test-rule allow "['12076:51006']" test-filter testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'routeFilters', route_filter, 'routeFilterRules', name, **kwargs
+    )
     if not isinstance(communities, list):
         log.error(
             'The communities parameter must be a list of strings!'
@@ -174,16 +187,14 @@ async def filter_rule_create_or_update(hub, name, access, communities, route_fil
         return False
 
     if 'location' not in kwargs:
-        rg_props = await hub.exec.azurerm.resource.group.get(
-            resource_group, **kwargs
-        )
+        location = await hub.exec.azurerm.resource.group.get_location(resource_group, **kwargs)
 
-        if 'error' in rg_props:
+        if not location:
             log.error(
                 'Unable to determine location from resource group specified.'
             )
             return False
-        kwargs['location'] = rg_props['location']
+        kwargs['location'] = location
 
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
 
@@ -200,13 +211,13 @@ async def filter_rule_create_or_update(hub, name, access, communities, route_fil
         return result
 
     try:
-        rule = netconn.route_filter_rules.create_or_update(
+        rule = await hub.exec.utils.azurerm.run_lro(
+            netconn.route_filter_rules.create_or_update,
             resource_group_name=resource_group,
             route_filter_name=route_filter,
             rule_name=name,
             route_filter_rule_parameters=rule_model
         )
-        rule.wait()
         rule_result = rule.result()
         result = rule_result.as_dict()
     except CloudError as exc:
@@ -218,6 +229,8 @@ async def filter_rule_create_or_update(hub, name, access, communities, route_fil
     except SerializationError as exc:
         result = {'error': 'The object model could not be parsed. ({0})'.format(str(exc))}
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
 
 
@@ -276,18 +289,23 @@ async def filter_delete(hub, name, resource_group, **kwargs):
         azurerm.network.route.filter_delete test-filter testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'routeFilters', name, **kwargs
+    )
     result = False
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        route_filter = netconn.route_filters.delete(
+        route_filter = await hub.exec.utils.azurerm.run_lro(
+            netconn.route_filters.delete,
             route_filter_name=name,
             resource_group_name=resource_group
         )
-        route_filter.wait()
         result = True
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('network', str(exc), **kwargs)
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
 
 
@@ -309,17 +327,23 @@ async def filter_get(hub, name, resource_group, **kwargs):
         azurerm.network.route.filter_get test-filter testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'routeFilters', name, **kwargs
+    )
     expand = kwargs.get('expand')
 
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
 
     try:
-        route_filter = netconn.route_filters.get(
+        result = await hub.exec.utils.azurerm.cached_get(
+            arm_id,
+            netconn.route_filters.get,
             route_filter_name=name,
             resource_group_name=resource_group,
-            expand=expand
+            expand=expand,
+            ctx=kwargs.get('ctx'),
+            batch_model=None if expand else 'RouteFilter'
         )
-        result = route_filter.as_dict()
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('network', str(exc), **kwargs)
         result = {'error': str(exc)}
@@ -345,17 +369,18 @@ async def filter_create_or_update(hub, name, resource_group, **kwargs):
         azurerm.network.route.filter_create_or_update test-filter testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'routeFilters', name, **kwargs
+    )
     if 'location' not in kwargs:
-        rg_props = await hub.exec.azurerm.resource.group.get(
-            resource_group, **kwargs
-        )
+        location = await hub.exec.azurerm.resource.group.get_location(resource_group, **kwargs)
 
-        if 'error' in rg_props:
+        if not location:
             log.error(
                 'Unable to determine location from resource group specified.'
             )
             return False
-        kwargs['location'] = rg_props['location']
+        kwargs['location'] = location
 
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
 
@@ -366,12 +391,12 @@ async def filter_create_or_update(hub, name, resource_group, **kwargs):
         return result
 
     try:
-        rt_filter = netconn.route_filters.create_or_update(
+        rt_filter = await hub.exec.utils.azurerm.run_lro(
+            netconn.route_filters.create_or_update,
             resource_group_name=resource_group,
             route_filter_name=name,
             route_filter_parameters=rt_filter_model
         )
-        rt_filter.wait()
         rt_result = rt_filter.result()
         result = rt_result.as_dict()
     except CloudError as exc:
@@ -380,6 +405,8 @@ async def filter_create_or_update(hub, name, resource_group, **kwargs):
     except SerializationError as exc:
         result = {'error': 'The object model could not be parsed. ({0})'.format(str(exc))}
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
 
 
@@ -464,19 +491,24 @@ async def delete(hub, name, route_table, resource_group, **kwargs):
         azurerm.network.route.delete test-rt test-rt-table testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'routeTables', route_table, 'routes', name, **kwargs
+    )
     result = False
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        route = netconn.routes.delete(
+        route = await hub.exec.utils.azurerm.run_lro(
+            netconn.routes.delete,
             resource_group_name=resource_group,
             route_table_name=route_table,
             route_name=name
         )
-        route.wait()
         result = True
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('network', str(exc), **kwargs)
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
 
 
@@ -500,16 +532,21 @@ async def get(hub, name, route_table, resource_group, **kwargs):
         azurerm.network.route.get test-rt test-rt-table testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'routeTables', route_table, 'routes', name, **kwargs
+    )
     result = {}
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        route = netconn.routes.get(
+        result = await hub.exec.utils.azurerm.cached_get(
+            arm_id,
+            netconn.routes.get,
             resource_group_name=resource_group,
             route_table_name=route_table,
-            route_name=name
+            route_name=name,
+            ctx=kwargs.get('ctx'),
+            batch_model='Route'
         )
-
-        result = route.as_dict()
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('network', str(exc), **kwargs)
         result = {'error': str(exc)}
@@ -546,6 +583,9 @@ async def create_or_update(hub, name, address_prefix, next_hop_type, route_table
         azurerm.network.route.create_or_update test-rt '10.0.0.0/8' test-rt-table testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'routeTables', route_table, 'routes', name, **kwargs
+    )
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
 
     try:
@@ -562,13 +602,13 @@ async def create_or_update(hub, name, address_prefix, next_hop_type, route_table
         return result
 
     try:
-        route = netconn.routes.create_or_update(
+        route = await hub.exec.utils.azurerm.run_lro(
+            netconn.routes.create_or_update,
             resource_group_name=resource_group,
             route_table_name=route_table,
             route_name=name,
             route_parameters=rt_model
         )
-        route.wait()
         rt_result = route.result()
         result = rt_result.as_dict()
     except CloudError as exc:
@@ -577,6 +617,8 @@ async def create_or_update(hub, name, address_prefix, next_hop_type, route_table
     except SerializationError as exc:
         result = {'error': 'The object model could not be parsed. ({0})'.format(str(exc))}
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
 
 
@@ -635,18 +677,23 @@ async def table_delete(hub, name, resource_group, **kwargs):
         azurerm.network.route.table_delete test-rt-table testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'routeTables', name, **kwargs
+    )
     result = False
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        table = netconn.route_tables.delete(
+        table = await hub.exec.utils.azurerm.run_lro(
+            netconn.route_tables.delete,
             route_table_name=name,
             resource_group_name=resource_group
         )
-        table.wait()
         result = True
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('network', str(exc), **kwargs)
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
 
 
@@ -668,17 +715,23 @@ async def table_get(hub, name, resource_group, **kwargs):
         azurerm.network.route.table_get test-rt-table testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'routeTables', name, **kwargs
+    )
     expand = kwargs.get('expand')
 
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
 
     try:
-        table = netconn.route_tables.get(
+        result = await hub.exec.utils.azurerm.cached_get(
+            arm_id,
+            netconn.route_tables.get,
             route_table_name=name,
             resource_group_name=resource_group,
-            expand=expand
+            expand=expand,
+            ctx=kwargs.get('ctx'),
+            batch_model=None if expand else 'RouteTable'
         )
-        result = table.as_dict()
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('network', str(exc), **kwargs)
         result = {'error': str(exc)}
@@ -704,17 +757,18 @@ async def table_create_or_update(hub, name, resource_group, **kwargs):
         azurerm.network.route.table_create_or_update test-rt-table testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'routeTables', name, **kwargs
+    )
     if 'location' not in kwargs:
-        rg_props = await hub.exec.azurerm.resource.group.get(
-            resource_group, **kwargs
-        )
+        location = await hub.exec.azurerm.resource.group.get_location(resource_group, **kwargs)
 
-        if 'error' in rg_props:
+        if not location:
             log.error(
                 'Unable to determine location from resource group specified.'
             )
             return False
-        kwargs['location'] = rg_props['location']
+        kwargs['location'] = location
 
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
 
@@ -725,12 +779,12 @@ async def table_create_or_update(hub, name, resource_group, **kwargs):
         return result
 
     try:
-        table = netconn.route_tables.create_or_update(
+        table = await hub.exec.utils.azurerm.run_lro(
+            netconn.route_tables.create_or_update,
             resource_group_name=resource_group,
             route_table_name=name,
             parameters=rt_tbl_model
         )
-        table.wait()
         tbl_result = table.result()
         result = tbl_result.as_dict()
     except CloudError as exc:
@@ -739,6 +793,8 @@ async def table_create_or_update(hub, name, resource_group, **kwargs):
     except SerializationError as exc:
         result = {'error': 'The object model could not be parsed. ({0})'.format(str(exc))}
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
 
 
@@ -127,15 +127,20 @@ async def subnet_get(hub, name, virtual_network, resource_group, **kwargs):
         azurerm.network.virtual_network_gateway.subnet_get testsubnet testnet testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'virtualNetworks', virtual_network, 'subnets', name, **kwargs
+    )
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        subnet = netconn.subnets.get(
+        result = await hub.exec.utils.azurerm.cached_get(
+            arm_id,
+            netconn.subnets.get,
             resource_group_name=resource_group,
             virtual_network_name=virtual_network,
-            subnet_name=name
+            subnet_name=name,
+            ctx=kwargs.get('ctx'),
+            batch_model='Subnet'
         )
-
-        result = subnet.as_dict()
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('network', str(exc), **kwargs)
         result = {'error': str(exc)}
@@ -167,6 +172,9 @@ async def subnet_create_or_update(hub, name, address_prefix, virtual_network, re
                   '10.0.0.0/24' testnet testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'virtualNetworks', virtual_network, 'subnets', name, **kwargs
+    )
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
 
     # Use NSG name to link to the ID of an existing NSG.
@@ -202,13 +210,13 @@ async def subnet_create_or_update(hub, name, address_prefix, virtual_network, re
         return result
 
     try:
-        subnet = netconn.subnets.create_or_update(
+        subnet = await hub.exec.utils.azurerm.run_lro(
+            netconn.subnets.create_or_update,
             resource_group_name=resource_group,
             virtual_network_name=virtual_network,
             subnet_name=name,
             subnet_parameters=snetmodel,
         )
-        subnet.wait()
         sn_result = subnet.result()
         result = sn_result.as_dict()
     except CloudError as exc:
@@ -217,6 +225,9 @@ async def subnet_create_or_update(hub, name, address_prefix, virtual_network, re
     except SerializationError as exc:
         result = {'error': 'The object model could not be parsed. ({0})'.format(str(exc))}
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+    await hub.exec.azurerm.network.resolver.forget('subnets', resource_group, **kwargs)
+
     return result
 
 
@@ -241,28 +252,45 @@ async def subnet_delete(hub, name, virtual_network, resource_group, **kwargs):
         azurerm.network.virtual_network_gateway.subnet_delete testsubnet testnet testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'virtualNetworks', virtual_network, 'subnets', name, **kwargs
+    )
     result = False
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        subnet = netconn.subnets.delete(
+        subnet = await hub.exec.utils.azurerm.run_lro(
+            netconn.subnets.delete,
             resource_group_name=resource_group,
             virtual_network_name=virtual_network,
             subnet_name=name
         )
-        subnet.wait()
         result = True
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('network', str(exc), **kwargs)
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+    await hub.exec.azurerm.network.resolver.forget('subnets', resource_group, **kwargs)
+
     return result
 
 
-async def list_all(hub, **kwargs):
+async def list_all(hub, stream=False, limit=None, backend=None, subscriptions=None, **kwargs):
     '''
     .. versionadded:: 1.0.0
 
     List all virtual networks within a subscription.
 
+    :param stream: If True, return an asynchronous generator which yields each item as its page is retrieved,
+        instead of a dictionary keyed by name. Errors are raised to the consumer while iterating.
+
+    :param limit: The maximum number of items to yield when streaming.
+
+    :param backend: The backend used to list the resources when not streaming, either ``arm`` or
+        ``resource_graph``. Defaults to the ``azurerm_list_backend`` option.
+
+    :param subscriptions: A list of subscription IDs to list the resources across when using the
+        ``resource_graph`` backend. Defaults to the subscription of the provider credentials.
+
     CLI Example:
 
     .. code-block:: bash
@@ -272,8 +300,20 @@ async def list_all(hub, **kwargs):
     '''
     result = {}
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
+    if stream:
+        return hub.exec.utils.azurerm.paged_object_to_iter(netconn.virtual_networks.list_all(), limit=limit)
+
     try:
-        vnets = await hub.exec.utils.azurerm.paged_object_to_list(netconn.virtual_networks.list_all())
+        if await hub.exec.utils.azurerm.resource_graph_enabled(backend):
+            vnets = await hub.exec.utils.azurerm.resource_graph_list(
+                'Microsoft.Network/virtualNetworks',
+                netconn.virtual_networks,
+                'VirtualNetwork',
+                subscriptions=subscriptions,
+                **kwargs
+            )
+        else:
+            vnets = await hub.exec.utils.azurerm.paged_object_to_list(netconn.virtual_networks.list_all())
 
         for vnet in vnets:
             result[vnet['name']] = vnet
@@ -284,7 +324,7 @@ async def list_all(hub, **kwargs):
     return result
 
 
-async def list_(hub, resource_group, **kwargs):
+async def list_(hub, resource_group, stream=False, limit=None, **kwargs):
     '''
     .. versionadded:: 1.0.0
 
@@ -293,6 +333,11 @@ async def list_(hub, resource_group, **kwargs):
     :param resource_group: The resource group name to list virtual networks
         within.
 
+    :param stream: If True, return an asynchronous generator which yields each item as its page is retrieved,
+        instead of a dictionary keyed by name. Errors are raised to the consumer while iterating.
+
+    :param limit: The maximum number of items to yield when streaming.
+
     CLI Example:
 
     .. code-block:: bash
@@ -302,6 +347,14 @@ async def list_(hub, resource_group, **kwargs):
     '''
     result = {}
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
+    if stream:
+        return hub.exec.utils.azurerm.paged_object_to_iter(
+            netconn.virtual_networks.list(
+                resource_group_name=resource_group
+            ),
+            limit=limit
+        )
+
     try:
         vnets = await hub.exec.utils.azurerm.paged_object_to_list(
             netconn.virtual_networks.list(
@@ -341,17 +394,18 @@ async def create_or_update(hub, name, address_prefixes, resource_group, **kwargs
                   testnet ['10.0.0.0/16'] testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'virtualNetworks', name, **kwargs
+    )
     if 'location' not in kwargs:
-        rg_props = await hub.exec.azurerm.resource.group.get(
-            resource_group, **kwargs
-        )
+        location = await hub.exec.azurerm.resource.group.get_location(resource_group, **kwargs)
 
-        if 'error' in rg_props:
+        if not location:
             log.error(
                 'Unable to determine location from resource group specified.'
             )
             return False
-        kwargs['location'] = rg_props['location']
+        kwargs['location'] = location
 
     if not isinstance(address_prefixes, list):
         log.error(
@@ -377,12 +431,12 @@ async def create_or_update(hub, name, address_prefixes, resource_group, **kwargs
         return result
 
     try:
-        vnet = netconn.virtual_networks.create_or_update(
+        vnet = await hub.exec.utils.azurerm.run_lro(
+            netconn.virtual_networks.create_or_update,
             virtual_network_name=name,
             resource_group_name=resource_group,
             parameters=vnetmodel
         )
-        vnet.wait()
         vnet_result = vnet.result()
         result = vnet_result.as_dict()
     except CloudError as exc:
@@ -391,6 +445,9 @@ async def create_or_update(hub, name, address_prefixes, resource_group, **kwargs
     except SerializationError as exc:
         result = {'error': 'The object model could not be parsed. ({0})'.format(str(exc))}
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+    await hub.exec.azurerm.network.resolver.forget('virtual_networks', resource_group, **kwargs)
+
     return result
 
 
@@ -412,18 +469,24 @@ async def delete(hub, name, resource_group, **kwargs):
         azurerm.network.virtual_network.delete testnet testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'virtualNetworks', name, **kwargs
+    )
     result = False
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        vnet = netconn.virtual_networks.delete(
+        vnet = await hub.exec.utils.azurerm.run_lro(
+            netconn.virtual_networks.delete,
             virtual_network_name=name,
             resource_group_name=resource_group
         )
-        vnet.wait()
         result = True
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('network', str(exc), **kwargs)
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+    await hub.exec.azurerm.network.resolver.forget('virtual_networks', resource_group, **kwargs)
+
     return result
 
 
@@ -445,13 +508,19 @@ async def get(hub, name, resource_group, **kwargs):
         azurerm.network.virtual_network.get testnet testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'virtualNetworks', name, **kwargs
+    )
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        vnet = netconn.virtual_networks.get(
+        result = await hub.exec.utils.azurerm.cached_get(
+            arm_id,
+            netconn.virtual_networks.get,
             virtual_network_name=name,
-            resource_group_name=resource_group
+            resource_group_name=resource_group,
+            ctx=kwargs.get('ctx'),
+            batch_model='VirtualNetwork'
         )
-        result = vnet.as_dict()
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('network', str(exc), **kwargs)
         result = {'error': str(exc)}
@@ -102,17 +102,18 @@ async def connection_create_or_update(hub, name, resource_group, virtual_network
                   test_vnet_gw test_connection_type
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'connections', name, **kwargs
+    )
     if 'location' not in kwargs:
-        rg_props = await hub.exec.azurerm.resource.group.get(
-            resource_group, **kwargs
-        )
+        location = await hub.exec.azurerm.resource.group.get_location(resource_group, **kwargs)
 
-        if 'error' in rg_props:
+        if not location:
             log.error(
                 'Unable to determine location from resource group specified.'
             )
             return False
-        kwargs['location'] = rg_props['location']
+        kwargs['location'] = location
 
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
 
@@ -185,12 +186,12 @@ async def connection_create_or_update(hub, name, resource_group, virtual_network
         return result
 
     try:
-        connection = netconn.virtual_network_gateway_connections.create_or_update(
+        connection = await hub.exec.utils.azurerm.run_lro(
+            netconn.virtual_network_gateway_connections.create_or_update,
             resource_group_name=resource_group,
             virtual_network_gateway_connection_name=name,
             parameters=connectionmodel
         )
-        connection.wait()
         connection_result = connection.result()
         result = connection_result.as_dict()
     except CloudError as exc:
@@ -199,6 +200,8 @@ async def connection_create_or_update(hub, name, resource_group, virtual_network
     except SerializationError as exc:
         result = {'error': 'The object model could not be parsed. ({0})'.format(str(exc))}
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
 
 
@@ -219,14 +222,19 @@ async def connection_get(hub, name, resource_group, **kwargs):
         azurerm.network.virtual_network_gateway.connection_get test_name test_group
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'connections', name, **kwargs
+    )
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        connection = netconn.virtual_network_gateway_connections.get(
+        result = await hub.exec.utils.azurerm.cached_get(
+            arm_id,
+            netconn.virtual_network_gateway_connections.get,
             resource_group_name=resource_group,
-            virtual_network_gateway_connection_name=name
+            virtual_network_gateway_connection_name=name,
+            ctx=kwargs.get('ctx'),
+            batch_model='VirtualNetworkGatewayConnection'
         )
-
-        result = connection.as_dict()
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('network', str(exc), **kwargs)
         result = {'error': str(exc)}
@@ -251,18 +259,23 @@ async def connection_delete(hub, name, resource_group, **kwargs):
         azurerm.network.virtual_network_gateway.connection_delete test_name test_group
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'connections', name, **kwargs
+    )
     result = False
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        connection = netconn.virtual_network_gateway_connections.delete(
+        connection = await hub.exec.utils.azurerm.run_lro(
+            netconn.virtual_network_gateway_connections.delete,
             resource_group_name=resource_group,
             virtual_network_gateway_connection_name=name
         )
-        connection.wait()
         result = True
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('network', str(exc), **kwargs)
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
 
 
@@ -290,13 +303,13 @@ async def connection_set_shared_key(hub, name, resource_group, value, **kwargs):
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
 
     try:
-        key = netconn.virtual_network_gateway_connections.set_shared_key(
+        key = await hub.exec.utils.azurerm.run_lro(
+            netconn.virtual_network_gateway_connections.set_shared_key,
             resource_group_name=resource_group,
             virtual_network_gateway_connection_name=name,
             value=value
         )
 
-        key.wait()
         result = True
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('network', str(exc), **kwargs)
@@ -325,7 +338,8 @@ async def connection_get_shared_key(hub, name, resource_group, **kwargs):
     '''
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        key = netconn.virtual_network_gateway_connections.get_shared_key(
+        key = await hub.exec.utils.azurerm.run(
+            netconn.virtual_network_gateway_connections.get_shared_key,
             resource_group_name=resource_group,
             virtual_network_gateway_connection_name=name
         )
@@ -363,13 +377,13 @@ async def connection_reset_shared_key(hub, name, resource_group, key_length=128,
     result = False
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        rkey = netconn.virtual_network_gateway_connections.reset_shared_key(
+        rkey = await hub.exec.utils.azurerm.run_lro(
+            netconn.virtual_network_gateway_connections.reset_shared_key,
             resource_group_name=resource_group,
             virtual_network_gateway_connection_name=name,
             key_length=key_length
         )
 
-        rkey.wait()
         result = True
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('network', str(exc), **kwargs)
@@ -474,17 +488,18 @@ async def create_or_update(hub, name, resource_group, virtual_network, ip_config
                   test_vnet test_ip_configs
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'virtualNetworkGateways', name, **kwargs
+    )
     if 'location' not in kwargs:
-        rg_props = await hub.exec.azurerm.resource.group.get(
-            resource_group, **kwargs
-        )
+        location = await hub.exec.azurerm.resource.group.get_location(resource_group, **kwargs)
 
-        if 'error' in rg_props:
+        if not location:
             log.error(
                 'Unable to determine location from resource group specified.'
             )
             return False
-        kwargs['location'] = rg_props['location']
+        kwargs['location'] = location
 
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
 
@@ -522,12 +537,12 @@ async def create_or_update(hub, name, resource_group, virtual_network, ip_config
         return result
 
     try:
-        gateway = netconn.virtual_network_gateways.create_or_update(
+        gateway = await hub.exec.utils.azurerm.run_lro(
+            netconn.virtual_network_gateways.create_or_update,
             resource_group_name=resource_group,
             virtual_network_gateway_name=name,
             parameters=gatewaymodel
         )
-        gateway.wait()
         gateway_result = gateway.result()
         result = gateway_result.as_dict()
     except CloudError as exc:
@@ -536,6 +551,8 @@ async def create_or_update(hub, name, resource_group, virtual_network, ip_config
     except SerializationError as exc:
         result = {'error': 'The object model could not be parsed. ({0})'.format(str(exc))}
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
 
 
@@ -556,14 +573,19 @@ async def get(hub, name, resource_group, **kwargs):
         azurerm.network.virtual_network_gateway.get test_name test_group
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'virtualNetworkGateways', name, **kwargs
+    )
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        gateway = netconn.virtual_network_gateways.get(
+        result = await hub.exec.utils.azurerm.cached_get(
+            arm_id,
+            netconn.virtual_network_gateways.get,
             resource_group_name=resource_group,
-            virtual_network_gateway_name=name
+            virtual_network_gateway_name=name,
+            ctx=kwargs.get('ctx'),
+            batch_model='VirtualNetworkGateway'
         )
-
-        result = gateway.as_dict()
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('network', str(exc), **kwargs)
         result = {'error': str(exc)}
@@ -588,18 +610,23 @@ async def delete(hub, name, resource_group, **kwargs):
         azurerm.network.virtual_network_gateway.delete test_name test_group
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'virtualNetworkGateways', name, **kwargs
+    )
     result = False
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        gateway = netconn.virtual_network_gateways.delete(
+        gateway = await hub.exec.utils.azurerm.run_lro(
+            netconn.virtual_network_gateways.delete,
             resource_group_name=resource_group,
             virtual_network_gateway_name=name
         )
-        gateway.wait()
         result = True
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('network', str(exc), **kwargs)
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
 
 
@@ -658,20 +685,25 @@ async def reset(hub, name, resource_group, gateway_vip=None, **kwargs):
         azurerm.network.virtual_network_gateway.reset test_name test_group
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'virtualNetworkGateways', name, **kwargs
+    )
     result = False
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        reset = netconn.virtual_network_gateways.reset(
+        reset = await hub.exec.utils.azurerm.run_lro(
+            netconn.virtual_network_gateways.reset,
             resource_group_name=resource_group,
             virtual_network_gateway_name=name,
             gateway_vip=gateway_vip
         )
-        reset.wait()
         result = True
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('network', str(exc), **kwargs)
         result = {'error': str(exc)}
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
 
 
@@ -695,7 +727,8 @@ async def reset_vpn_client_shared_key(hub, name, resource_group, **kwargs):
     result = {}
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        reset = netconn.virtual_network_gateways.reset_vpn_client_shared_key(
+        reset = await hub.exec.utils.azurerm.run_lro(
+            netconn.virtual_network_gateways.reset_vpn_client_shared_key,
             resource_group_name=resource_group,
             virtual_network_gateway_name=name
         )
@@ -755,7 +788,8 @@ async def generatevpnclientpackage(hub, name, resource_group, processor_architec
         return result
 
     try:
-        pkg = netconn.virtual_network_gateways.generatevpnclientpackage(
+        pkg = await hub.exec.utils.azurerm.run(
+            netconn.virtual_network_gateways.generatevpnclientpackage,
             resource_group_name=resource_group,
             virtual_network_gateway_name=name,
             parameters=pkgmodel,
@@ -818,7 +852,8 @@ async def generate_vpn_profile(hub, name, resource_group, processor_architecture
         return result
 
     try:
-        profile = netconn.virtual_network_gateways.generate_vpn_profile(
+        profile = await hub.exec.utils.azurerm.run(
+            netconn.virtual_network_gateways.generate_vpn_profile,
             resource_group_name=resource_group,
             virtual_network_gateway_name=name,
             parameters=profilemodel,
@@ -855,7 +890,8 @@ async def get_vpn_profile_package_url(hub, name, resource_group, **kwargs):
     '''
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        url = netconn.virtual_network_gateways.get_vpn_profile_package_url(
+        url = await hub.exec.utils.azurerm.run_lro(
+            netconn.virtual_network_gateways.get_vpn_profile_package_url,
             resource_group_name=resource_group,
             virtual_network_gateway_name=name
         )
@@ -890,7 +926,8 @@ async def get_bgp_peer_status(hub, name, resource_group, peer=None, **kwargs):
     result = {}
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        peers = netconn.virtual_network_gateways.get_bgp_peer_status(
+        peers = await hub.exec.utils.azurerm.run_lro(
+            netconn.virtual_network_gateways.get_bgp_peer_status,
             resource_group_name=resource_group,
             virtual_network_gateway_name=name,
             peer=peer
@@ -925,7 +962,8 @@ async def supported_vpn_devices(hub, name, resource_group, **kwargs):
     '''
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        devices = netconn.virtual_network_gateways.supported_vpn_devices(
+        devices = await hub.exec.utils.azurerm.run(
+            netconn.virtual_network_gateways.supported_vpn_devices,
             resource_group_name=resource_group,
             virtual_network_gateway_name=name
         )
@@ -958,7 +996,8 @@ async def get_learned_routes(hub, name, resource_group, **kwargs):
     result = {}
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        routes = netconn.virtual_network_gateways.get_learned_routes(
+        routes = await hub.exec.utils.azurerm.run_lro(
+            netconn.virtual_network_gateways.get_learned_routes,
             resource_group_name=resource_group,
             virtual_network_gateway_name=name
         )
@@ -994,7 +1033,8 @@ async def get_advertised_routes(hub, name, resource_group, peer, **kwargs):
     result = {}
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        routes = netconn.virtual_network_gateways.get_advertised_routes(
+        routes = await hub.exec.utils.azurerm.run_lro(
+            netconn.virtual_network_gateways.get_advertised_routes,
             resource_group_name=resource_group,
             virtual_network_gateway_name=name,
             peer=peer
@@ -1077,7 +1117,8 @@ async def set_vpnclient_ipsec_parameters(hub, name, resource_group, sa_life_time
         return result
 
     try:
-        params = netconn.virtual_network_gateways.set_vpnclient_ipsec_parameters(
+        params = await hub.exec.utils.azurerm.run_lro(
+            netconn.virtual_network_gateways.set_vpnclient_ipsec_parameters,
             resource_group_name=resource_group,
             virtual_network_gateway_name=name,
             vpnclient_ipsec_params=paramsmodel,
@@ -1112,7 +1153,8 @@ async def get_vpnclient_ipsec_parameters(hub, name, resource_group, **kwargs):
     '''
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        policy = netconn.virtual_network_gateways.get_vpnclient_ipsec_parameters(
+        policy = await hub.exec.utils.azurerm.run_lro(
+            netconn.virtual_network_gateways.get_vpnclient_ipsec_parameters,
             resource_group_name=resource_group,
             virtual_network_gateway_name=name
         )
@@ -1165,7 +1207,8 @@ async def vpn_device_configuration_script(hub, name, resource_group, vendor, dev
         return result
 
     try:
-        script = netconn.virtual_network_gateways.vpn_device_configuration_script(
+        script = await hub.exec.utils.azurerm.run(
+            netconn.virtual_network_gateways.vpn_device_configuration_script,
             resource_group_name=resource_group,
             virtual_network_gateway_connection_name=name,
             parameters=scriptmodel,
@@ -126,19 +126,24 @@ async def delete(hub, name, virtual_network, resource_group, **kwargs):
         azurerm.network.virtual_network_peering.delete peer1 testnet testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'virtualNetworks', virtual_network, 'virtualNetworkPeerings', name, **kwargs
+    )
     result = False
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        peering = netconn.virtual_network_peerings.delete(
+        peering = await hub.exec.utils.azurerm.run_lro(
+            netconn.virtual_network_peerings.delete,
             resource_group_name=resource_group,
             virtual_network_name=virtual_network,
             virtual_network_peering_name=name
         )
-        peering.wait()
         result = True
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('network', str(exc), **kwargs)
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
 
 
@@ -163,15 +168,20 @@ async def get(hub, name, virtual_network, resource_group, **kwargs):
         azurerm.network.virtual_network_peering.get peer1 testnet testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'virtualNetworks', virtual_network, 'virtualNetworkPeerings', name, **kwargs
+    )
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
     try:
-        peering = netconn.virtual_network_peerings.get(
+        result = await hub.exec.utils.azurerm.cached_get(
+            arm_id,
+            netconn.virtual_network_peerings.get,
             resource_group_name=resource_group,
             virtual_network_name=virtual_network,
-            virtual_network_peering_name=name
+            virtual_network_peering_name=name,
+            ctx=kwargs.get('ctx'),
+            batch_model='VirtualNetworkPeering'
         )
-
-        result = peering.as_dict()
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('network', str(exc), **kwargs)
         result = {'error': str(exc)}
@@ -207,6 +217,9 @@ async def create_or_update(hub, name, remote_virtual_network, virtual_network, r
                   remotenet testnet testgroup remote_vnet_group=remotegroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(
+        resource_group, 'Microsoft.Network', 'virtualNetworks', virtual_network, 'virtualNetworkPeerings', name, **kwargs
+    )
     netconn = await hub.exec.utils.azurerm.get_client('network', **kwargs)
 
     # Use Remote Virtual Network name to link to the ID of an existing object
@@ -230,13 +243,13 @@ async def create_or_update(hub, name, remote_virtual_network, virtual_network, r
         return result
 
     try:
-        peering = netconn.virtual_network_peerings.create_or_update(
+        peering = await hub.exec.utils.azurerm.run_lro(
+            netconn.virtual_network_peerings.create_or_update,
             resource_group_name=resource_group,
             virtual_network_name=virtual_network,
             virtual_network_peering_name=name,
             virtual_network_peering_parameters=peermodel
         )
-        peering.wait()
         peer_result = peering.result()
         result = peer_result.as_dict()
     except CloudError as exc:
@@ -245,4 +258,6 @@ async def create_or_update(hub, name, remote_virtual_network, virtual_network, r
     except SerializationError as exc:
         result = {'error': 'The object model could not be parsed. ({0})'.format(str(exc))}
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
@@ -86,7 +86,8 @@ async def operation_get(hub, operation, deployment, resource_group, **kwargs):
     '''
     resconn = await hub.exec.utils.azurerm.get_client('resource', **kwargs)
     try:
-        operation = resconn.deployment_operations.get(
+        operation = await hub.exec.utils.azurerm.run(
+            resconn.deployment_operations.get,
             resource_group_name=resource_group,
             deployment_name=deployment,
             operation_id=operation
@@ -162,11 +163,11 @@ async def delete(hub, name, resource_group, **kwargs):
     result = False
     resconn = await hub.exec.utils.azurerm.get_client('resource', **kwargs)
     try:
-        deploy = resconn.deployments.delete(
+        deploy = await hub.exec.utils.azurerm.run_lro(
+            resconn.deployments.delete,
             deployment_name=name,
             resource_group_name=resource_group
         )
-        deploy.wait()
         result = True
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('resource', str(exc), **kwargs)
@@ -195,7 +196,8 @@ async def check_existence(hub, name, resource_group, **kwargs):
     result = False
     resconn = await hub.exec.utils.azurerm.get_client('resource', **kwargs)
     try:
-        result = resconn.deployments.check_existence(
+        result = await hub.exec.utils.azurerm.run(
+            resconn.deployments.check_existence,
             deployment_name=name,
             resource_group_name=resource_group
         )
@@ -296,12 +298,12 @@ async def create_or_update(hub, name, resource_group, deploy_mode='incremental',
         if 'error' in validate:
             result = validate
         else:
-            deploy = resconn.deployments.create_or_update(
+            deploy = await hub.exec.utils.azurerm.run_lro(
+                resconn.deployments.create_or_update,
                 deployment_name=name,
                 resource_group_name=resource_group,
                 properties=deploy_model
             )
-            deploy.wait()
             deploy_result = deploy.result()
             result = deploy_result.as_dict()
     except CloudError as exc:
@@ -333,7 +335,8 @@ async def get(hub, name, resource_group, **kwargs):
     '''
     resconn = await hub.exec.utils.azurerm.get_client('resource', **kwargs)
     try:
-        deploy = resconn.deployments.get(
+        deploy = await hub.exec.utils.azurerm.run(
+            resconn.deployments.get,
             deployment_name=name,
             resource_group_name=resource_group
         )
@@ -365,7 +368,8 @@ async def cancel(hub, name, resource_group, **kwargs):
     '''
     resconn = await hub.exec.utils.azurerm.get_client('resource', **kwargs)
     try:
-        resconn.deployments.cancel(
+        await hub.exec.utils.azurerm.run(
+            resconn.deployments.cancel,
             deployment_name=name,
             resource_group_name=resource_group
         )
@@ -468,7 +472,8 @@ async def validate(hub, name, resource_group, deploy_mode=None,
         if local_validation:
             raise local_validation[0]
 
-        deploy = resconn.deployments.validate(
+        deploy = await hub.exec.utils.azurerm.run(
+            resconn.deployments.validate,
             deployment_name=name,
             resource_group_name=resource_group,
             properties=deploy_model
@@ -503,7 +508,8 @@ async def export_template(hub, name, resource_group, **kwargs):
     '''
     resconn = await hub.exec.utils.azurerm.get_client('resource', **kwargs)
     try:
-        deploy = resconn.deployments.export_template(
+        deploy = await hub.exec.utils.azurerm.run(
+            resconn.deployments.export_template,
             deployment_name=name,
             resource_group_name=resource_group
         )
@@ -49,7 +49,9 @@ Azure Resource Manager (ARM) Resource Group Execution Module
 # Python libs
 from __future__ import absolute_import
 from json import loads, dumps
+import asyncio
 import logging
+import time
 
 # Azure libs
 HAS_LIBS = False
@@ -64,12 +66,24 @@ except ImportError:
 log = logging.getLogger(__name__)
 
 
-async def list_(hub, **kwargs):
+def __init__(hub):
+    '''
+    Set up the resource group location index
+    '''
+    hub.exec.azurerm.resource.group.LOCATIONS = {}
+
+
+async def list_(hub, stream=False, limit=None, **kwargs):
     '''
     .. versionadded:: 1.0.0
 
     List all resource groups within a subscription.
 
+    :param stream: If True, return an asynchronous generator which yields each item as its page is retrieved,
+        instead of a dictionary keyed by name. Errors are raised to the consumer while iterating.
+
+    :param limit: The maximum number of items to yield when streaming.
+
     CLI Example:
 
     .. code-block:: bash
@@ -79,6 +93,9 @@ async def list_(hub, **kwargs):
     '''
     result = {}
     resconn = await hub.exec.utils.azurerm.get_client('resource', **kwargs)
+    if stream:
+        return hub.exec.utils.azurerm.paged_object_to_iter(resconn.resource_groups.list(), limit=limit)
+
     try:
         groups = await hub.exec.utils.azurerm.paged_object_to_list(resconn.resource_groups.list())
 
@@ -109,7 +126,7 @@ async def check_existence(hub, name, **kwargs):
     result = False
     resconn = await hub.exec.utils.azurerm.get_client('resource', **kwargs)
     try:
-        result = resconn.resource_groups.check_existence(name)
+        result = await hub.exec.utils.azurerm.run(resconn.resource_groups.check_existence, name)
 
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('resource', str(exc), **kwargs)
@@ -132,11 +149,13 @@ async def get(hub, name, **kwargs):
         azurerm.resource.group.get testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(name, **kwargs)
     result = {}
     resconn = await hub.exec.utils.azurerm.get_client('resource', **kwargs)
     try:
-        group = resconn.resource_groups.get(name)
-        result = group.as_dict()
+        result = await hub.exec.utils.azurerm.cached_get(
+            arm_id, resconn.resource_groups.get, name, ctx=kwargs.get('ctx'), batch_model='ResourceGroup'
+        )
 
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('resource', str(exc), **kwargs)
@@ -145,6 +164,54 @@ async def get(hub, name, **kwargs):
     return result
 
 
+async def get_location(hub, name, **kwargs):
+    '''
+    .. versionadded:: 1.0.0
+
+    Get the location of a resource group. Locations are answered from a subscription-wide index which is filled
+    by a single list call and refreshed when it is older than ``azurerm_location_index_ttl`` seconds or does not
+    contain the requested resource group. A resource group which is still missing after a refresh is remembered as
+    missing for the same number of seconds. Returns None if the location cannot be determined.
+
+    :param name: The resource group name to look up.
+
+    CLI Example:
+
+    .. code-block:: bash
+
+        azurerm.resource.group.get_location testgroup
+
+    '''
+    indexes = hub.exec.azurerm.resource.group.LOCATIONS
+    subscription_id = str(kwargs.get('subscription_id'))
+    if subscription_id not in indexes:
+        indexes[subscription_id] = {'locations': {}, 'misses': {}, 'refreshed': None, 'lock': asyncio.Lock()}
+    index = indexes[subscription_id]
+    ttl = await hub.exec.utils.azurerm.get_opt('azurerm_location_index_ttl', 300)
+    key = name.lower()
+
+    async with index['lock']:
+        now = time.monotonic()
+        stale = index['refreshed'] is None or now - index['refreshed'] > ttl
+        missed = index['misses'].get(key)
+        if not stale and (key in index['locations'] or (missed is not None and now - missed <= ttl)):
+            return index['locations'].get(key)
+
+        resconn = await hub.exec.utils.azurerm.get_client('resource', **kwargs)
+        try:
+            groups = await hub.exec.utils.azurerm.paged_object_to_list(resconn.resource_groups.list())
+        except CloudError as exc:
+            await hub.exec.utils.azurerm.log_cloud_error('resource', str(exc), **kwargs)
+            return None
+        index['locations'] = dict((group['name'].lower(), group['location']) for group in groups)
+        index['refreshed'] = time.monotonic()
+        index['misses'] = {}
+        if key not in index['locations']:
+            index['misses'][key] = index['refreshed']
+
+    return index['locations'].get(key)
+
+
 async def create_or_update(hub, name, location, **kwargs):
     '''
     .. versionadded:: 1.0.0
@@ -163,6 +230,7 @@ async def create_or_update(hub, name, location, **kwargs):
         azurerm.resource.group.create_or_update testgroup westus
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(name, **kwargs)
     result = {}
     resconn = await hub.exec.utils.azurerm.get_client('resource', **kwargs)
     resource_group_params = {
@@ -171,12 +239,18 @@ async def create_or_update(hub, name, location, **kwargs):
         'tags': kwargs.get('tags'),
     }
     try:
-        group = resconn.resource_groups.create_or_update(name, resource_group_params)
+        group = await hub.exec.utils.azurerm.run(resconn.resource_groups.create_or_update, name, resource_group_params)
         result = group.as_dict()
+        index = hub.exec.azurerm.resource.group.LOCATIONS.get(str(kwargs.get('subscription_id')))
+        if index:
+            index['locations'][name.lower()] = result['location']
+            index['misses'].pop(name.lower(), None)
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('resource', str(exc), **kwargs)
         result = {'error': str(exc)}
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
 
 
@@ -195,13 +269,18 @@ async def delete(hub, name, **kwargs):
         azurerm.resource.group.delete testgroup
 
     '''
+    arm_id = await hub.exec.utils.azurerm.resource_id(name, **kwargs)
     result = False
     resconn = await hub.exec.utils.azurerm.get_client('resource', **kwargs)
     try:
-        group = resconn.resource_groups.delete(name)
-        group.wait()
+        group = await hub.exec.utils.azurerm.run_lro(resconn.resource_groups.delete, name)
         result = True
+        index = hub.exec.azurerm.resource.group.LOCATIONS.get(str(kwargs.get('subscription_id')))
+        if index:
+            index['locations'].pop(name.lower(), None)
     except CloudError as exc:
         await hub.exec.utils.azurerm.log_cloud_error('resource', str(exc), **kwargs)
 
+    await hub.exec.utils.azurerm.cache_invalidate(arm_id)
+
     return result
@@ -104,7 +104,8 @@ async def create_or_update_at_resource_group_level(hub, name, resource_group, lo
         return result
 
     try:
-        lock = lckconn.management_locks.create_or_update_at_resource_group_level(
+        lock = await hub.exec.utils.azurerm.run(
+            lckconn.management_locks.create_or_update_at_resource_group_level,
             resource_group_name=resource_group,
             lock_name=name,
             parameters=lockmodel
@@ -142,7 +143,8 @@ async def delete_at_resource_group_level(hub, name, resource_group, **kwargs):
     lckconn = await hub.exec.utils.azurerm.get_client('managementlock', **kwargs)
 
     try:
-        lock = lckconn.management_locks.delete_at_resource_group_level(
+        lock = await hub.exec.utils.azurerm.run(
+            lckconn.management_locks.delete_at_resource_group_level,
             resource_group_name=resource_group,
             lock_name=name,
             **kwargs
@@ -177,7 +179,8 @@ async def get_at_resource_group_level(hub, name, resource_group, **kwargs):
     lckconn = await hub.exec.utils.azurerm.get_client('managementlock', **kwargs)
 
     try:
-        lock = lckconn.management_locks.get_at_resource_group_level(
+        lock = await hub.exec.utils.azurerm.run(
+            lckconn.management_locks.get_at_resource_group_level,
             resource_group_name=resource_group,
             lock_name=name,
             **kwargs
@@ -234,7 +237,8 @@ async def create_or_update_by_scope(hub, name, scope, lock_level, **kwargs):
         return result
 
     try:
-        lock = lckconn.management_locks.create_or_update_by_scope(
+        lock = await hub.exec.utils.azurerm.run(
+            lckconn.management_locks.create_or_update_by_scope,
             scope=scope,
             lock_name=name,
             parameters=lockmodel
@@ -276,7 +280,8 @@ async def delete_by_scope(hub, name, scope, **kwargs):
     lckconn = await hub.exec.utils.azurerm.get_client('managementlock', **kwargs)
 
     try:
-        lock = lckconn.management_locks.delete_by_scope(
+        lock = await hub.exec.utils.azurerm.run(
+            lckconn.management_locks.delete_by_scope,
             scope=scope,
             lock_name=name,
             **kwargs
@@ -315,7 +320,8 @@ async def get_by_scope(hub, name, scope, **kwargs):
     lckconn = await hub.exec.utils.azurerm.get_client('managementlock', **kwargs)
 
     try:
-        lock = lckconn.management_locks.get_by_scope(
+        lock = await hub.exec.utils.azurerm.run(
+            lckconn.management_locks.get_by_scope,
             scope=scope,
             lock_name=name,
             **kwargs
@@ -382,7 +388,8 @@ async def create_or_update_at_resource_level(hub, name, lock_level, resource_gro
         parent_resource_path = ''
 
     try:
-        lock = lckconn.management_locks.create_or_update_at_resource_level(
+        lock = await hub.exec.utils.azurerm.run(
+            lckconn.management_locks.create_or_update_at_resource_level,
             resource_group_name=resource_group,
             lock_name=name,
             resource_name=resource,
@@ -438,7 +445,8 @@ async def delete_at_resource_level(hub, name, resource_group, resource, resource
         parent_resource_path = ''
 
     try:
-        lock = lckconn.management_locks.delete_at_resource_level(
+        lock = await hub.exec.utils.azurerm.run(
+            lckconn.management_locks.delete_at_resource_level,
             lock_name=name,
             resource_group_name=resource_group,
             resource_name=resource,
@@ -490,7 +498,8 @@ async def get_at_resource_level(hub, name, resource_group, resource, resource_ty
         parent_resource_path = ''
 
     try:
-        lock = lckconn.management_locks.get_at_resource_level(
+        lock = await hub.exec.utils.azurerm.run(
+            lckconn.management_locks.get_at_resource_level,
             lock_name=name,
             resource_group_name=resource_group,
             resource_name=resource,
@@ -545,7 +554,8 @@ async def create_or_update_at_subscription_level(hub, name, lock_level, **kwargs
         return result
 
     try:
-        lock = lckconn.management_locks.create_or_update_at_subscription_level(
+        lock = await hub.exec.utils.azurerm.run(
+            lckconn.management_locks.create_or_update_at_subscription_level,
             lock_name=name,
             parameters=lockmodel
         )
@@ -580,7 +590,8 @@ async def delete_at_subscription_level(hub, name, **kwargs):
     lckconn = await hub.exec.utils.azurerm.get_client('managementlock', **kwargs)
 
     try:
-        lock = lckconn.management_locks.delete_at_subscription_level(
+        lock = await hub.exec.utils.azurerm.run(
+            lckconn.management_locks.delete_at_subscription_level,
             lock_name=name,
             **kwargs
         )
@@ -612,7 +623,8 @@ async def get_at_subscription_level(hub, name, **kwargs):
     lckconn = await hub.exec.utils.azurerm.get_client('managementlock', **kwargs)
 
     try:
-        lock = lckconn.management_locks.get_at_subscription_level(
+        lock = await hub.exec.utils.azurerm.run(
+            lckconn.management_locks.get_at_subscription_level,
             lock_name=name,
             **kwargs
         )
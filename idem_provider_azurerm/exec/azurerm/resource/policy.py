@@ -86,7 +86,8 @@ async def assignment_delete(hub, name, scope, **kwargs):
     polconn = await hub.exec.utils.azurerm.get_client('policy', **kwargs)
     try:
         # pylint: disable=unused-variable
-        policy = polconn.policy_assignments.delete(
+        policy = await hub.exec.utils.azurerm.run(
+            polconn.policy_assignments.delete,
             policy_assignment_name=name,
             scope=scope
         )
@@ -158,7 +159,8 @@ async def assignment_create(hub, name, scope, definition_name, **kwargs):
             return result
 
         try:
-            policy = polconn.policy_assignments.create(
+            policy = await hub.exec.utils.azurerm.run(
+                polconn.policy_assignments.create,
                 scope=scope,
                 policy_assignment_name=name,
                 parameters=policy_model
@@ -195,7 +197,8 @@ async def assignment_get(hub, name, scope, **kwargs):
     '''
     polconn = await hub.exec.utils.azurerm.get_client('policy', **kwargs)
     try:
-        policy = polconn.policy_assignments.get(
+        policy = await hub.exec.utils.azurerm.run(
+            polconn.policy_assignments.get,
             policy_assignment_name=name,
             scope=scope
         )
@@ -309,7 +312,8 @@ async def definition_create_or_update(hub, name, policy_rule, **kwargs):  # pyli
         return result
 
     try:
-        policy = polconn.policy_definitions.create_or_update(
+        policy = await hub.exec.utils.azurerm.run(
+            polconn.policy_definitions.create_or_update,
             policy_definition_name=name,
             parameters=policy_model
         )
@@ -342,7 +346,8 @@ async def definition_delete(hub, name, **kwargs):
     polconn = await hub.exec.utils.azurerm.get_client('policy', **kwargs)
     try:
         # pylint: disable=unused-variable
-        policy = polconn.policy_definitions.delete(
+        policy = await hub.exec.utils.azurerm.run(
+            polconn.policy_definitions.delete,
             policy_definition_name=name
         )
         result = True
@@ -369,7 +374,8 @@ async def definition_get(hub, name, **kwargs):
     '''
     polconn = await hub.exec.utils.azurerm.get_client('policy', **kwargs)
     try:
-        policy_def = polconn.policy_definitions.get(
+        policy_def = await hub.exec.utils.azurerm.run(
+            polconn.policy_definitions.get,
             policy_definition_name=name
         )
         result = policy_def.as_dict()
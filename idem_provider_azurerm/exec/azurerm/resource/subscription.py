@@ -127,7 +127,8 @@ async def get(hub, subscription_id=None, **kwargs):
 
     subconn = await hub.exec.utils.azurerm.get_client('subscription', **kwargs)
     try:
-        subscription = subconn.subscriptions.get(
+        subscription = await hub.exec.utils.azurerm.run(
+            subconn.subscriptions.get,
             subscription_id=kwargs.get('subscription_id')
         )
 
@@ -22,10 +22,23 @@ Azure (ARM) Utilities
 '''
 # Import Python libs
 from __future__ import absolute_import, print_function, unicode_literals
-from operator import itemgetter
+import asyncio
+import collections
+import concurrent.futures
+import copy
+import functools
+import hashlib
+import http
 import importlib
+import json
 import logging
+import os
+import random
+import re
 import sys
+import tempfile
+import threading
+import time
 
 # Import Salt libs
 #import salt.config
@@ -48,19 +61,69 @@ try:
         ServicePrincipalCredentials,
     )
     from msrestazure.azure_cloud import (
+        Cloud,
+        CloudEndpoints,
+        CloudSuffixes,
         MetadataEndpointError,
         get_cloud_from_metadata_endpoint,
     )
+    from msrest.authentication import BasicTokenAuthentication
+    from msrest.paging import Paged
+    from msrest.polling import LROPoller
     from msrestazure.azure_exceptions import CloudError
+    from msrestazure.azure_operation import AzureOperationPoller
+    from msrestazure.polling.arm_polling import (
+        ARMPolling,
+        BadResponse,
+        BadStatus,
+    )
+    import requests
+    # Results which hold state of their own, such as the position of a pager, and must not be handed to two callers
+    STATEFUL_RESULTS = (Paged, LROPoller, AzureOperationPoller)
     HAS_AZURE = True
 except ImportError:
+    ARMPolling = object
+    STATEFUL_RESULTS = ()
     HAS_AZURE = False
 
+try:
+    from azure.mgmt.resourcegraph.models import (
+        ErrorResponseException,
+        QueryRequest,
+        QueryRequestOptions,
+    )
+    HAS_RESOURCE_GRAPH = True
+except ImportError:
+    HAS_RESOURCE_GRAPH = False
+
 #__opts__ = salt.config.minion_config('/etc/salt/minion')
 #__salt__ = salt.loader.minion_mods(__opts__)
 
 log = logging.getLogger(__name__)
 
+AUTH_KWARGS = ['client_id', 'secret', 'tenant', 'username', 'password', 'access_token']
+
+READ_OPERATION_PREFIXES = ('get', 'list', 'check')
+
+# Reads which fetch their result when called. List operations only build a pager, so there is nothing to share.
+COALESCED_OPERATION_PREFIXES = ('get', 'check')
+
+SUBSCRIPTION_RE = re.compile(r'/subscriptions/([^/?]+)', re.IGNORECASE)
+
+BATCH_API_VERSION = '2020-06-01'
+
+BATCH_MAX_REQUESTS = 20
+
+BATCH_MAX_POLLS = 30
+
+RESOURCE_GRAPH_MAX_SUBSCRIPTIONS = 1000
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+METRICS_WRITE_INTERVAL = 10
+
+_CALL_CONTEXT = threading.local()
+
 
 #def __virtual__():
 #    if not HAS_AZURE:
@@ -69,7 +132,522 @@ log = logging.getLogger(__name__)
 #        return True
 
 
-async def _determine_auth(**kwargs):
+def __init__(hub):
+    '''
+    Set up the pool of reusable management clients
+    '''
+    hub.exec.utils.azurerm.CLIENT_POOL = collections.OrderedDict()
+    hub.exec.utils.azurerm.CLIENT_POOL_STATS = {'hits': 0, 'misses': 0, 'evictions': 0}
+    hub.exec.utils.azurerm.TOKEN_CACHE = {}
+    hub.exec.utils.azurerm.CLOUD_CACHE = {}
+    hub.exec.utils.azurerm.EXECUTOR = None
+    hub.exec.utils.azurerm.SUBSCRIPTION_SEMAPHORES = {}
+    hub.exec.utils.azurerm.MODEL_PLANS = {}
+    hub.exec.utils.azurerm.RATE_LIMITS = {}
+    hub.exec.utils.azurerm.INFLIGHT = {}
+    hub.exec.utils.azurerm.INFLIGHT_STATS = {'coalesced': 0}
+    hub.exec.utils.azurerm.GET_CACHE = collections.OrderedDict()
+    hub.exec.utils.azurerm.GET_CACHE_STATS = {'hits': 0, 'misses': 0, 'invalidations': 0, 'not_modified': 0}
+    hub.exec.utils.azurerm.ETAGS = collections.OrderedDict()
+    hub.exec.utils.azurerm.API_VERSIONS = {}
+    hub.exec.utils.azurerm.METRICS = {}
+    hub.exec.utils.azurerm.METRICS_WRITTEN = 0
+    hub.exec.utils.azurerm.BATCHES = {}
+    hub.exec.utils.azurerm.BATCH_STATS = {'requests': 0, 'batches': 0}
+
+
+def _get_opt(hub, name, default):
+    '''
+    Return a configuration option from the idem namespace, falling back to the default
+    '''
+    try:
+        value = hub.OPT['idem'][name]
+    except (AttributeError, KeyError, TypeError):
+        value = None
+
+    return default if value is None else value
+
+
+def _executor(hub):
+    '''
+    Return the shared thread pool used to run blocking Azure SDK calls, creating it on first use
+    '''
+    if hub.exec.utils.azurerm.EXECUTOR is None:
+        hub.exec.utils.azurerm.EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+            max_workers=_get_opt(hub, 'azurerm_executor_threads', 32),
+            thread_name_prefix='azurerm'
+        )
+
+    return hub.exec.utils.azurerm.EXECUTOR
+
+
+def _subscription_semaphore(hub, subscription_id):
+    '''
+    Return the semaphore capping concurrent SDK calls against a subscription. Subscription IDs are compared case
+    insensitively, as ARM does. Calls whose subscription cannot be determined share a single semaphore.
+    '''
+    semaphores = hub.exec.utils.azurerm.SUBSCRIPTION_SEMAPHORES
+    if subscription_id is not None:
+        subscription_id = str(subscription_id).lower()
+    if subscription_id not in semaphores:
+        semaphores[subscription_id] = asyncio.Semaphore(
+            _get_opt(hub, 'azurerm_subscription_concurrency', 16)
+        )
+
+    return semaphores[subscription_id]
+
+
+def _operation_group_name(operations):
+    '''
+    Return the attribute name an SDK operation group has on its client, such as public_ip_addresses for
+    PublicIPAddressesOperations, or None if operations is not an operation group
+    '''
+    name = type(operations).__name__
+    if not name.endswith('Operations'):
+        return None
+
+    name = name[:-len('Operations')] or 'Operations'
+    # Pluralised acronyms such as VMs are a single word
+    name = re.sub(r'([A-Z]{2,})s(?=[A-Z]|$)', lambda match: match.group(1).title() + 's', name)
+    name = re.sub(r'([A-Z]+)([A-Z][a-z])', r'\1_\2', name)
+
+    return re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', name).lower()
+
+
+def _describe_operation(operations, method, kind=None):
+    '''
+    Describe a call made through an SDK operation group or service client: the client type it belongs to, taken from
+    the azure.mgmt package it was loaded from, the operation name qualified by its operation group, the subscription
+    it runs against, and whether ARM counts it as a read or a write against its throttling limits.
+    '''
+    config = getattr(operations, 'config', None)
+
+    client_type = 'other'
+    for module in (type(operations).__module__, type(config).__module__):
+        if (module or '').startswith('azure.mgmt.'):
+            client_type = module.split('.')[2]
+            break
+
+    group = _operation_group_name(operations) if operations is not None else None
+
+    return {
+        'client_type': client_type,
+        'operation': '{0}.{1}'.format(group, method) if group else method,
+        'subscription_id': getattr(config, 'subscription_id', None),
+        'kind': kind or ('reads' if method.startswith(READ_OPERATION_PREFIXES) else 'writes'),
+    }
+
+
+def _describe_call(func):
+    '''
+    Describe an SDK call from the bound method being run
+    '''
+    return _describe_operation(getattr(func, '__self__', None), getattr(func, '__name__', str(func)))
+
+
+def _describe_pages(paged_object):
+    '''
+    Describe the page fetches of a paged object as the list operation which created it. The SDK builds pagers
+    around a closure defined within the operation, which holds on to the operation group it belongs to.
+    '''
+    command = getattr(paged_object, '_get_next', None)
+
+    operations = None
+    for cell in getattr(command, '__closure__', None) or ():
+        try:
+            value = cell.cell_contents
+        except ValueError:
+            continue
+        if getattr(value, 'config', None) is not None and hasattr(value, '_client'):
+            operations = value
+            break
+
+    qualname = getattr(command, '__qualname__', '')
+    method = qualname.split('.<locals>', 1)[0].rsplit('.', 1)[-1] if '.<locals>' in qualname else 'list'
+
+    return _describe_operation(operations, method, kind='reads')
+
+
+def _describe_polls(poller):
+    '''
+    Describe the status checks of a long-running operation as polls of the operation which started it. ARM counts
+    them as reads against the subscription the operation runs in.
+    '''
+    polling = getattr(poller, '_polling_method', None)
+    operation = getattr(polling, 'operation', None) or _describe_operation(getattr(polling, '_client', None), 'lro')
+
+    return dict(operation, operation='{0}.poll'.format(operation['operation']), kind='reads')
+
+
+def _record_rate_limits(hub, response):
+    '''
+    Store the remaining subscription read and write budget reported by ARM in a response
+    '''
+    match = SUBSCRIPTION_RE.search(getattr(response.request, 'url', None) or '')
+    if not match:
+        return
+
+    budget = {}
+    for kind in ('reads', 'writes'):
+        remaining = response.headers.get('x-ms-ratelimit-remaining-subscription-{0}'.format(kind))
+        if remaining is not None:
+            try:
+                budget[kind] = int(remaining)
+            except ValueError:
+                pass
+
+    if budget:
+        budget['updated'] = time.time()
+        hub.exec.utils.azurerm.RATE_LIMITS.setdefault(match.group(1).lower(), {}).update(budget)
+
+
+def _on_response(hub, response, *args, **kwargs):  # pylint: disable=unused-argument
+    '''
+    Requests response hook installed on every management client
+    '''
+    try:
+        _record_rate_limits(hub, response)
+    except Exception as exc:  # pylint: disable=broad-except
+        log.debug('Unable to record Azure rate limit headers: %s', exc)
+
+    call = getattr(_CALL_CONTEXT, 'call', None)
+    if call is not None:
+        call['status'] = response.status_code
+        try:
+            call['bytes'] += int(response.headers.get('content-length', 0))
+        except ValueError:
+            pass
+
+
+def _instrument_client(hub, client):
+    '''
+    Attach the response hook to every request a management client sends
+    '''
+    previous_callback = getattr(client.config, 'session_configuration_callback', None)
+    hook = functools.partial(_on_response, hub)
+
+    def _session_callback(session, global_config, local_config, **kwargs):
+        if previous_callback:
+            kwargs = previous_callback(session, global_config, local_config, **kwargs)
+        hooks = dict(kwargs.get('hooks') or {})
+        hooks['response'] = list(hooks.get('response') or []) + [hook]
+        kwargs['hooks'] = hooks
+        return kwargs
+
+    client.config.session_configuration_callback = _session_callback
+
+
+async def _throttle(hub, subscription_id, kind):
+    '''
+    Slow down before ARM throttles us. The delay grows as the remaining budget for the subscription falls below the
+    configured threshold, reaching ``azurerm_throttle_max_delay`` when the budget is exhausted.
+    '''
+    if subscription_id is None:
+        return
+
+    remaining = hub.exec.utils.azurerm.RATE_LIMITS.get(str(subscription_id).lower(), {}).get(kind)
+    threshold = _get_opt(hub, 'azurerm_throttle_{0}_threshold'.format(kind[:-1]), 500 if kind == 'reads' else 100)
+    if remaining is None or remaining >= threshold:
+        return
+
+    delay = _get_opt(hub, 'azurerm_throttle_max_delay', 30) * (threshold - max(remaining, 0)) / float(threshold)
+    log.debug('Azure subscription %s has %s %s remaining, waiting %.2f seconds.', subscription_id, remaining, kind, delay)
+    await asyncio.sleep(delay)
+
+
+def _retry_delay(hub, exc, attempt):
+    '''
+    Return the number of seconds to wait before retrying a throttled request, honouring Retry-After
+    '''
+    try:
+        return float(exc.response.headers['retry-after'])
+    except (AttributeError, KeyError, TypeError, ValueError):
+        delay = min(2 ** attempt, _get_opt(hub, 'azurerm_throttle_max_delay', 30))
+        return random.uniform(delay * 0.5, delay)
+
+
+def _next_page(paged_object):
+    '''
+    Fetch the next page of a paged object, returning None once there are no pages left
+    '''
+    try:
+        return paged_object.advance_page()
+    except StopIteration:
+        return None
+
+
+class _AsyncARMPolling(ARMPolling):
+    '''
+    ARM polling method which hands the polling loop to the event loop instead of a dedicated LROPoller thread.
+    While deferred it reports itself finished so the LROPoller does not start a thread; poll_lro then drives it.
+    '''
+    def __init__(self, *args, **kwargs):
+        super(_AsyncARMPolling, self).__init__(*args, **kwargs)
+        self.deferred = True
+        # Set by run_lro so status checks are attributed to the operation which started them
+        self.operation = None
+
+    def finished(self):
+        if self.deferred:
+            return True
+        return super(_AsyncARMPolling, self).finished()
+
+
+def _lro_delay(hub, polling, attempt):
+    '''
+    Return the number of seconds to sleep before the next status check of a long-running operation. A Retry-After
+    header from the service is honoured, otherwise the delay backs off exponentially. Either way it is jittered so
+    operations started together do not poll in lockstep.
+    '''
+    response = getattr(polling, '_response', None)
+    try:
+        retry_after = float(response.headers['retry-after'])
+    except (AttributeError, KeyError, TypeError, ValueError):
+        retry_after = None
+
+    if retry_after is not None:
+        return retry_after + random.uniform(0, retry_after * 0.1)
+
+    delay = min(
+        _get_opt(hub, 'azurerm_lro_initial_delay', 2) * 2 ** attempt,
+        _get_opt(hub, 'azurerm_lro_max_delay', 30)
+    )
+    return random.uniform(delay * 0.5, delay)
+
+
+def _credential_fingerprint(**kwargs):
+    '''
+    Hash the authentication parameters so secrets are never held in a cache key
+    '''
+    fingerprint = hashlib.sha256()
+    for auth_kwarg in AUTH_KWARGS:
+        fingerprint.update('{0}={1};'.format(auth_kwarg, kwargs.get(auth_kwarg, '')).encode('utf-8'))
+
+    return fingerprint.hexdigest()
+
+
+def _client_pool_key(client_type, **kwargs):
+    '''
+    Build the pool key for a management client
+    '''
+    return (
+        client_type,
+        _credential_fingerprint(**kwargs),
+        str(kwargs.get('subscription_id')),
+        kwargs.get('cloud_environment', 'AZURE_PUBLIC_CLOUD'),
+    )
+
+
+def _close_client(client):
+    '''
+    Release the HTTP session held by a management client
+    '''
+    try:
+        client.close()
+    except AttributeError:
+        pass
+    except Exception as exc:  # pylint: disable=broad-except
+        log.debug('Unable to close pooled Azure client: %s', exc)
+
+
+def _evict_clients(hub):
+    '''
+    Drop pooled clients which have been idle for too long, then trim the pool to its maximum size
+    '''
+    pool = hub.exec.utils.azurerm.CLIENT_POOL
+    stats = hub.exec.utils.azurerm.CLIENT_POOL_STATS
+    idle_timeout = _get_opt(hub, 'azurerm_client_idle_timeout', 300)
+    max_size = _get_opt(hub, 'azurerm_client_pool_size', 32)
+    now = time.monotonic()
+
+    for key in [key for key, (_, last_used) in pool.items() if now - last_used > idle_timeout]:
+        _close_client(pool.pop(key)[0])
+        stats['evictions'] += 1
+
+    while len(pool) > max_size:
+        _close_client(pool.popitem(last=False)[1][0])
+        stats['evictions'] += 1
+
+
+def _token_expiry(credentials):
+    '''
+    Return the epoch time at which the token held by a set of credentials expires
+    '''
+    token = getattr(credentials, 'token', None) or {}
+    try:
+        return float(token['expires_on'])
+    except (KeyError, TypeError, ValueError):
+        pass
+    try:
+        return time.time() + float(token['expires_in'])
+    except (KeyError, TypeError, ValueError):
+        return time.time() + 3600
+
+
+async def _refresh_token(hub, cache_key, credentials):
+    '''
+    Re-acquire the token for cached credentials shortly before it expires, so callers never wait on AAD. Refreshes
+    are at least a tenth of the margin apart, so a token which comes back already within the margin is not
+    requested again in a tight loop.
+    '''
+    loop = asyncio.get_event_loop()
+    margin = _get_opt(hub, 'azurerm_token_refresh_margin', 300)
+
+    while cache_key in hub.exec.utils.azurerm.TOKEN_CACHE:
+        await asyncio.sleep(max(_token_expiry(credentials) - margin - time.time(), margin / 10.0, 1))
+        try:
+            await loop.run_in_executor(_executor(hub), credentials.set_token)
+            log.debug('Refreshed Azure token for tenant %s.', cache_key[0])
+        except Exception as exc:  # pylint: disable=broad-except
+            log.warning('Unable to refresh the Azure token for tenant %s: %s', cache_key[0], exc)
+
+
+async def _get_credentials(hub, cache_key, factory):
+    '''
+    Return cached credentials for the cache key, building them with the factory on a miss. Concurrent callers for
+    the same key share a single in-flight token acquisition.
+    '''
+    cache = hub.exec.utils.azurerm.TOKEN_CACHE
+    loop = asyncio.get_event_loop()
+
+    if cache_key not in cache:
+        def _acquired(future):
+            if future.cancelled() or future.exception():
+                cache.pop(cache_key, None)
+            else:
+                cache[cache_key]['refresh'] = loop.create_task(
+                    _refresh_token(hub, cache_key, future.result())
+                )
+
+        cache[cache_key] = {'credentials': loop.run_in_executor(_executor(hub), factory), 'refresh': None}
+        cache[cache_key]['credentials'].add_done_callback(_acquired)
+
+    return await asyncio.shield(cache[cache_key]['credentials'])
+
+
+async def clear_token_cache(hub):
+    '''
+    Stop background token refreshes and drop every cached set of credentials
+    '''
+    cache = hub.exec.utils.azurerm.TOKEN_CACHE
+    while cache:
+        entry = cache.popitem()[1]
+        if entry['refresh']:
+            entry['refresh'].cancel()
+
+    return True
+
+
+def _cloud_cache_file(hub):
+    '''
+    Return the path of the on-disk cache for clouds resolved from metadata endpoints
+    '''
+    return os.path.join(
+        _get_opt(hub, 'azurerm_cache_dir', os.path.join(os.path.expanduser('~'), '.cache', 'idem_azurerm')),
+        'clouds.json'
+    )
+
+
+def _cloud_to_dict(cloud_env):
+    '''
+    Serialize a Cloud object for the on-disk cache
+    '''
+    return {
+        'name': cloud_env.name,
+        'endpoints': dict(cloud_env.endpoints.__dict__),
+        'suffixes': dict(cloud_env.suffixes.__dict__),
+    }
+
+
+def _cloud_from_dict(data):
+    '''
+    Rebuild a Cloud object from the on-disk cache
+    '''
+    endpoints = CloudEndpoints()
+    endpoints.__dict__.update(data['endpoints'])
+    suffixes = CloudSuffixes()
+    suffixes.__dict__.update(data['suffixes'])
+
+    return Cloud(data['name'], endpoints=endpoints, suffixes=suffixes)
+
+
+def _load_cloud_cache(hub):
+    '''
+    Read unexpired metadata endpoint resolutions from disk
+    '''
+    try:
+        with open(_cloud_cache_file(hub)) as cache_file:
+            cached = json.load(cache_file)
+    except (IOError, OSError, ValueError):
+        return {}
+
+    now = time.time()
+    return {url: data for url, data in cached.items() if data.get('expires', 0) > now}
+
+
+def _save_cloud_cache(hub, cached):
+    '''
+    Write metadata endpoint resolutions to disk. Failures are logged and otherwise ignored.
+    '''
+    cache_file = _cloud_cache_file(hub)
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        tmp_file = '{0}.{1}'.format(cache_file, os.getpid())
+        with open(tmp_file, 'w') as fp_:
+            json.dump(cached, fp_)
+        os.replace(tmp_file, cache_file)
+    except (IOError, OSError, TypeError) as exc:
+        log.debug('Unable to write the Azure cloud cache to %s: %s', cache_file, exc)
+
+
+async def _resolve_cloud(hub, cloud_environment):
+    '''
+    Resolve a cloud environment name or metadata endpoint URL into a Cloud object. Built-in clouds are looked up once
+    per process and metadata endpoints once per TTL window, shared between processes through the on-disk cache.
+    '''
+    cache = hub.exec.utils.azurerm.CLOUD_CACHE
+    now = time.time()
+
+    if cloud_environment in cache and cache[cloud_environment][0] > now:
+        return cache[cloud_environment][1]
+
+    if cloud_environment.startswith('http'):
+        ttl = _get_opt(hub, 'azurerm_cloud_cache_ttl', 86400)
+        cached = _load_cloud_cache(hub)
+        if cloud_environment in cached:
+            cloud_env = _cloud_from_dict(cached[cloud_environment])
+            expires = cached[cloud_environment]['expires']
+        else:
+            loop = asyncio.get_event_loop()
+            cloud_env = await loop.run_in_executor(_executor(hub), get_cloud_from_metadata_endpoint, cloud_environment)
+            expires = now + ttl
+            cached[cloud_environment] = _cloud_to_dict(cloud_env)
+            cached[cloud_environment]['expires'] = expires
+            _save_cloud_cache(hub, cached)
+    else:
+        cloud_env_module = importlib.import_module('msrestazure.azure_cloud')
+        cloud_env = getattr(cloud_env_module, cloud_environment)
+        expires = float('inf')
+
+    cache[cloud_environment] = (expires, cloud_env)
+
+    return cloud_env
+
+
+async def clear_cloud_cache(hub):
+    '''
+    Forget every resolved cloud environment, both in memory and on disk
+    '''
+    hub.exec.utils.azurerm.CLOUD_CACHE.clear()
+    try:
+        os.remove(_cloud_cache_file(hub))
+    except (IOError, OSError):
+        pass
+
+    return True
+
+
+async def _determine_auth(hub, **kwargs):
     '''
     Acquire Azure ARM Credentials
     '''
@@ -81,25 +659,27 @@ async def _determine_auth(**kwargs):
     user_pass_creds_kwargs = ['username', 'password']
 
     try:
-        if kwargs.get('cloud_environment') and kwargs.get('cloud_environment').startswith('http'):
-            cloud_env = get_cloud_from_metadata_endpoint(kwargs['cloud_environment'])
-        else:
-            cloud_env_module = importlib.import_module('msrestazure.azure_cloud')
-            cloud_env = getattr(cloud_env_module, kwargs.get('cloud_environment', 'AZURE_PUBLIC_CLOUD'))
+        cloud_env = await _resolve_cloud(hub, kwargs.get('cloud_environment') or 'AZURE_PUBLIC_CLOUD')
     except (AttributeError, ImportError, MetadataEndpointError):
         raise sys.exit('The Azure cloud environment {0} is not available.'.format(kwargs['cloud_environment']))
 
-    if set(service_principal_creds_kwargs).issubset(kwargs):
+    if kwargs.get('access_token'):
+        credentials = BasicTokenAuthentication({'access_token': kwargs['access_token']})
+    elif set(service_principal_creds_kwargs).issubset(kwargs):
         if not (kwargs['client_id'] and kwargs['secret'] and kwargs['tenant']):
             raise Exception(
                 'The client_id, secret, and tenant parameters must all be '
                 'populated if using service principals.'
             )
         else:
-            credentials = ServicePrincipalCredentials(kwargs['client_id'],
-                                                      kwargs['secret'],
-                                                      tenant=kwargs['tenant'],
-                                                      cloud_environment=cloud_env)
+            credentials = await _get_credentials(
+                hub,
+                (kwargs['tenant'], kwargs['client_id'], cloud_env.name, _credential_fingerprint(**kwargs)),
+                lambda: ServicePrincipalCredentials(kwargs['client_id'],
+                                                    kwargs['secret'],
+                                                    tenant=kwargs['tenant'],
+                                                    cloud_environment=cloud_env)
+            )
     elif set(user_pass_creds_kwargs).issubset(kwargs):
         if not (kwargs['username'] and kwargs['password']):
             raise Exception(
@@ -107,14 +687,18 @@ async def _determine_auth(**kwargs):
                 'populated if using username/password authentication.'
             )
         else:
-            credentials = UserPassCredentials(kwargs['username'],
-                                              kwargs['password'],
-                                              cloud_environment=cloud_env)
+            credentials = await _get_credentials(
+                hub,
+                (kwargs.get('tenant'), kwargs['username'], cloud_env.name, _credential_fingerprint(**kwargs)),
+                lambda: UserPassCredentials(kwargs['username'],
+                                            kwargs['password'],
+                                            cloud_environment=cloud_env)
+            )
     else:
         raise Exception(
             'Unable to determine credentials. '
             'A subscription_id with username and password, '
-            'or client_id, secret, and tenant or a profile with the '
+            'or client_id, secret, and tenant, or an access_token, or a profile with the '
             'required parameters populated'
         )
 
@@ -130,7 +714,8 @@ async def _determine_auth(**kwargs):
 
 async def get_client(hub, client_type, **kwargs):
     '''
-    Dynamically load the selected client and return a management client object
+    Dynamically load the selected client and return a management client object. Clients are pooled on the hub and
+    reused for calls with the same client type, credentials, subscription and cloud environment.
     '''
     client_map = {'compute': 'ComputeManagement',
                   'authorization': 'AuthorizationManagement',
@@ -141,6 +726,7 @@ async def get_client(hub, client_type, **kwargs):
                   'network': 'NetworkManagement',
                   'policy': 'Policy',
                   'resource': 'ResourceManagement',
+                  'resourcegraph': 'ResourceGraph',
                   'subscription': 'Subscription',
                   'web': 'WebSiteManagement'}
 
@@ -150,6 +736,21 @@ async def get_client(hub, client_type, **kwargs):
                 client_type)
         )
 
+    pool = hub.exec.utils.azurerm.CLIENT_POOL
+    stats = hub.exec.utils.azurerm.CLIENT_POOL_STATS
+    pool_key = _client_pool_key(client_type, **kwargs)
+
+    _evict_clients(hub)
+
+    if pool_key in pool:
+        client = pool[pool_key][0]
+        pool[pool_key] = (client, time.monotonic())
+        pool.move_to_end(pool_key)
+        stats['hits'] += 1
+        return client
+
+    stats['misses'] += 1
+
     map_value = client_map[client_type]
 
     if client_type in ['policy', 'subscription']:
@@ -169,9 +770,9 @@ async def get_client(hub, client_type, **kwargs):
                   'The azure {0} client is not available.'.format(client_type)
         )
 
-    credentials, subscription_id, cloud_env = await _determine_auth(**kwargs)
+    credentials, subscription_id, cloud_env = await _determine_auth(hub, **kwargs)
 
-    if client_type == 'subscription':
+    if client_type in ['subscription', 'resourcegraph']:
         client = Client(
             credentials=credentials,
             base_url=cloud_env.endpoints.resource_manager,
@@ -184,10 +785,720 @@ async def get_client(hub, client_type, **kwargs):
         )
 
     client.config.add_user_agent('Salt/{0}'.format('SOMEVERSIONHERE'))
+    _instrument_client(hub, client)
+
+    pool[pool_key] = (client, time.monotonic())
+    _evict_clients(hub)
 
     return client
 
 
+async def client_pool_stats(hub):
+    '''
+    Return the hit, miss and eviction counters for the management client pool along with its current size
+    '''
+    ret = dict(hub.exec.utils.azurerm.CLIENT_POOL_STATS)
+    ret['size'] = len(hub.exec.utils.azurerm.CLIENT_POOL)
+
+    return ret
+
+
+async def clear_client_pool(hub):
+    '''
+    Close and remove every pooled management client
+    '''
+    pool = hub.exec.utils.azurerm.CLIENT_POOL
+    while pool:
+        _close_client(pool.popitem()[1][0])
+
+    return True
+
+
+def _record_metrics(hub, operation, call, elapsed, attempt):
+    '''
+    Add a completed SDK call to the latency histogram for its client type, operation and HTTP status
+    '''
+    key = (operation['client_type'], operation['operation'], str(call['status']))
+    metric = hub.exec.utils.azurerm.METRICS.get(key)
+    if metric is None:
+        metric = {'count': 0, 'latency_sum': 0.0, 'buckets': [0] * len(LATENCY_BUCKETS), 'retries': 0, 'bytes': 0}
+        hub.exec.utils.azurerm.METRICS[key] = metric
+
+    metric['count'] += 1
+    metric['latency_sum'] += elapsed
+    metric['retries'] += attempt
+    metric['bytes'] += call['bytes']
+    for idx, bound in enumerate(LATENCY_BUCKETS):
+        if elapsed <= bound:
+            metric['buckets'][idx] += 1
+
+    path = _get_opt(hub, 'azurerm_metrics_textfile', None)
+    if path and time.monotonic() - hub.exec.utils.azurerm.METRICS_WRITTEN >= METRICS_WRITE_INTERVAL:
+        hub.exec.utils.azurerm.METRICS_WRITTEN = time.monotonic()
+        try:
+            _write_metrics_textfile(hub, path)
+        except (IOError, OSError) as exc:
+            log.warning('Unable to write Azure metrics to %s: %s', path, exc)
+
+
+def _run_tracked(call, func, *args, **kwargs):
+    '''
+    Run an SDK call in the current thread with the record the response hook writes its status and size into
+    '''
+    _CALL_CONTEXT.call = call
+    try:
+        return func(*args, **kwargs)
+    finally:
+        _CALL_CONTEXT.call = None
+
+
+async def _dispatch(hub, func, args, kwargs, operation=None):
+    '''
+    Run a blocking Azure SDK call in the shared thread pool. Calls against the same subscription are capped at
+    ``azurerm_subscription_concurrency`` at a time, are slowed down as the subscription's ARM request budget runs
+    low, and are retried when throttled with a 429 or 503. Every call is recorded in the metrics histograms.
+    operation describes the call, as built by _describe_operation, when it cannot be told from func alone.
+    '''
+    loop = asyncio.get_event_loop()
+    if operation is None:
+        operation = _describe_call(func)
+    subscription_id = operation['subscription_id']
+    kind = operation['kind']
+    attempt = 0
+    call = {'status': None, 'bytes': 0}
+    start = time.monotonic()
+
+    try:
+        while True:
+            await _throttle(hub, subscription_id, kind)
+            call['status'] = None
+            try:
+                async with _subscription_semaphore(hub, subscription_id):
+                    result = await loop.run_in_executor(
+                        _executor(hub), functools.partial(_run_tracked, call, func, *args, **kwargs)
+                    )
+                if call['status'] is None:
+                    call['status'] = 200
+                return result
+            except CloudError as exc:
+                call['status'] = exc.status_code
+                if exc.status_code not in (429, 503) or attempt >= _get_opt(hub, 'azurerm_throttle_max_retries', 5):
+                    raise
+                delay = _retry_delay(hub, exc, attempt)
+                log.warning(
+                    'Azure request %s was throttled (%s), retrying in %.2f seconds.',
+                    getattr(func, '__name__', func), exc.status_code, delay
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+            except Exception:
+                if call['status'] is None or call['status'] < 400:
+                    call['status'] = 'error'
+                raise
+    finally:
+        _record_metrics(hub, operation, call, time.monotonic() - start, attempt)
+
+
+def _coalesce_key(func, args, kwargs):
+    '''
+    Return the key identifying identical concurrent reads, or None if the call must not be shared. Only get and
+    check operations made through an SDK operation group are coalesced. Multi-API clients build a new operation
+    group each time one is looked up, so calls are matched on the client configuration the groups share.
+    '''
+    operations = getattr(func, '__self__', None)
+    config = getattr(operations, 'config', None)
+    if not getattr(func, '__name__', '').startswith(COALESCED_OPERATION_PREFIXES) or config is None:
+        return None
+
+    return (id(config), type(operations), func.__name__, repr(args), repr(sorted(kwargs.items())))
+
+
+async def run(hub, func, *args, **kwargs):
+    '''
+    Run a blocking Azure SDK call without blocking the event loop. Identical get and check calls issued while one
+    is already in flight share that call and its result instead of making another request. A shared call which
+    turns out to return a pager or a poller, as some get operations do, is made again for each later caller, since
+    those results can only be consumed once.
+    '''
+    key = _coalesce_key(func, args, kwargs)
+    if key is None:
+        return await _dispatch(hub, func, args, kwargs)
+
+    inflight = hub.exec.utils.azurerm.INFLIGHT
+    if key not in inflight:
+        call = asyncio.ensure_future(_dispatch(hub, func, args, kwargs))
+        inflight[key] = call
+        call.add_done_callback(lambda done: inflight.pop(key, None) if inflight.get(key) is done else None)
+        return await asyncio.shield(call)
+
+    result = await asyncio.shield(inflight[key])
+    if isinstance(result, STATEFUL_RESULTS):
+        return await _dispatch(hub, func, args, kwargs)
+    hub.exec.utils.azurerm.INFLIGHT_STATS['coalesced'] += 1
+
+    return result
+
+
+def _cache_key(resource_id):
+    '''
+    ARM resource IDs are case insensitive
+    '''
+    return str(resource_id).rstrip('/').lower()
+
+
+def _resource_type(resource_id):
+    '''
+    Return the lowercased namespace and type path of an ARM resource ID, such as
+    ``microsoft.network/virtualnetworks/subnets``, or None for IDs outside of a resource provider
+    '''
+    key = _cache_key(resource_id).split('?', 1)[0]
+    if '/providers/' not in key:
+        return None
+
+    parts = key.rsplit('/providers/', 1)[1].split('/')
+    return '/'.join([parts[0]] + parts[1::2])
+
+
+def _operations_api_version(operations):
+    '''
+    Return the API version an SDK operation group makes its requests with, or None if it cannot be determined. Some
+    operation groups hold it as an attribute, while others only set it within each operation, in which case it is
+    taken from the versioned package the operation group belongs to, such as ``azure.mgmt.network.v2020_04_01``.
+    '''
+    api_version = getattr(operations, 'api_version', None) or \
+        getattr(getattr(operations, 'config', None), 'api_version', None)
+    if api_version or operations is None:
+        return api_version
+
+    match = re.search(r'\.v(\d{4})_(\d{2})_(\d{2})(_preview)?\.', type(operations).__module__)
+    if match is None:
+        return None
+
+    return '{0}-{1}-{2}{3}'.format(match.group(1), match.group(2), match.group(3), '-preview' if match.group(4) else '')
+
+
+def _remember_etag(hub, key, result):
+    '''
+    Remember the ETag and dictionary of a resource that was just read, for the next conditional read of it
+    '''
+    etags = hub.exec.utils.azurerm.ETAGS
+    etag = result.get('etag') if isinstance(result, dict) else None
+    if not etag:
+        etags.pop(key, None)
+        return
+
+    etags[key] = (etag, copy.deepcopy(result))
+    etags.move_to_end(key)
+    max_size = _get_opt(hub, 'azurerm_get_cache_size', 1024)
+    while len(etags) > max_size:
+        etags.popitem(last=False)
+
+
+async def _conditional_get(hub, key, func, args, kwargs):
+    '''
+    Fetch a resource with If-None-Match set to the last ETag seen for it. On a 304, or when an API that ignores
+    conditional reads returns the same ETag, the dictionary parsed for that ETag is reused instead of converting
+    the response again.
+    '''
+    etags = hub.exec.utils.azurerm.ETAGS
+    known = etags.get(key)
+
+    if known:
+        kwargs = dict(kwargs)
+        kwargs['custom_headers'] = dict(kwargs.get('custom_headers') or {}, **{'If-None-Match': known[0]})
+
+    try:
+        resource = await hub.exec.utils.azurerm.run(func, *args, **kwargs)
+    except CloudError as exc:
+        if not known or exc.status_code != 304:
+            raise
+        resource = None
+
+    api_version = _operations_api_version(getattr(func, '__self__', None))
+    if api_version and _resource_type(key):
+        hub.exec.utils.azurerm.API_VERSIONS[_resource_type(key)] = api_version
+
+    etag = getattr(resource, 'etag', None)
+    if known and (resource is None or etag == known[0]):
+        hub.exec.utils.azurerm.GET_CACHE_STATS['not_modified'] += 1
+        etags.move_to_end(key)
+        return copy.deepcopy(known[1])
+
+    result = resource.as_dict()
+    _remember_etag(hub, key, result)
+
+    return result
+
+
+async def cached_get(hub, resource_id, func, *args, ctx=None, batch_model=None, **kwargs):
+    '''
+    Return the dictionary representation of an ARM resource, reading through a cache on the hub keyed by the
+    resource ID. Entries live for ``azurerm_get_cache_ttl`` seconds, and the least recently used are evicted once
+    there are more than ``azurerm_get_cache_size``. On a miss, func is run with the remaining arguments to fetch the
+    resource, conditionally on the last ETag seen for it. A CloudError raised by func is not cached. Callers receive
+    their own copy of the cached dictionary. Resources read are recorded in the inventory, which may be read instead
+    when ctx is the context of a state running in test mode. When ``azurerm_batch_gets`` is enabled, a miss for a
+    resource with no known ETag is read through batch_get instead, deserialized as batch_model. Only pass a
+    batch_model when func reads exactly resource_id, without options such as expand.
+    '''
+    cache = hub.exec.utils.azurerm.GET_CACHE
+    stats = hub.exec.utils.azurerm.GET_CACHE_STATS
+    key = _cache_key(resource_id)
+    now = time.monotonic()
+
+    if key in cache and cache[key][0] > now:
+        cache.move_to_end(key)
+        stats['hits'] += 1
+        return copy.deepcopy(cache[key][1])
+
+    stats['misses'] += 1
+    snapshot = await hub.exec.utils.inventory.test_snapshot(ctx, resource_id)
+    if snapshot is not None:
+        return snapshot
+
+    operations = getattr(func, '__self__', None)
+    if batch_model and key not in hub.exec.utils.azurerm.ETAGS and _get_opt(hub, 'azurerm_batch_gets', False) and \
+            _operations_api_version(operations):
+        result = await hub.exec.utils.azurerm.batch_get(operations, batch_model, resource_id)
+        _remember_etag(hub, key, result)
+    else:
+        result = await _conditional_get(hub, key, func, args, kwargs)
+        await hub.exec.utils.inventory.record([result])
+
+    cache[key] = (now + _get_opt(hub, 'azurerm_get_cache_ttl', 60), copy.deepcopy(result))
+    cache.move_to_end(key)
+    max_size = _get_opt(hub, 'azurerm_get_cache_size', 1024)
+    while len(cache) > max_size:
+        cache.popitem(last=False)
+
+    return result
+
+
+class _ConditionalOperations(object):
+    '''
+    Operation group for reading only the ETag of an ARM resource, shaped like an SDK operation group so the read is
+    throttled and counted against its subscription like any other
+    '''
+    def __init__(self, service_client):
+        self._client = service_client
+        self.config = service_client.config
+
+    def get(self, resource_id, api_version, etag):
+        '''
+        GET a resource with If-None-Match set, returning its current ETag without deserializing the body
+        '''
+        request = self._client.get(str(resource_id).rstrip('/'), {'api-version': api_version})
+        request.headers['If-None-Match'] = etag
+        response = self._client.send(request)
+
+        if response.status_code == 304:
+            return etag
+        if response.status_code != 200:
+            raise CloudError(response)
+
+        return response.headers.get('etag') or response.json().get('etag')
+
+
+async def resource_api_version(hub, resource_id):
+    '''
+    Return the API version last used to read resources of the same type as resource_id, or None if no such
+    resource has been read yet
+    '''
+    return hub.exec.utils.azurerm.API_VERSIONS.get(_resource_type(resource_id))
+
+
+async def etag_unchanged(hub, resource_id, etag, api_version=None, **kwargs):
+    '''
+    Return True if an ARM resource still has the given ETag. The resource is read conditionally, so an unchanged
+    resource costs one request answered without a body, or a body which is not deserialized when the API ignores
+    conditional reads. A resource which cannot be read, including one which no longer exists, counts as changed.
+    '''
+    api_version = api_version or hub.exec.utils.azurerm.API_VERSIONS.get(_resource_type(resource_id))
+    if not (etag and api_version):
+        return False
+
+    resconn = await hub.exec.utils.azurerm.get_client('resource', **kwargs)
+    operations = _ConditionalOperations(resconn.resources._client)  # pylint: disable=protected-access
+
+    try:
+        current = await hub.exec.utils.azurerm.run(operations.get, resource_id, api_version, etag)
+    except CloudError as exc:
+        log.debug('Unable to check the ETag of %s: %s', resource_id, exc)
+        return False
+
+    return current == etag
+
+
+async def cache_invalidate(hub, resource_id):
+    '''
+    Drop the cached copies of an ARM resource after it has been written or deleted. Anything nested beneath the
+    resource is dropped too, as is its parent resource within the same provider, since parents such as virtual
+    networks and security groups embed their child resources.
+    '''
+    cache = hub.exec.utils.azurerm.GET_CACHE
+    key = _cache_key(resource_id)
+
+    related = [key]
+    if '/providers/' in key:
+        provider_path, resource_path = key.split('/providers/', 1)
+        parts = resource_path.split('/')
+        # namespace/type/name followed by any number of child type/name pairs
+        for depth in six_range(3, len(parts) - 1, 2):
+            related.append('{0}/providers/{1}'.format(provider_path, '/'.join(parts[:depth])))
+
+    for cached_key in list(cache):
+        if cached_key in related or cached_key.startswith((key + '/', key + '?')) or \
+                cached_key.split('?', 1)[0] in related:
+            del cache[cached_key]
+            hub.exec.utils.azurerm.GET_CACHE_STATS['invalidations'] += 1
+
+    await hub.exec.utils.inventory.forget(resource_id)
+
+    return True
+
+
+async def clear_cache(hub):
+    '''
+    Drop every cached resource and the ETags remembered for conditional reads
+    '''
+    hub.exec.utils.azurerm.GET_CACHE.clear()
+    hub.exec.utils.azurerm.ETAGS.clear()
+
+    return True
+
+
+async def cache_stats(hub):
+    '''
+    Return the hit, miss, invalidation and not modified counters for the resource cache along with its current size
+    '''
+    ret = dict(hub.exec.utils.azurerm.GET_CACHE_STATS)
+    ret['size'] = len(hub.exec.utils.azurerm.GET_CACHE)
+
+    return ret
+
+
+def _batch_error(name, entry):
+    '''
+    Build a CloudError from a failed response within a batch, so callers see the same exception as a direct read
+    '''
+    response = requests.Response()
+    response.status_code = entry.get('httpStatusCode', 500)
+    try:
+        response.reason = http.HTTPStatus(response.status_code).phrase
+    except ValueError:
+        response.reason = ''
+    response.headers.update(entry.get('headers') or {})
+    response.headers['Content-Type'] = 'application/json'
+    response._content = json.dumps(entry.get('content') or {}).encode('utf-8')  # pylint: disable=protected-access
+    response.url = name
+
+    return CloudError(response)
+
+
+class _BatchOperations(object):
+    '''
+    Operation group for the ARM batch endpoint, shaped like an SDK operation group so batches are throttled and
+    counted against their subscription like any other call
+    '''
+    def __init__(self, service_client):
+        self._client = service_client
+        self.config = service_client.config
+
+    def send(self, body):
+        '''
+        POST a batch to ARM, returning the response, which is a 202 while the batch is still being processed
+        '''
+        request = self._client.post('/batch', {'api-version': BATCH_API_VERSION})
+        request.headers['Content-Type'] = 'application/json; charset=utf-8'
+
+        return self._client.send(request, content=body)
+
+    def status(self, location):
+        '''
+        Check on a batch which is still being processed
+        '''
+        return self._client.send(self._client.get(location))
+
+
+async def _send_batch(hub, batch_ops, body):
+    '''
+    Send a batch of reads, waiting on the event loop between checks on a batch ARM is still processing, and return
+    the responses within it. A batch is a POST but only holds reads, so it is counted as one.
+    '''
+    operation = dict(_describe_operation(batch_ops, 'send', kind='reads'), operation='batch.send')
+    response = await _dispatch(hub, batch_ops.send, (body,), {}, operation)
+
+    polls = 0
+    while response.status_code == 202:
+        if polls >= BATCH_MAX_POLLS:
+            raise CloudError(response, 'The batch did not complete after {0} status checks.'.format(polls))
+        polls += 1
+        await asyncio.sleep(float(response.headers.get('retry-after', 1)))
+        response = await _dispatch(hub, batch_ops.status, (response.headers['location'],), {},
+                                   dict(operation, operation='batch.poll'))
+
+    if response.status_code != 200:
+        raise CloudError(response)
+
+    return response.json().get('responses', [])
+
+
+async def _flush_batch(hub, key, pending, delay):
+    '''
+    Send the reads collected in a pending batch once the collection window has passed. If the batch request itself
+    fails, every waiting caller receives its exception.
+    '''
+    if delay:
+        await asyncio.sleep(delay)
+
+    if hub.exec.utils.azurerm.BATCHES.get(key) is pending:
+        del hub.exec.utils.azurerm.BATCHES[key]
+
+    items = pending['items']
+    body = {'requests': [
+        {'name': str(idx), 'httpMethod': 'GET', 'url': url} for idx, (url, _, _, _) in enumerate(items)
+    ]}
+    hub.exec.utils.azurerm.BATCH_STATS['batches'] += 1
+
+    try:
+        batch_ops = _BatchOperations(items[0][1]._client)  # pylint: disable=protected-access
+        responses = await _send_batch(hub, batch_ops, body)
+    except Exception as exc:  # pylint: disable=broad-except
+        for _, _, _, future in items:
+            if not future.done():
+                future.set_exception(exc)
+        return
+
+    responses = dict((entry.get('name'), entry) for entry in responses)
+    for idx, (url, operations, model, future) in enumerate(items):
+        if future.done():
+            continue
+        entry = responses.get(str(idx))
+        if entry is None:
+            future.set_exception(_batch_error(url, {'httpStatusCode': 500, 'content': {'error': {
+                'code': 'MissingBatchResponse', 'message': 'No response was returned for {0}'.format(url)
+            }}}))
+        elif entry.get('httpStatusCode') != 200:
+            future.set_exception(_batch_error(url, entry))
+        else:
+            try:
+                future.set_result(operations._deserialize(model, entry.get('content')).as_dict())  # pylint: disable=protected-access
+            except Exception as exc:  # pylint: disable=broad-except
+                future.set_exception(exc)
+
+
+async def batch_get(hub, operations, model, resource_id, api_version=None):
+    '''
+    Read an ARM resource through the ARM batch endpoint and return it as a dictionary. Reads made with the same
+    credentials against the same subscription within ``azurerm_batch_window`` seconds of each other are sent in a
+    single batch request of up to 20 reads. operations is the SDK operation group the resource belongs to and model
+    is the name of the model the response is deserialized into. The api_version defaults to the one used by the
+    operation group, then to the one last used to read the same type of resource. A failed read raises CloudError,
+    as the operation group's own get would.
+    '''
+    resource_type = _resource_type(resource_id)
+    api_version = api_version or _operations_api_version(operations) or \
+        hub.exec.utils.azurerm.API_VERSIONS.get(resource_type)
+    if not api_version:
+        raise ValueError('Unable to determine the API version to read {0} with.'.format(resource_id))
+    if resource_type:
+        hub.exec.utils.azurerm.API_VERSIONS[resource_type] = api_version
+
+    url = '{0}?api-version={1}'.format(str(resource_id).rstrip('/'), api_version)
+    key = (
+        str(getattr(operations.config, 'subscription_id', None)).lower(),
+        id(operations.config.credentials),
+    )
+
+    future = asyncio.get_event_loop().create_future()
+    hub.exec.utils.azurerm.BATCH_STATS['requests'] += 1
+
+    batches = hub.exec.utils.azurerm.BATCHES
+    if key not in batches:
+        batches[key] = {'items': []}
+        batches[key]['timer'] = asyncio.ensure_future(
+            _flush_batch(hub, key, batches[key], _get_opt(hub, 'azurerm_batch_window', 0.05))
+        )
+    pending = batches[key]
+    pending['items'].append((url, operations, model, future))
+
+    if len(pending['items']) >= BATCH_MAX_REQUESTS:
+        pending['timer'].cancel()
+        del batches[key]
+        asyncio.ensure_future(_flush_batch(hub, key, pending, 0))
+
+    result = await future
+    await hub.exec.utils.inventory.record([result])
+
+    return result
+
+
+async def batch_stats(hub):
+    '''
+    Return the number of reads made through batch_get and the number of batch requests used to serve them
+    '''
+    return dict(hub.exec.utils.azurerm.BATCH_STATS)
+
+
+async def metrics(hub):
+    '''
+    Return the latency histogram of every SDK call made so far, grouped by client type, operation and HTTP status.
+    Each entry has the call count, total latency in seconds, cumulative counts for each latency bucket, the number
+    of retries and the number of response bytes.
+    '''
+    ret = []
+    for (client_type, operation, status), metric in sorted(hub.exec.utils.azurerm.METRICS.items()):
+        ret.append({
+            'client_type': client_type,
+            'operation': operation,
+            'status': status,
+            'count': metric['count'],
+            'latency_sum': metric['latency_sum'],
+            'latency_buckets': collections.OrderedDict(zip(LATENCY_BUCKETS, metric['buckets'])),
+            'retries': metric['retries'],
+            'response_bytes': metric['bytes'],
+        })
+
+    return ret
+
+
+async def clear_metrics(hub):
+    '''
+    Reset the SDK call metrics
+    '''
+    hub.exec.utils.azurerm.METRICS.clear()
+
+    return True
+
+
+def _write_metrics_textfile(hub, path):
+    '''
+    Write the SDK call metrics in the Prometheus text format, replacing the file atomically so the node exporter
+    textfile collector never reads a partial file
+    '''
+    lines = [
+        '# HELP azurerm_request_duration_seconds Latency of Azure SDK calls, including retries.',
+        '# TYPE azurerm_request_duration_seconds histogram',
+    ]
+    totals = []
+    for (client_type, operation, status), metric in sorted(hub.exec.utils.azurerm.METRICS.items()):
+        labels = 'client_type="{0}",operation="{1}",status="{2}"'.format(client_type, operation, status)
+        for bound, count in zip(LATENCY_BUCKETS, metric['buckets']):
+            lines.append('azurerm_request_duration_seconds_bucket{{{0},le="{1}"}} {2}'.format(labels, bound, count))
+        lines.append('azurerm_request_duration_seconds_bucket{{{0},le="+Inf"}} {1}'.format(labels, metric['count']))
+        lines.append('azurerm_request_duration_seconds_sum{{{0}}} {1}'.format(labels, metric['latency_sum']))
+        lines.append('azurerm_request_duration_seconds_count{{{0}}} {1}'.format(labels, metric['count']))
+        totals.append((labels, metric))
+
+    for name, field, text in (
+            ('azurerm_request_retries_total', 'retries', 'Retries of throttled Azure SDK calls.'),
+            ('azurerm_response_bytes_total', 'bytes', 'Bytes received in Azure SDK responses.')):
+        lines.append('# HELP {0} {1}'.format(name, text))
+        lines.append('# TYPE {0} counter'.format(name))
+        for labels, metric in totals:
+            lines.append('{0}{{{1}}} {2}'.format(name, labels, metric[field]))
+
+    directory = os.path.dirname(os.path.abspath(path))
+    handle, tmp_path = tempfile.mkstemp(dir=directory, prefix='.azurerm_metrics')
+    try:
+        with os.fdopen(handle, 'w') as tmp_file:
+            tmp_file.write('\n'.join(lines) + '\n')
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except Exception:
+        os.remove(tmp_path)
+        raise
+
+
+async def write_metrics_textfile(hub, path=None):
+    '''
+    Write the SDK call metrics to a Prometheus textfile, defaulting to the ``azurerm_metrics_textfile`` option.
+    The file is also refreshed automatically, at most every 10 seconds, when that option is set.
+    '''
+    path = path or _get_opt(hub, 'azurerm_metrics_textfile', None)
+    if not path:
+        return False
+
+    _write_metrics_textfile(hub, path)
+    hub.exec.utils.azurerm.METRICS_WRITTEN = time.monotonic()
+
+    return True
+
+
+async def rate_limit_budget(hub, subscription_id=None):
+    '''
+    Return the most recently reported ARM read and write budget for a subscription, or for every subscription seen
+    so far if no subscription ID is given
+    '''
+    if subscription_id:
+        return dict(hub.exec.utils.azurerm.RATE_LIMITS.get(str(subscription_id).lower(), {}))
+
+    return {sub: dict(budget) for sub, budget in hub.exec.utils.azurerm.RATE_LIMITS.items()}
+
+
+async def poll_lro(hub, poller):
+    '''
+    Wait for a long-running operation to complete, sleeping on the event loop between status checks. Pollers which
+    were not started by run_lro are waited on in the shared thread pool instead.
+    '''
+    polling = getattr(poller, '_polling_method', None)
+    operation = _describe_polls(poller)
+    if not isinstance(polling, _AsyncARMPolling):
+        await _dispatch(hub, poller.wait, (), {}, operation)
+        return poller
+
+    polling.deferred = False
+    attempt = 0
+    try:
+        while not polling.finished():
+            await asyncio.sleep(_lro_delay(hub, polling, attempt))
+            await _dispatch(hub, polling.update_status, (), {}, operation)
+            attempt += 1
+    except BadStatus:
+        polling._operation.status = 'Failed'
+        raise CloudError(polling._response)
+    except BadResponse as exc:
+        polling._operation.status = 'Failed'
+        raise CloudError(polling._response, str(exc))
+
+    # The operation is finished, so this only checks for failure and performs any final GET
+    await _dispatch(hub, polling.run, (), {}, operation)
+
+    return poller
+
+
+async def run_lro(hub, func, *args, **kwargs):
+    '''
+    Start a long-running SDK operation and wait for it to complete without tying up a thread while it is in progress.
+    The returned poller is finished, so calling ``result()`` on it does not block.
+    '''
+    kwargs.setdefault('polling', _AsyncARMPolling())
+    if isinstance(kwargs['polling'], _AsyncARMPolling):
+        kwargs['polling'].operation = _describe_call(func)
+    poller = await hub.exec.utils.azurerm.run(func, *args, **kwargs)
+
+    return await hub.exec.utils.azurerm.poll_lro(poller)
+
+
+async def get_opt(hub, name, default=None):
+    '''
+    Return an Azure provider configuration option from the idem namespace, falling back to the default
+    '''
+    return _get_opt(hub, name, default)
+
+
+async def resource_id(hub, resource_group, *path, **kwargs):
+    '''
+    Return the ARM ID of a resource in the ``subscription_id`` found in kwargs. path is the provider namespace, the
+    resource type and name, then any child type and name pairs; without it the ID of the resource group is returned.
+    '''
+    arm_id = '/subscriptions/{0}/resourceGroups/{1}'.format(kwargs.get('subscription_id'), resource_group)
+    if path:
+        arm_id = '{0}/providers/{1}'.format(arm_id, '/'.join(str(part) for part in path))
+
+    return arm_id
+
+
 async def log_cloud_error(hub, client, message, **kwargs):
     '''
     Log an azurearm cloud error exception
@@ -206,28 +1517,208 @@ async def log_cloud_error(hub, client, message, **kwargs):
     return
 
 
-async def paged_object_to_list(hub, paged_object):
+async def _iter_pages(hub, paged_object, prefetch=0):
     '''
-    Extract all pages within a paged object as a list of dictionaries
+    Asynchronously yield each page of a paged object. With a prefetch count, up to that many following pages are
+    requested in the background while the current page is being consumed.
     '''
-    paged_return = []
-    while True:
+    operation = _describe_pages(paged_object)
+
+    if not prefetch:
+        while True:
+            page = await _dispatch(hub, _next_page, (paged_object,), {}, operation)
+            if page is None:
+                return
+            yield page
+
+    pages = asyncio.Queue(maxsize=prefetch)
+
+    async def _fetch():
         try:
-            page = next(paged_object)
-            paged_return.append(page.as_dict())
-        except CloudError:
-            raise
-        except StopIteration:
-            break
+            while True:
+                page = await _dispatch(hub, _next_page, (paged_object,), {}, operation)
+                await pages.put(page)
+                if page is None:
+                    return
+        except Exception as exc:  # pylint: disable=broad-except
+            await pages.put(exc)
+
+    fetcher = asyncio.ensure_future(_fetch())
+    try:
+        while True:
+            page = await pages.get()
+            if page is None:
+                return
+            if isinstance(page, Exception):
+                raise page
+            yield page
+    finally:
+        fetcher.cancel()
+
+
+async def resource_graph_enabled(hub, backend=None):
+    '''
+    Return True if inventory listings should be answered by Azure Resource Graph. The backend defaults to the
+    ``azurerm_list_backend`` option and falls back to the per-type ARM listing when the Resource Graph client is
+    not installed.
+    '''
+    backend = backend or _get_opt(hub, 'azurerm_list_backend', 'arm')
+    if backend != 'resource_graph':
+        return False
+
+    if not HAS_RESOURCE_GRAPH:
+        log.warning('The azure-mgmt-resourcegraph package is not available, listing resources through ARM instead.')
+        return False
+
+    return True
+
+
+async def resource_graph_list(hub, resource_type, operations, model, subscriptions=None, **kwargs):
+    '''
+    List every resource of an ARM resource type, such as ``Microsoft.Network/publicIPAddresses``, with Azure Resource
+    Graph. Each row is deserialized with the SDK operation group and model name given, so the dictionaries have the
+    same shape as the operation group's own listing. Resources are listed across the subscriptions given, or the
+    subscription of the provider credentials if there are none, and pages are followed with skip tokens. A failed
+    query raises CloudError.
+    '''
+    graphconn = await hub.exec.utils.azurerm.get_client('resourcegraph', **kwargs)
+    if not subscriptions:
+        subscriptions = [kwargs.get('subscription_id')]
+
+    query = "Resources | where type =~ '{0}' | order by id asc".format(resource_type)
+    # Queries are POSTed to a method named resources, so they must be counted as reads explicitly
+    operation = _describe_operation(graphconn, 'resources', kind='reads')
+    rows = []
+    for start in six_range(0, len(subscriptions), RESOURCE_GRAPH_MAX_SUBSCRIPTIONS):
+        skip_token = None
+        while True:
+            request = QueryRequest(
+                subscriptions=list(subscriptions[start:start + RESOURCE_GRAPH_MAX_SUBSCRIPTIONS]),
+                query=query,
+                options=QueryRequestOptions(skip_token=skip_token, result_format='objectArray'),
+            )
+            try:
+                response = await _dispatch(hub, graphconn.resources, (request,), {}, dict(
+                    operation, subscription_id=kwargs.get('subscription_id') or subscriptions[start]
+                ))
+            except ErrorResponseException as exc:
+                raise CloudError(exc.response)
+            rows.extend(response.data or [])
+            skip_token = response.skip_token
+            if not skip_token:
+                break
+
+    result = [operations._deserialize(model, row).as_dict() for row in rows]  # pylint: disable=protected-access
+    await hub.exec.utils.inventory.record(result)
+
+    return result
+
+
+async def paged_object_to_list(hub, paged_object, prefetch=None):
+    '''
+    Extract all pages within a paged object as a list of dictionaries. Unless ``prefetch`` is 0, the following pages
+    are fetched while the current one is converted; it defaults to the ``azurerm_page_prefetch`` option.
+    '''
+    if prefetch is None:
+        prefetch = _get_opt(hub, 'azurerm_page_prefetch', 1)
+
+    paged_return = []
+    async for page in _iter_pages(hub, paged_object, prefetch=prefetch):
+        paged_return.extend([item.as_dict() for item in page])
+
+    await hub.exec.utils.inventory.record(paged_return)
 
     return paged_return
 
 
-async def create_object_model(hub, module_name, object_name, **kwargs):
+async def paged_object_to_iter(hub, paged_object, limit=None, prefetch=None):
     '''
-    Assemble an object from incoming parameters.
+    Asynchronously yield the items within a paged object as dictionaries, page by page. Iteration stops after
+    ``limit`` items, and no further pages are requested when the consumer stops early. ``prefetch`` behaves as it
+    does for paged_object_to_list.
     '''
-    object_kwargs = {}
+    if prefetch is None:
+        prefetch = _get_opt(hub, 'azurerm_page_prefetch', 1)
+
+    if limit is not None and limit <= 0:
+        return
+
+    count = 0
+    pages = _iter_pages(hub, paged_object, prefetch=prefetch)
+    try:
+        async for page in pages:
+            items = [item.as_dict() for item in page]
+            await hub.exec.utils.inventory.record(items)
+            for item in items:
+                yield item
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+    finally:
+        await pages.aclose()
+
+
+class _ModelPlan(object):
+    '''
+    A compiled recipe for building an SDK model from keyword arguments. Each entry in ``attrs`` is a tuple of the
+    attribute name, its kind and, for model attributes, the plan of the nested model.
+    '''
+    def __init__(self, model):
+        self.model = model
+        self.attrs = []
+
+    def build(self, params):
+        object_kwargs = {}
+        for attr, kind, nested in self.attrs:
+            param = params.get(attr)
+            if not param:
+                continue
+            if kind == 'model' and isinstance(param, dict):
+                object_kwargs[attr] = nested.resolve().build(param)
+            elif kind == 'dict' and isinstance(param, dict):
+                object_kwargs[attr] = param
+            elif kind in ('list_model', 'list_dict', 'list_scalar') and isinstance(param, list):
+                obj_list = []
+                for list_item in param:
+                    if kind == 'list_model' and isinstance(list_item, dict):
+                        obj_list.append(nested.resolve().build(list_item))
+                    elif kind == 'list_dict' and isinstance(list_item, dict):
+                        obj_list.append(list_item)
+                    elif kind == 'list_scalar':
+                        obj_list.append(list_item)
+                object_kwargs[attr] = obj_list
+            else:
+                object_kwargs[attr] = param
+
+        # wrap calls to this function to catch TypeError exceptions
+        return self.model(**object_kwargs)
+
+
+class _NestedPlan(object):
+    '''
+    A reference to the plan of a nested model, resolved on first use so that model types which are never populated
+    do not need to exist in the SDK module.
+    '''
+    def __init__(self, hub, module_name, object_name):
+        self.hub = hub
+        self.module_name = module_name
+        self.object_name = object_name
+        self.plan = None
+
+    def resolve(self):
+        if self.plan is None:
+            self.plan = _compile_model_plan(self.hub, self.module_name, self.object_name)
+        return self.plan
+
+
+def _compile_model_plan(hub, module_name, object_name):
+    '''
+    Return the cached build plan for a model, compiling it from the model's attribute map on first use
+    '''
+    plans = hub.exec.utils.azurerm.MODEL_PLANS
+    key = (module_name, object_name)
+    if key in plans:
+        return plans[key]
 
     try:
         model_module = importlib.import_module('azure.mgmt.{0}.models'.format(module_name))
@@ -238,64 +1729,88 @@ async def create_object_model(hub, module_name, object_name, **kwargs):
             'The {0} model in the {1} Azure module is not available.'.format(object_name, module_name)
         )
 
-    if '_attribute_map' in dir(Model):
-        for attr, items in Model._attribute_map.items():
-            param = kwargs.get(attr)
-            if param:
-                if items['type'][0].isupper() and isinstance(param, dict):
-                    object_kwargs[attr] = await create_object_model(hub, module_name, items['type'], **param)
-                elif items['type'][0] == '{' and isinstance(param, dict):
-                    object_kwargs[attr] = param
-                elif items['type'][0] == '[' and isinstance(param, list):
-                    obj_list = []
-                    for list_item in param:
-                        if items['type'][1].isupper() and isinstance(list_item, dict):
-                            obj_list.append(
-                                await create_object_model(
-                                    hub,
-                                    module_name,
-                                    items['type'][items['type'].index('[')+1:items['type'].rindex(']')],
-                                    **list_item
-                                )
-                            )
-                        elif items['type'][1] == '{' and isinstance(list_item, dict):
-                            obj_list.append(list_item)
-                        elif not items['type'][1].isupper() and items['type'][1] != '{':
-                            obj_list.append(list_item)
-                    object_kwargs[attr] = obj_list
-                else:
-                    object_kwargs[attr] = param
-
-    # wrap calls to this function to catch TypeError exceptions
-    return Model(**object_kwargs)
+    plan = _ModelPlan(Model)
+    for attr, items in getattr(Model, '_attribute_map', {}).items():
+        attr_type = items['type']
+        if attr_type[0].isupper():
+            plan.attrs.append((attr, 'model', _NestedPlan(hub, module_name, attr_type)))
+        elif attr_type[0] == '{':
+            plan.attrs.append((attr, 'dict', None))
+        elif attr_type[0] == '[':
+            if attr_type[1].isupper():
+                nested_type = attr_type[attr_type.index('[')+1:attr_type.rindex(']')]
+                plan.attrs.append((attr, 'list_model', _NestedPlan(hub, module_name, nested_type)))
+            elif attr_type[1] == '{':
+                plan.attrs.append((attr, 'list_dict', None))
+            else:
+                plan.attrs.append((attr, 'list_scalar', None))
+        else:
+            plan.attrs.append((attr, 'scalar', None))
+
+    plans[key] = plan
+
+    return plan
+
+
+async def create_object_model(hub, module_name, object_name, **kwargs):
+    '''
+    Assemble an object from incoming parameters. The reflection over each model's attribute map is done once per
+    model and cached on the hub as a build plan.
+    '''
+    return _compile_model_plan(hub, module_name, object_name).build(kwargs)
+
+
+def _index_by_name(configs):
+    '''
+    Index a list of configuration dictionaries by lower case name, raising TypeError for entries which are not
+    dictionaries and KeyError for entries without a name
+    '''
+    index = collections.OrderedDict()
+    for config in configs:
+        if not isinstance(config, dict):
+            raise TypeError(config)
+        index[str(config['name']).lower()] = config
+
+    return index
+
+
+def _normalize_config_value(value, id_to_name=False):
+    '''
+    Prepare a configuration value for comparison. String comparison is case insensitive, and references which are
+    compared by name are reduced to the last segment of their ID.
+    '''
+    if id_to_name:
+        if isinstance(value, dict):
+            value = value.get('id', '')
+        if isinstance(value, six.string_types):
+            value = value.split('/')[-1]
+    if isinstance(value, six.string_types):
+        return value.lower()
+
+    return value
 
 
 async def compare_list_of_dicts(hub, old, new, convert_id_to_name=None):
     '''
-    Compare lists of dictionaries representing Azure objects. Only keys found in the "new" dictionaries are compared to
-    the "old" dictionaries, since getting Azure objects from the API returns some read-only data which should not be
-    used in the comparison. A list of parameter names can be passed in order to compare a bare object name to a full
-    Azure ID path for brevity. If string types are found in values, comparison is case insensitive. Return comment
-    should be used to trigger exit from the calling function.
+    Compare lists of dictionaries representing Azure objects, matching entries by name in a single pass over each
+    list. Only keys found in the "new" dictionaries are compared to the "old" dictionaries, since getting Azure objects
+    from the API returns some read-only data which should not be used in the comparison. A list of parameter names can
+    be passed in order to compare a bare object name to a full Azure ID path for brevity. If string types are found in
+    values, comparison is case insensitive. Changes are reported per entry as the "new" entries which were ``added``,
+    the names of the "old" entries which were ``removed``, and the differing keys of each ``changed`` entry by name.
+    Return comment should be used to trigger exit from the calling function.
     '''
     ret = {}
 
-    if not convert_id_to_name:
-        convert_id_to_name = []
+    convert_id_to_name = set(convert_id_to_name or [])
 
     if not isinstance(new, list):
         ret['comment'] = 'must be provided as a list of dictionaries!'
         return ret
 
-    if len(new) != len(old):
-        ret['changes'] = {
-            'old': old,
-            'new': new
-        }
-        return ret
-
     try:
-        local_configs, remote_configs = [sorted(config, key=itemgetter('name')) for config in (new, old)]
+        local_configs = _index_by_name(new)
+        remote_configs = _index_by_name(old or [])
     except TypeError:
         ret['comment'] = 'configurations must be provided as a list of dictionaries!'
         return ret
@@ -303,22 +1818,41 @@ async def compare_list_of_dicts(hub, old, new, convert_id_to_name=None):
         ret['comment'] = 'configuration dictionaries must contain the "name" key!'
         return ret
 
-    for idx in six_range(0, len(local_configs)):
-        for key in local_configs[idx]:
-            local_val = local_configs[idx][key]
-            if key in convert_id_to_name:
-                remote_val = remote_configs[idx].get(key, {}).get('id', '').split('/')[-1]
-            else:
-                remote_val = remote_configs[idx].get(key)
-                if isinstance(local_val, six.string_types):
-                    local_val = local_val.lower()
-                if isinstance(remote_val, six.string_types):
-                    remote_val = remote_val.lower()
-            if local_val != remote_val:
-                ret['changes'] = {
-                    'old': remote_configs,
-                    'new': local_configs
-                }
-                return ret
+    if len(local_configs) != len(new):
+        ret['comment'] = 'configuration dictionaries must have unique names!'
+        return ret
+
+    added = []
+    changed = {}
+    for name, local_config in local_configs.items():
+        remote_config = remote_configs.get(name)
+        if remote_config is None:
+            added.append(local_config)
+            continue
+
+        old_values = {}
+        new_values = {}
+        for key, local_val in local_config.items():
+            remote_val = remote_config.get(key)
+            if local_val == remote_val:
+                continue
+            id_to_name = key in convert_id_to_name
+            if _normalize_config_value(local_val, id_to_name) != _normalize_config_value(remote_val, id_to_name):
+                old_values[key] = remote_val
+                new_values[key] = local_val
+        if new_values:
+            changed[local_config['name']] = {'old': old_values, 'new': new_values}
+
+    removed = [config['name'] for name, config in remote_configs.items() if name not in local_configs]
+
+    changes = {}
+    if added:
+        changes['added'] = added
+    if removed:
+        changes['removed'] = removed
+    if changed:
+        changes['changed'] = changed
+    if changes:
+        ret['changes'] = changes
 
     return ret
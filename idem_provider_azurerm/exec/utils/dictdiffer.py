@@ -12,8 +12,10 @@
   Added the ability to recursively compare dictionaries
 '''
 from __future__ import absolute_import, print_function, unicode_literals
-import copy
-from collections import Mapping
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
 import six
 
 
@@ -47,32 +49,47 @@ class DictDiffer(object):
         return set(o for o in self.intersect if self.past_dict[o] == self.current_dict[o])
 
 
+def _deep_diff(old, new, ignore):
+    '''
+    Walk two mappings without modifying them and return the parts of each which differ. Values are only visited,
+    never copied, so unchanged parts of large documents cost nothing beyond the comparison.
+    '''
+    old_diff = {}
+    new_diff = {}
+
+    for key, old_val in old.items():
+        if key in ignore:
+            continue
+        if key not in new:
+            old_diff[key] = old_val
+            continue
+        new_val = new[key]
+        if old_val == new_val:
+            continue
+        if isinstance(old_val, Mapping) and isinstance(new_val, Mapping):
+            sub_old, sub_new = _deep_diff(old_val, new_val, ignore)
+            if sub_old == sub_new:
+                continue
+            old_val, new_val = sub_old, sub_new
+        old_diff[key] = old_val
+        new_diff[key] = new_val
+
+    for key, new_val in new.items():
+        if key not in old and key not in ignore:
+            new_diff[key] = new_val
+
+    return old_diff, new_diff
+
+
 async def deep_diff(hub, old, new, ignore=None):
-    ignore = ignore or []
+    '''
+    Return the keys of two mappings which differ, recursing into values which are mappings on both sides, as
+    ``old`` and ``new`` dictionaries. Keys in ignore are left out at every level. The returned dictionaries share
+    the differing values with the inputs rather than copying them.
+    '''
     res = {}
-    old = copy.deepcopy(old)
-    new = copy.deepcopy(new)
-    stack = [(old, new, False)]
-
-    while len(stack) > 0:
-        tmps = []
-        tmp_old, tmp_new, reentrant = stack.pop()
-        for key in set(list(tmp_old) + list(tmp_new)):
-            if key in tmp_old and key in tmp_new \
-                    and tmp_old[key] == tmp_new[key]:
-                del tmp_old[key]
-                del tmp_new[key]
-                continue
-            if not reentrant:
-                if key in tmp_old and key in ignore:
-                    del tmp_old[key]
-                if key in tmp_new and key in ignore:
-                    del tmp_new[key]
-                if isinstance(tmp_old.get(key), Mapping) \
-                        and isinstance(tmp_new.get(key), Mapping):
-                    tmps.append((tmp_old[key], tmp_new[key], False))
-        if tmps:
-            stack.extend([(tmp_old, tmp_new, True)] + tmps)
+    old, new = _deep_diff(old, new, frozenset(ignore or []))
+
     if old:
         res['old'] = old
     if new:
@@ -156,12 +173,31 @@ class RecursiveDictDiffer(DictDiffer):
             not contain the missing keys.
         '''
         super(RecursiveDictDiffer, self).__init__(current_dict, past_dict)
-        self._diffs = \
-                self._get_diffs(self.current_dict, self.past_dict,
-                                ignore_missing_keys)
+        self.ignore_missing_keys = ignore_missing_keys
+        # The diff tree is only walked on first access, so reading several
+        # views costs a single walk. Only the immutable key lists and the
+        # changes string are memoized, the value dictionaries are rebuilt
+        self._diff_tree = None
+        self._views = {}
         # Ignores unet values when assessing the changes
         self.ignore_unset_values = True
 
+    @property
+    def _diffs(self):
+        if self._diff_tree is None:
+            self._diff_tree = self._get_diffs(self.current_dict,
+                                              self.past_dict,
+                                              self.ignore_missing_keys)
+        return self._diff_tree
+
+    def _view(self, key, build):
+        '''
+        Returns the memoized view stored under key, building it on first use.
+        '''
+        if key not in self._views:
+            self._views[key] = build()
+        return self._views[key]
+
     @classmethod
     def _get_diffs(cls, dict1, dict2, ignore_missing_keys):
         '''
@@ -208,6 +244,19 @@ class RecursiveDictDiffer(DictDiffer):
                     {p: cls._get_values(diff_dict[p], type=type)})
         return ret_dict
 
+    @classmethod
+    def _format_value(cls, value):
+        '''
+        Returns the string representation of a value used in changes_str.
+        '''
+        if value == cls.NONE_VALUE:
+            return 'nothing'
+        elif isinstance(value, six.string_types):
+            return '\'{0}\''.format(value)
+        elif isinstance(value, list):
+            return '\'{0}\''.format(', '.join(six.text_type(elem) for elem in value))
+        return value
+
     @classmethod
     def _get_changes(cls, diff_dict):
         '''
@@ -218,22 +267,8 @@ class RecursiveDictDiffer(DictDiffer):
         changes_strings = []
         for p in sorted(diff_dict.keys()):
             if sorted(diff_dict[p].keys()) == ['new', 'old']:
-                # Some string formatting
-                old_value = diff_dict[p]['old']
-                if diff_dict[p]['old'] == cls.NONE_VALUE:
-                    old_value = 'nothing'
-                elif isinstance(diff_dict[p]['old'], six.string_types):
-                    old_value = '\'{0}\''.format(diff_dict[p]['old'])
-                elif isinstance(diff_dict[p]['old'], list):
-                    old_value = '\'{0}\''.format(
-                        ', '.join(diff_dict[p]['old']))
-                new_value = diff_dict[p]['new']
-                if diff_dict[p]['new'] == cls.NONE_VALUE:
-                    new_value = 'nothing'
-                elif isinstance(diff_dict[p]['new'], six.string_types):
-                    new_value = '\'{0}\''.format(diff_dict[p]['new'])
-                elif isinstance(diff_dict[p]['new'], list):
-                    new_value = '\'{0}\''.format(', '.join(diff_dict[p]['new']))
+                old_value = cls._format_value(diff_dict[p]['old'])
+                new_value = cls._format_value(diff_dict[p]['new'])
                 changes_strings.append('{0} from {1} to {2}'.format(
                     p, old_value, new_value))
             else:
@@ -266,7 +301,8 @@ class RecursiveDictDiffer(DictDiffer):
                         keys.append('{0}{1}'.format(prefix, key))
             return keys
 
-        return sorted(_added(self._diffs, prefix=''))
+        return list(self._view(
+            'added', lambda: sorted(_added(self._diffs, prefix=''))))
 
     def removed(self):
         '''
@@ -289,7 +325,8 @@ class RecursiveDictDiffer(DictDiffer):
                                  prefix='{0}{1}.'.format(prefix, key)))
             return keys
 
-        return sorted(_removed(self._diffs, prefix=''))
+        return list(self._view(
+            'removed', lambda: sorted(_removed(self._diffs, prefix=''))))
 
     def changed(self):
         '''
@@ -337,7 +374,9 @@ class RecursiveDictDiffer(DictDiffer):
 
             return keys
 
-        return sorted(_changed(self._diffs, prefix=''))
+        return list(self._view(
+            ('changed', self.ignore_unset_values),
+            lambda: sorted(_changed(self._diffs, prefix=''))))
 
     def unchanged(self):
         '''
@@ -362,7 +401,10 @@ class RecursiveDictDiffer(DictDiffer):
                                        prefix='{0}{1}.'.format(prefix, key)))
 
             return keys
-        return sorted(_unchanged(self.current_dict, self._diffs, prefix=''))
+        return list(self._view(
+            'unchanged',
+            lambda: sorted(_unchanged(self.current_dict, self._diffs,
+                                      prefix=''))))
 
     @property
     def diffs(self):
@@ -372,6 +414,7 @@ class RecursiveDictDiffer(DictDiffer):
     @property
     def new_values(self):
         '''Returns a dictionary with the new values'''
+        # Built on every access, callers are free to modify the result
         return self._get_values(self._diffs, type='new')
 
     @property
@@ -382,4 +425,5 @@ class RecursiveDictDiffer(DictDiffer):
     @property
     def changes_str(self):
         '''Returns a string describing the changes'''
-        return '\n'.join(self._get_changes(self._diffs))
+        return self._view('changes_str',
+                          lambda: '\n'.join(self._get_changes(self._diffs)))
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+'''
+Azure (ARM) Desired State Fingerprints
+
+.. versionadded:: 1.0.0
+
+Present states which succeed remember a hash of their arguments along with the ID and ETag of the resource they
+left behind. When ``azurerm_fast_present`` is enabled, a later run of the same state with the same arguments only
+checks that the resource still has that ETag, and reports it as already present without reading and diffing the
+whole resource. The fingerprints are kept in ``fingerprints.json`` within ``azurerm_cache_dir``.
+
+:maintainer: <devops@eitr.tech>
+:maturity: new
+:platform: linux
+'''
+# Python libs
+from __future__ import absolute_import
+import hashlib
+import json
+import logging
+import os
+
+log = logging.getLogger(__name__)
+
+# State arguments which do not describe the desired resource
+EXCLUDED_ARGS = ('connection_auth',)
+
+
+def __init__(hub):
+    '''
+    The fingerprint store is read from disk on first use
+    '''
+    hub.exec.utils.fingerprint.STORE = None
+
+
+async def _store_file(hub):
+    '''
+    Return the path of the on-disk fingerprint store
+    '''
+    return os.path.join(
+        await hub.exec.utils.azurerm.get_opt(
+            'azurerm_cache_dir', os.path.join(os.path.expanduser('~'), '.cache', 'idem_azurerm')
+        ),
+        'fingerprints.json'
+    )
+
+
+async def _load(hub):
+    '''
+    Return the fingerprint store, reading it from disk the first time it is needed
+    '''
+    if hub.exec.utils.fingerprint.STORE is None:
+        try:
+            with open(await _store_file(hub)) as store_file:
+                store = json.load(store_file)
+        except (IOError, OSError, ValueError):
+            store = {}
+        hub.exec.utils.fingerprint.STORE = store if isinstance(store, dict) else {}
+
+    return hub.exec.utils.fingerprint.STORE
+
+
+async def _save(hub):
+    '''
+    Write the fingerprint store to disk. Failures are logged and otherwise ignored, since a lost fingerprint only
+    means the next run of the state does a full read.
+    '''
+    store_file = await _store_file(hub)
+    try:
+        os.makedirs(os.path.dirname(store_file), exist_ok=True)
+        tmp_file = '{0}.{1}'.format(store_file, os.getpid())
+        with open(tmp_file, 'w') as fp_:
+            json.dump(hub.exec.utils.fingerprint.STORE, fp_)
+        os.replace(tmp_file, store_file)
+    except (IOError, OSError, TypeError) as exc:
+        log.debug('Unable to write the Azure fingerprint store to %s: %s', store_file, exc)
+
+
+def _digest(state, subscription_id, inputs):
+    '''
+    Return a canonical hash of a state's arguments
+    '''
+    canonical = json.dumps(
+        [state, subscription_id, inputs], sort_keys=True, separators=(',', ':'), default=str
+    )
+
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+async def check(hub, state, args):
+    '''
+    Fingerprint the arguments of a present state and check whether the resource it last left behind is unchanged.
+    state is the name of the state function and args is a dictionary of the arguments it was called with, including
+    connection_auth and any extra keyword arguments. Returns a fingerprint with an ``unchanged`` flag, which is True
+    only when fast present is enabled, the state ran with the same arguments before, and the resource still has the
+    ETag it had then. Pass the fingerprint to record once the state has succeeded.
+    '''
+    fingerprint = {'key': None, 'unchanged': False}
+
+    connection_auth = args.get('connection_auth')
+    if not isinstance(connection_auth, dict) or \
+            not await hub.exec.utils.azurerm.get_opt('azurerm_fast_present', False):
+        return fingerprint
+
+    inputs = dict((key, value) for key, value in args.items() if key not in EXCLUDED_ARGS)
+    try:
+        fingerprint['key'] = _digest(state, connection_auth.get('subscription_id'), inputs)
+    except (TypeError, ValueError) as exc:
+        log.debug('Unable to fingerprint the arguments of %s: %s', state, exc)
+        return fingerprint
+
+    store = await _load(hub)
+    entry = store.get(fingerprint['key'])
+    if entry:
+        fingerprint['unchanged'] = await hub.exec.utils.azurerm.etag_unchanged(
+            entry['id'], entry['etag'], entry.get('api_version'), **connection_auth
+        )
+
+    return fingerprint
+
+
+async def check_present(hub, ret, state, kind, args):
+    '''
+    Check the arguments of a present state as check does. When the resource the state last left behind is unchanged,
+    ret is filled in to report the resource, described by kind, as already present and the state can return it.
+    Returns the fingerprint.
+    '''
+    fingerprint = await hub.exec.utils.fingerprint.check(state, args)
+    if fingerprint['unchanged']:
+        ret['result'] = True
+        ret['comment'] = '{0} {1} is already present.'.format(kind, ret['name'])
+
+    return fingerprint
+
+
+async def record(hub, fingerprint, resource):
+    '''
+    Remember the resource a present state left behind under the fingerprint returned by check. Resources without an
+    ID or ETag are not remembered, and any fingerprint held for the same resource under other arguments is dropped.
+    '''
+    key = fingerprint.get('key')
+    if not key:
+        return False
+
+    store = await _load(hub)
+    if not isinstance(resource, dict) or not resource.get('id') or not resource.get('etag'):
+        if store.pop(key, None) is not None:
+            await _save(hub)
+        return False
+
+    entry = {
+        'id': resource['id'],
+        'etag': resource['etag'],
+        'api_version': await hub.exec.utils.azurerm.resource_api_version(resource['id']),
+    }
+    if store.get(key) == entry:
+        return True
+
+    for stale in [known for known, value in store.items() if value.get('id', '').lower() == entry['id'].lower()]:
+        del store[stale]
+    store[key] = entry
+    await _save(hub)
+
+    return True
+
+
+async def clear(hub):
+    '''
+    Forget every fingerprint, so the next run of each present state does a full read and diff
+    '''
+    hub.exec.utils.fingerprint.STORE = {}
+    try:
+        os.remove(await _store_file(hub))
+    except (IOError, OSError):
+        pass
+
+    return True
@@ -0,0 +1,333 @@
+# -*- coding: utf-8 -*-
+'''
+Azure (ARM) Resource Inventory
+
+.. versionadded:: 1.0.0
+
+When ``azurerm_inventory`` is enabled, every resource read by an exec ``get`` or ``list`` function is written to a
+SQLite snapshot in ``inventory.sqlite`` within ``azurerm_cache_dir``. Resources are keyed by their ARM ID and indexed
+by type, resource group and tags, and each records when it was last refreshed, so questions such as which network
+interfaces reference a security group can be answered without listing the subscription again. With
+``azurerm_inventory_test_reads`` also enabled, test runs read resources from the snapshot instead of from ARM. The
+database is only used from a single worker thread, so reads and writes never block the event loop.
+
+:maintainer: <devops@eitr.tech>
+:maturity: new
+:platform: linux
+'''
+# Python libs
+from __future__ import absolute_import
+import asyncio
+import concurrent.futures
+import json
+import logging
+import os
+import sqlite3
+import time
+
+log = logging.getLogger(__name__)
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS resources (
+    id TEXT PRIMARY KEY,
+    type TEXT NOT NULL,
+    subscription_id TEXT NOT NULL,
+    resource_group TEXT,
+    name TEXT NOT NULL,
+    data TEXT NOT NULL,
+    refreshed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS resources_type ON resources (type, subscription_id);
+CREATE INDEX IF NOT EXISTS resources_group ON resources (subscription_id, resource_group);
+CREATE TABLE IF NOT EXISTS tags (
+    id TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT,
+    PRIMARY KEY (id, key)
+);
+CREATE INDEX IF NOT EXISTS tags_key ON tags (key, value);
+'''
+
+
+def __init__(hub):
+    '''
+    The inventory database and the thread it is used from are set up on first use
+    '''
+    hub.exec.utils.inventory.CONNECTION = None
+    hub.exec.utils.inventory.EXECUTOR = None
+
+
+def _parse_id(resource_id):
+    '''
+    Split an ARM resource ID into its lowercased key, subscription, resource group and type, and its name. Returns
+    None for IDs which do not identify a resource group or a resource within a provider.
+    '''
+    parts = str(resource_id).strip('/').split('/')
+    lowered = [part.lower() for part in parts]
+    if len(parts) < 4 or lowered[0] != 'subscriptions':
+        return None
+
+    resource_group = None
+    if lowered[2] == 'resourcegroups':
+        resource_group = lowered[3]
+        if len(parts) == 4:
+            return '/' + '/'.join(lowered), lowered[1], resource_group, 'microsoft.resources/resourcegroups', parts[3]
+
+    if 'providers' not in lowered:
+        return None
+
+    # The last provider segment owns the resource, which matters for extension resources such as locks
+    provider = len(lowered) - 1 - lowered[::-1].index('providers')
+    path = lowered[provider + 1:]
+    if len(path) < 3 or len(path) % 2 == 0:
+        return None
+
+    return '/' + '/'.join(lowered), lowered[1], resource_group, '/'.join([path[0]] + path[1::2]), parts[-1]
+
+
+def _connect(hub, db_file):
+    '''
+    Return the connection to the inventory database, creating the database and its schema on first use. Only called
+    from the inventory thread.
+    '''
+    if hub.exec.utils.inventory.CONNECTION is None:
+        os.makedirs(os.path.dirname(db_file), exist_ok=True)
+        conn = sqlite3.connect(db_file, check_same_thread=False)
+        # Every read is recorded, so commits must not wait for the disk
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.executescript(SCHEMA)
+        hub.exec.utils.inventory.CONNECTION = conn
+
+    return hub.exec.utils.inventory.CONNECTION
+
+
+async def _run(hub, func, *args):
+    '''
+    Run func with the inventory connection and the remaining arguments in the inventory thread. SQLite work is
+    serialized on that one thread, which keeps it off the event loop without sharing the connection between threads.
+    '''
+    if hub.exec.utils.inventory.EXECUTOR is None:
+        hub.exec.utils.inventory.EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='azurerm-inventory'
+        )
+    db_file = os.path.join(
+        await hub.exec.utils.azurerm.get_opt(
+            'azurerm_cache_dir', os.path.join(os.path.expanduser('~'), '.cache', 'idem_azurerm')
+        ),
+        'inventory.sqlite'
+    )
+
+    return await asyncio.get_event_loop().run_in_executor(
+        hub.exec.utils.inventory.EXECUTOR, lambda: func(_connect(hub, db_file), *args)
+    )
+
+
+def _write(conn, rows, tags):
+    '''
+    Replace the stored snapshots and tags of resources
+    '''
+    with conn:
+        conn.executemany('DELETE FROM tags WHERE id = ?', [(row[0],) for row in rows])
+        conn.executemany('INSERT OR REPLACE INTO resources VALUES (?, ?, ?, ?, ?, ?, ?)', rows)
+        conn.executemany('INSERT OR REPLACE INTO tags VALUES (?, ?, ?)', tags)
+
+
+def _delete(conn, key):
+    '''
+    Delete a resource and anything nested beneath it
+    '''
+    with conn:
+        for table in ('tags', 'resources'):
+            conn.execute(
+                'DELETE FROM {0} WHERE id = ? OR substr(id, 1, ?) = ?'.format(table),
+                (key, len(key) + 1, key + '/')
+            )
+
+
+def _select(conn, sql, params):
+    '''
+    Return the stored documents of the resources selected by a query
+    '''
+    return _rows_to_resources(conn.execute(sql, params).fetchall())
+
+
+def _rows_to_resources(rows):
+    '''
+    Load the stored documents from result rows
+    '''
+    return [json.loads(row[0]) for row in rows]
+
+
+async def record(hub, resources):
+    '''
+    Write resource dictionaries to the inventory, replacing any earlier snapshot of the same resources. Dictionaries
+    without an ARM ID, such as locations or VM sizes, are skipped. Does nothing unless ``azurerm_inventory`` is
+    enabled. Returns the number of resources written.
+    '''
+    if not await hub.exec.utils.azurerm.get_opt('azurerm_inventory', False):
+        return 0
+
+    now = time.time()
+    rows = []
+    tags = []
+    for resource in resources:
+        if not isinstance(resource, dict) or not resource.get('id'):
+            continue
+        parsed = _parse_id(resource['id'])
+        if parsed is None:
+            continue
+        key, subscription_id, resource_group, resource_type, name = parsed
+        rows.append((key, resource_type, subscription_id, resource_group, name,
+                     json.dumps(resource, default=str), now))
+        for tag, value in (resource.get('tags') or {}).items():
+            tags.append((key, tag, None if value is None else str(value)))
+
+    if not rows:
+        return 0
+
+    try:
+        await _run(hub, _write, rows, tags)
+    except (OSError, sqlite3.Error) as exc:
+        log.debug('Unable to write to the Azure inventory: %s', exc)
+        return 0
+
+    return len(rows)
+
+
+async def forget(hub, resource_id):
+    '''
+    Drop a resource and anything nested beneath it from the inventory after it has been written or deleted
+    '''
+    if not await hub.exec.utils.azurerm.get_opt('azurerm_inventory', False):
+        return False
+
+    key = str(resource_id).split('?', 1)[0].rstrip('/').lower()
+    try:
+        await _run(hub, _delete, key)
+    except (OSError, sqlite3.Error) as exc:
+        log.debug('Unable to remove %s from the Azure inventory: %s', resource_id, exc)
+        return False
+
+    return True
+
+
+async def get(hub, resource_id, max_age=None):
+    '''
+    Return the snapshot of a resource, or None if it is not in the inventory or was last refreshed more than max_age
+    seconds ago
+    '''
+    sql = 'SELECT data FROM resources WHERE id = ?'
+    params = [str(resource_id).split('?', 1)[0].rstrip('/').lower()]
+    if max_age is not None:
+        sql += ' AND refreshed >= ?'
+        params.append(time.time() - max_age)
+
+    resources = await _run(hub, _select, sql, params)
+
+    return resources[0] if resources else None
+
+
+async def query(hub, resource_type=None, resource_group=None, subscription_id=None, tags=None, max_age=None):
+    '''
+    Return the snapshots of every resource matching all of the given filters. resource_type is a namespace and type
+    path such as ``Microsoft.Network/networkInterfaces``. tags is a dictionary of tag names to the values they must
+    have, where a value of None matches any value.
+    '''
+    clauses = []
+    params = []
+    for column, value in (('type', resource_type), ('resource_group', resource_group),
+                          ('subscription_id', subscription_id)):
+        if value is not None:
+            clauses.append('{0} = ?'.format(column))
+            params.append(value.lower())
+
+    for tag, value in (tags or {}).items():
+        if value is None:
+            clauses.append('id IN (SELECT id FROM tags WHERE key = ?)')
+            params.append(tag)
+        else:
+            clauses.append('id IN (SELECT id FROM tags WHERE key = ? AND value = ?)')
+            params.extend([tag, str(value)])
+
+    if max_age is not None:
+        clauses.append('refreshed >= ?')
+        params.append(time.time() - max_age)
+
+    sql = 'SELECT data FROM resources'
+    if clauses:
+        sql += ' WHERE ' + ' AND '.join(clauses)
+
+    return await _run(hub, _select, sql + ' ORDER BY id', params)
+
+
+async def references(hub, resource_id, resource_type=None, max_age=None):
+    '''
+    Return the snapshots of resources which reference resource_id anywhere in their properties, such as the network
+    interfaces attached to a network security group. The search can be narrowed to a resource_type.
+    '''
+    key = str(resource_id).rstrip('/').lower()
+    # Match the whole ID, or the ID of something nested beneath the resource such as a load balancer pool
+    sql = 'SELECT data FROM resources WHERE id != ? AND (instr(lower(data), ?) > 0 OR instr(lower(data), ?) > 0)'
+    params = [key, '"{0}"'.format(key), '"{0}/'.format(key)]
+    if resource_type is not None:
+        sql += ' AND type = ?'
+        params.append(resource_type.lower())
+    if max_age is not None:
+        sql += ' AND refreshed >= ?'
+        params.append(time.time() - max_age)
+
+    return await _run(hub, _select, sql + ' ORDER BY id', params)
+
+
+async def test_snapshot(hub, ctx, resource_id):
+    '''
+    Return the snapshot of a resource for a test run to use instead of reading it from ARM. ctx is the context of the
+    state reading the resource. Returns None unless that state is running in test mode with
+    ``azurerm_inventory_test_reads`` enabled, or when the resource is not in the inventory.
+    '''
+    if not (ctx or {}).get('test') or \
+            not await hub.exec.utils.azurerm.get_opt('azurerm_inventory_test_reads', False):
+        return None
+
+    try:
+        return await hub.exec.utils.inventory.get(resource_id)
+    except (OSError, sqlite3.Error) as exc:
+        log.debug('Unable to read %s from the Azure inventory: %s', resource_id, exc)
+        return None
+
+
+def _stats(conn):
+    '''
+    Count the stored resources of each type and find the oldest and newest refresh times
+    '''
+    ret = {'types': dict(conn.execute('SELECT type, count(*) FROM resources GROUP BY type').fetchall())}
+    ret['size'] = sum(ret['types'].values())
+    ret['oldest'], ret['newest'] = conn.execute('SELECT min(refreshed), max(refreshed) FROM resources').fetchone()
+
+    return ret
+
+
+def _clear(conn):
+    '''
+    Delete every stored resource and tag
+    '''
+    with conn:
+        conn.execute('DELETE FROM tags')
+        conn.execute('DELETE FROM resources')
+
+
+async def stats(hub):
+    '''
+    Return the number of resources of each type in the inventory, with the oldest and newest refresh times
+    '''
+    return await _run(hub, _stats)
+
+
+async def clear(hub):
+    '''
+    Remove every resource from the inventory
+    '''
+    await _run(hub, _clear)
+
+    return True
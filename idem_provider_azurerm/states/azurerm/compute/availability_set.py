@@ -162,6 +162,7 @@ async def present(hub, ctx, name, resource_group, tags=None, platform_update_dom
         name,
         resource_group,
         azurearm_log_level='info',
+        ctx=ctx,
         **connection_auth
     )
 
@@ -283,6 +284,7 @@ async def absent(hub, ctx, name, resource_group, connection_auth=None):
         name,
         resource_group,
         azurearm_log_level='info',
+        ctx=ctx,
         **connection_auth
     )
 
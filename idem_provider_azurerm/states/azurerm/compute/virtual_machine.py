@@ -146,6 +146,7 @@ async def present(hub, ctx, name, resource_group, tags=None, connection_auth=Non
         name,
         resource_group,
         azurearm_log_level='info',
+        ctx=ctx,
         **connection_auth
     )
 
@@ -238,6 +239,7 @@ async def absent(hub, ctx, name, resource_group, connection_auth=None, **kwargs)
         name,
         resource_group,
         azurearm_log_level='info',
+        ctx=ctx,
         **connection_auth
     )
 
@@ -239,12 +239,25 @@ async def present(hub, ctx, name, zone_name, resource_group, record_type, if_mat
         ret['comment'] = 'Connection information must be specified via connection_auth dictionary!'
         return ret
 
+    fingerprint = await hub.exec.utils.fingerprint.check_present(
+        ret, 'azurerm.dns.record_set.present', 'Record set', dict(
+            kwargs, name=name, zone_name=zone_name, resource_group=resource_group, record_type=record_type,
+            if_match=if_match, if_none_match=if_none_match, etag=etag, metadata=metadata, ttl=ttl, arecords=arecords,
+            aaaa_records=aaaa_records, mx_records=mx_records, ns_records=ns_records, ptr_records=ptr_records,
+            srv_records=srv_records, txt_records=txt_records, cname_record=cname_record, soa_record=soa_record,
+            caa_records=caa_records, connection_auth=connection_auth
+        )
+    )
+    if fingerprint['unchanged']:
+        return ret
+
     rec_set = await hub.exec.azurerm.dns.record_set.get(
         name,
         zone_name,
         resource_group,
         record_type,
         azurearm_log_level='info',
+        ctx=ctx,
         **connection_auth
     )
 
@@ -291,6 +304,7 @@ async def present(hub, ctx, name, zone_name, resource_group, record_type, if_mat
         if not ret['changes']:
             ret['result'] = True
             ret['comment'] = 'Record set {0} is already present.'.format(name)
+            await hub.exec.utils.fingerprint.record(fingerprint, rec_set)
             return ret
 
         if ctx['test']:
@@ -351,13 +365,14 @@ async def present(hub, ctx, name, zone_name, resource_group, record_type, if_mat
     if 'error' not in rec_set:
         ret['result'] = True
         ret['comment'] = 'Record set {0} has been created.'.format(name)
+        await hub.exec.utils.fingerprint.record(fingerprint, rec_set)
         return ret
 
     ret['comment'] = 'Failed to create record set {0}! ({1})'.format(name, rec_set.get('error'))
     return ret
 
 
-async def absent(hub, ctx, name, zone_name, resource_group, connection_auth=None):
+async def absent(hub, ctx, name, zone_name, resource_group, record_type, connection_auth=None):
     '''
     .. versionadded:: 1.0.0
 
@@ -372,6 +387,10 @@ async def absent(hub, ctx, name, zone_name, resource_group, connection_auth=None
     :param resource_group:
         The resource group assigned to the DNS zone.
 
+    :param record_type:
+        The type of DNS record in this record set. Possible values include: 'A', 'AAAA', 'CAA', 'CNAME', 'MX', 'NS',
+        'PTR', 'SOA', 'SRV', 'TXT'
+
     :param connection_auth:
         A dict with subscription and authentication parameters to be used in connecting to the
         Azure Resource Manager API.
@@ -391,7 +410,9 @@ async def absent(hub, ctx, name, zone_name, resource_group, connection_auth=None
         name,
         zone_name,
         resource_group,
+        record_type,
         azurearm_log_level='info',
+        ctx=ctx,
         **connection_auth
     )
 
@@ -409,7 +430,9 @@ async def absent(hub, ctx, name, zone_name, resource_group, connection_auth=None
         }
         return ret
 
-    deleted = await hub.exec.azurerm.dns.record_set.delete(name, zone_name, resource_group, **connection_auth)
+    deleted = await hub.exec.azurerm.dns.record_set.delete(
+        name, zone_name, resource_group, record_type, **connection_auth
+    )
 
     if deleted:
         ret['result'] = True
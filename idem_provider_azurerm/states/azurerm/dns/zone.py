@@ -166,7 +166,20 @@ async def present(hub, ctx, name, resource_group, etag=None, if_match=None, if_n
         ret['comment'] = 'Connection information must be specified via connection_auth dictionary!'
         return ret
 
-    zone = await hub.exec.azurerm.dns.zone.get(name, resource_group, azurearm_log_level='info', **connection_auth)
+    fingerprint = await hub.exec.utils.fingerprint.check_present(
+        ret, 'azurerm.dns.zone.present', 'DNS zone', dict(
+            kwargs, name=name, resource_group=resource_group, etag=etag, if_match=if_match, if_none_match=if_none_match,
+            registration_virtual_networks=registration_virtual_networks,
+            resolution_virtual_networks=resolution_virtual_networks, tags=tags, zone_type=zone_type,
+            connection_auth=connection_auth
+        )
+    )
+    if fingerprint['unchanged']:
+        return ret
+
+    zone = await hub.exec.azurerm.dns.zone.get(
+        name, resource_group, azurearm_log_level='info', ctx=ctx, **connection_auth
+    )
 
     if 'error' not in zone:
         tag_changes = await hub.exec.utils.dictdiffer.deep_diff(zone.get('tags', {}), tags or {})
@@ -211,6 +224,7 @@ async def present(hub, ctx, name, resource_group, etag=None, if_match=None, if_n
         if not ret['changes']:
             ret['result'] = True
             ret['comment'] = 'DNS zone {0} is already present.'.format(name)
+            await hub.exec.utils.fingerprint.record(fingerprint, zone)
             return ret
 
         if ctx['test']:
@@ -256,6 +270,7 @@ async def present(hub, ctx, name, resource_group, etag=None, if_match=None, if_n
     if 'error' not in zone:
         ret['result'] = True
         ret['comment'] = 'DNS zone {0} has been created.'.format(name)
+        await hub.exec.utils.fingerprint.record(fingerprint, zone)
         return ret
 
     ret['comment'] = 'Failed to create DNS zone {0}! ({1})'.format(name, zone.get('error'))
@@ -293,6 +308,7 @@ async def absent(hub, ctx, name, resource_group, connection_auth=None):
         name,
         resource_group,
         azurearm_log_level='info',
+        ctx=ctx,
         **connection_auth
     )
 
@@ -277,6 +277,18 @@ async def present(hub, ctx, name, resource_group, sku=None, frontend_ip_configur
         ret['comment'] = 'Connection information must be specified via connection_auth dictionary!'
         return ret
 
+    fingerprint = await hub.exec.utils.fingerprint.check_present(
+        ret, 'azurerm.network.load_balancer.present', 'Load balancer', dict(
+            kwargs, name=name, resource_group=resource_group, sku=sku,
+            frontend_ip_configurations=frontend_ip_configurations, backend_address_pools=backend_address_pools,
+            load_balancing_rules=load_balancing_rules, probes=probes, inbound_nat_rules=inbound_nat_rules,
+            inbound_nat_pools=inbound_nat_pools, outbound_nat_rules=outbound_nat_rules, tags=tags,
+            connection_auth=connection_auth
+        )
+    )
+    if fingerprint['unchanged']:
+        return ret
+
     if sku:
         sku = {'name': sku.capitalize()}
 
@@ -284,6 +296,7 @@ async def present(hub, ctx, name, resource_group, sku=None, frontend_ip_configur
         name,
         resource_group,
         azurearm_log_level='info',
+        ctx=ctx,
         **connection_auth
     )
 
@@ -402,6 +415,7 @@ async def present(hub, ctx, name, resource_group, sku=None, frontend_ip_configur
         if not ret['changes']:
             ret['result'] = True
             ret['comment'] = 'Load balancer {0} is already present.'.format(name)
+            await hub.exec.utils.fingerprint.record(fingerprint, load_bal)
             return ret
 
         if ctx['test']:
@@ -452,6 +466,7 @@ async def present(hub, ctx, name, resource_group, sku=None, frontend_ip_configur
     if 'error' not in load_bal:
         ret['result'] = True
         ret['comment'] = 'Load balancer {0} has been created.'.format(name)
+        await hub.exec.utils.fingerprint.record(fingerprint, load_bal)
         return ret
 
     ret['comment'] = 'Failed to create load balancer {0}! ({1})'.format(name, load_bal.get('error'))
@@ -489,6 +504,7 @@ async def absent(hub, ctx, name, resource_group, connection_auth=None):
         name,
         resource_group,
         azurearm_log_level='info',
+        ctx=ctx,
         **connection_auth
     )
 
@@ -165,10 +165,20 @@ async def present(hub, ctx, name, resource_group, gateway_ip_address, bgp_settin
         ret['comment'] = 'Connection information must be specified via connection_auth dictionary!'
         return ret
 
+    fingerprint = await hub.exec.utils.fingerprint.check_present(
+        ret, 'azurerm.network.local_network_gateway.present', 'Local network gateway', dict(
+            kwargs, name=name, resource_group=resource_group, gateway_ip_address=gateway_ip_address,
+            bgp_settings=bgp_settings, address_prefixes=address_prefixes, tags=tags, connection_auth=connection_auth
+        )
+    )
+    if fingerprint['unchanged']:
+        return ret
+
     gateway = await hub.exec.azurerm.network.local_network_gateway.get(
         name,
         resource_group,
         azurearm_log_level='info',
+        ctx=ctx,
         **connection_auth
     )
 
@@ -209,6 +219,7 @@ async def present(hub, ctx, name, resource_group, gateway_ip_address, bgp_settin
         if not ret['changes']:
             ret['result'] = True
             ret['comment'] = 'Local network gateway {0} is already present.'.format(name)
+            await hub.exec.utils.fingerprint.record(fingerprint, gateway)
             return ret
 
         if ctx['test']:
@@ -253,6 +264,7 @@ async def present(hub, ctx, name, resource_group, gateway_ip_address, bgp_settin
     if 'error' not in gateway:
         ret['result'] = True
         ret['comment'] = 'Local network gateway {0} has been created.'.format(name)
+        await hub.exec.utils.fingerprint.record(fingerprint, gateway)
         return ret
 
     ret['comment'] = 'Failed to create local network gateway {0}! ({1})'.format(name, gateway.get('error'))
@@ -300,6 +312,7 @@ async def absent(hub, ctx, name, resource_group, connection_auth=None):
         name,
         resource_group,
         azurearm_log_level='info',
+        ctx=ctx,
         **connection_auth
     )
 
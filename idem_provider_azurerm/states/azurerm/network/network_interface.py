@@ -200,10 +200,23 @@ async def present(hub, ctx, name, ip_configurations, subnet, virtual_network, re
         ret['comment'] = 'Connection information must be specified via connection_auth dictionary!'
         return ret
 
+    fingerprint = await hub.exec.utils.fingerprint.check_present(
+        ret, 'azurerm.network.network_interface.present', 'Network interface', dict(
+            kwargs, name=name, ip_configurations=ip_configurations, subnet=subnet, virtual_network=virtual_network,
+            resource_group=resource_group, tags=tags, virtual_machine=virtual_machine,
+            network_security_group=network_security_group, dns_settings=dns_settings, mac_address=mac_address,
+            primary=primary, enable_accelerated_networking=enable_accelerated_networking,
+            enable_ip_forwarding=enable_ip_forwarding, connection_auth=connection_auth
+        )
+    )
+    if fingerprint['unchanged']:
+        return ret
+
     iface = await hub.exec.azurerm.network.network_interface.get(
         name,
         resource_group,
         azurearm_log_level='info',
+        ctx=ctx,
         **connection_auth
     )
 
@@ -297,6 +310,7 @@ async def present(hub, ctx, name, ip_configurations, subnet, virtual_network, re
         if not ret['changes']:
             ret['result'] = True
             ret['comment'] = 'Network interface {0} is already present.'.format(name)
+            await hub.exec.utils.fingerprint.record(fingerprint, iface)
             return ret
 
         if ctx['test']:
@@ -349,6 +363,7 @@ async def present(hub, ctx, name, ip_configurations, subnet, virtual_network, re
     if 'error' not in iface:
         ret['result'] = True
         ret['comment'] = 'Network interface {0} has been created.'.format(name)
+        await hub.exec.utils.fingerprint.record(fingerprint, iface)
         return ret
 
     ret['comment'] = 'Failed to create network interface {0}! ({1})'.format(name, iface.get('error'))
@@ -386,6 +401,7 @@ async def absent(hub, ctx, name, resource_group, connection_auth=None):
         name,
         resource_group,
         azurearm_log_level='info',
+        ctx=ctx,
         **connection_auth
     )
 
@@ -171,10 +171,20 @@ async def present(hub, ctx, name, resource_group, tags=None, security_rules=None
         ret['comment'] = 'Connection information must be specified via connection_auth dictionary!'
         return ret
 
+    fingerprint = await hub.exec.utils.fingerprint.check_present(
+        ret, 'azurerm.network.network_security_group.present', 'Network security group', dict(
+            kwargs, name=name, resource_group=resource_group, tags=tags, security_rules=security_rules,
+            connection_auth=connection_auth
+        )
+    )
+    if fingerprint['unchanged']:
+        return ret
+
     nsg = await hub.exec.azurerm.network.network_security_group.get(
         name,
         resource_group,
         azurearm_log_level='info',
+        ctx=ctx,
         **connection_auth
     )
 
@@ -196,6 +206,7 @@ async def present(hub, ctx, name, resource_group, tags=None, security_rules=None
         if not ret['changes']:
             ret['result'] = True
             ret['comment'] = 'Network security group {0} is already present.'.format(name)
+            await hub.exec.utils.fingerprint.record(fingerprint, nsg)
             return ret
 
         if ctx['test']:
@@ -233,6 +244,7 @@ async def present(hub, ctx, name, resource_group, tags=None, security_rules=None
     if 'error' not in nsg:
         ret['result'] = True
         ret['comment'] = 'Network security group {0} has been created.'.format(name)
+        await hub.exec.utils.fingerprint.record(fingerprint, nsg)
         return ret
 
     ret['comment'] = 'Failed to create network security group {0}! ({1})'.format(name, nsg.get('error'))
@@ -270,6 +282,7 @@ async def absent(hub, ctx, name, resource_group, connection_auth=None):
         name,
         resource_group,
         azurearm_log_level='info',
+        ctx=ctx,
         **connection_auth
     )
 
@@ -409,6 +422,20 @@ async def security_rule_present(hub, ctx, name, access, direction, priority, pro
         ret['comment'] = 'Connection information must be specified via connection_auth dictionary!'
         return ret
 
+    fingerprint = await hub.exec.utils.fingerprint.check_present(
+        ret, 'azurerm.network.network_security_group.security_rule_present', 'Security rule', dict(
+            kwargs, name=name, access=access, direction=direction, priority=priority, protocol=protocol,
+            security_group=security_group, resource_group=resource_group,
+            destination_address_prefix=destination_address_prefix, destination_port_range=destination_port_range,
+            source_address_prefix=source_address_prefix, source_port_range=source_port_range, description=description,
+            destination_address_prefixes=destination_address_prefixes, destination_port_ranges=destination_port_ranges,
+            source_address_prefixes=source_address_prefixes, source_port_ranges=source_port_ranges,
+            connection_auth=connection_auth
+        )
+    )
+    if fingerprint['unchanged']:
+        return ret
+
     exclusive_params = [
         ('source_port_ranges', 'source_port_range'),
         ('source_address_prefixes', 'source_address_prefix'),
@@ -555,6 +582,7 @@ async def security_rule_present(hub, ctx, name, access, direction, priority, pro
         if not ret['changes']:
             ret['result'] = True
             ret['comment'] = 'Security rule {0} is already present.'.format(name)
+            await hub.exec.utils.fingerprint.record(fingerprint, rule)
             return ret
 
         if ctx['test']:
@@ -614,6 +642,7 @@ async def security_rule_present(hub, ctx, name, access, direction, priority, pro
     if 'error' not in rule:
         ret['result'] = True
         ret['comment'] = 'Security rule {0} has been created.'.format(name)
+        await hub.exec.utils.fingerprint.record(fingerprint, rule)
         return ret
 
     ret['comment'] = 'Failed to create security rule {0}! ({1})'.format(name, rule.get('error'))
@@ -173,6 +173,17 @@ async def present(hub, ctx, name, resource_group, tags=None, sku=None, public_ip
         ret['comment'] = 'Connection information must be specified via connection_auth dictionary!'
         return ret
 
+    fingerprint = await hub.exec.utils.fingerprint.check_present(
+        ret, 'azurerm.network.public_ip_address.present', 'Public IP address', dict(
+            kwargs, name=name, resource_group=resource_group, tags=tags, sku=sku,
+            public_ip_allocation_method=public_ip_allocation_method,
+            public_ip_address_version=public_ip_address_version, dns_settings=dns_settings,
+            idle_timeout_in_minutes=idle_timeout_in_minutes, connection_auth=connection_auth
+        )
+    )
+    if fingerprint['unchanged']:
+        return ret
+
     if sku:
         sku = {'name': sku.capitalize()}
 
@@ -180,6 +191,7 @@ async def present(hub, ctx, name, resource_group, tags=None, sku=None, public_ip
         name,
         resource_group,
         azurearm_log_level='info',
+        ctx=ctx,
         **connection_auth
     )
 
@@ -235,6 +247,7 @@ async def present(hub, ctx, name, resource_group, tags=None, sku=None, public_ip
         if not ret['changes']:
             ret['result'] = True
             ret['comment'] = 'Public IP address {0} is already present.'.format(name)
+            await hub.exec.utils.fingerprint.record(fingerprint, pub_ip)
             return ret
 
         if ctx['test']:
@@ -279,6 +292,7 @@ async def present(hub, ctx, name, resource_group, tags=None, sku=None, public_ip
     if 'error' not in pub_ip:
         ret['result'] = True
         ret['comment'] = 'Public IP address {0} has been created.'.format(name)
+        await hub.exec.utils.fingerprint.record(fingerprint, pub_ip)
         return ret
 
     ret['comment'] = 'Failed to create public IP address {0}! ({1})'.format(name, pub_ip.get('error'))
@@ -316,6 +330,7 @@ async def absent(hub, ctx, name, resource_group, connection_auth=None):
         name,
         resource_group,
         azurearm_log_level='info',
+        ctx=ctx,
         **connection_auth
     )
 
@@ -161,6 +161,15 @@ async def table_present(hub, ctx, name, resource_group, tags=None, routes=None,
         ret['comment'] = 'Connection information must be specified via connection_auth dictionary!'
         return ret
 
+    fingerprint = await hub.exec.utils.fingerprint.check_present(
+        ret, 'azurerm.network.route.table_present', 'Route table', dict(
+            kwargs, name=name, resource_group=resource_group, tags=tags, routes=routes,
+            disable_bgp_route_propagation=disable_bgp_route_propagation, connection_auth=connection_auth
+        )
+    )
+    if fingerprint['unchanged']:
+        return ret
+
     rt_tbl = await hub.exec.azurerm.network.route.table_get(
         name,
         resource_group,
@@ -196,6 +205,7 @@ async def table_present(hub, ctx, name, resource_group, tags=None, routes=None,
         if not ret['changes']:
             ret['result'] = True
             ret['comment'] = 'Route table {0} is already present.'.format(name)
+            await hub.exec.utils.fingerprint.record(fingerprint, rt_tbl)
             return ret
 
         if ctx['test']:
@@ -234,6 +244,7 @@ async def table_present(hub, ctx, name, resource_group, tags=None, routes=None,
     if 'error' not in rt_tbl:
         ret['result'] = True
         ret['comment'] = 'Route table {0} has been created.'.format(name)
+        await hub.exec.utils.fingerprint.record(fingerprint, rt_tbl)
         return ret
 
     ret['comment'] = 'Failed to create route table {0}! ({1})'.format(name, rt_tbl.get('error'))
@@ -361,11 +372,21 @@ async def present(hub, ctx, name, address_prefix, next_hop_type, route_table, re
         ret['comment'] = 'Connection information must be specified via connection_auth dictionary!'
         return ret
 
+    fingerprint = await hub.exec.utils.fingerprint.check_present(
+        ret, 'azurerm.network.route.present', 'Route', dict(
+            kwargs, name=name, address_prefix=address_prefix, next_hop_type=next_hop_type, route_table=route_table,
+            resource_group=resource_group, next_hop_ip_address=next_hop_ip_address, connection_auth=connection_auth
+        )
+    )
+    if fingerprint['unchanged']:
+        return ret
+
     route = await hub.exec.azurerm.network.route.get(
         name,
         route_table,
         resource_group,
         azurearm_log_level='info',
+        ctx=ctx,
         **connection_auth
     )
 
@@ -391,6 +412,7 @@ async def present(hub, ctx, name, address_prefix, next_hop_type, route_table, re
         if not ret['changes']:
             ret['result'] = True
             ret['comment'] = 'Route {0} is already present.'.format(name)
+            await hub.exec.utils.fingerprint.record(fingerprint, route)
             return ret
 
         if ctx['test']:
@@ -430,6 +452,7 @@ async def present(hub, ctx, name, address_prefix, next_hop_type, route_table, re
     if 'error' not in route:
         ret['result'] = True
         ret['comment'] = 'Route {0} has been created.'.format(name)
+        await hub.exec.utils.fingerprint.record(fingerprint, route)
         return ret
 
     ret['comment'] = 'Failed to create route {0}! ({1})'.format(name, route.get('error'))
@@ -471,6 +494,7 @@ async def absent(hub, ctx, name, route_table, resource_group, connection_auth=No
         route_table,
         resource_group,
         azurearm_log_level='info',
+        ctx=ctx,
         **connection_auth
     )
 
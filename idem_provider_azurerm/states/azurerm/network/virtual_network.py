@@ -155,10 +155,20 @@ async def present(hub, ctx, name, address_prefixes, resource_group, dns_servers=
         ret['comment'] = 'Connection information must be specified via connection_auth dictionary!'
         return ret
 
+    fingerprint = await hub.exec.utils.fingerprint.check_present(
+        ret, 'azurerm.network.virtual_network.present', 'Virtual network', dict(
+            kwargs, name=name, address_prefixes=address_prefixes, resource_group=resource_group,
+            dns_servers=dns_servers, tags=tags, connection_auth=connection_auth
+        )
+    )
+    if fingerprint['unchanged']:
+        return ret
+
     vnet = await hub.exec.azurerm.network.virtual_network.get(
         name,
         resource_group,
         azurearm_log_level='info',
+        ctx=ctx,
         **connection_auth
     )
 
@@ -200,6 +210,7 @@ async def present(hub, ctx, name, address_prefixes, resource_group, dns_servers=
         if not ret['changes']:
             ret['result'] = True
             ret['comment'] = 'Virtual network {0} is already present.'.format(name)
+            await hub.exec.utils.fingerprint.record(fingerprint, vnet)
             return ret
 
         if ctx['test']:
@@ -241,6 +252,7 @@ async def present(hub, ctx, name, address_prefixes, resource_group, dns_servers=
     if 'error' not in vnet:
         ret['result'] = True
         ret['comment'] = 'Virtual network {0} has been created.'.format(name)
+        await hub.exec.utils.fingerprint.record(fingerprint, vnet)
         return ret
 
     ret['comment'] = 'Failed to create virtual network {0}! ({1})'.format(name, vnet.get('error'))
@@ -278,6 +290,7 @@ async def absent(hub, ctx, name, resource_group, connection_auth=None):
         name,
         resource_group,
         azurearm_log_level='info',
+        ctx=ctx,
         **connection_auth
     )
 
@@ -369,6 +382,16 @@ async def subnet_present(hub, ctx, name, address_prefix, virtual_network, resour
         ret['comment'] = 'Connection information must be specified via connection_auth dictionary!'
         return ret
 
+    fingerprint = await hub.exec.utils.fingerprint.check_present(
+        ret, 'azurerm.network.virtual_network.subnet_present', 'Subnet', dict(
+            kwargs, name=name, address_prefix=address_prefix, virtual_network=virtual_network,
+            resource_group=resource_group, security_group=security_group, route_table=route_table,
+            connection_auth=connection_auth
+        )
+    )
+    if fingerprint['unchanged']:
+        return ret
+
     snet = await hub.exec.azurerm.network.virtual_network.subnet_get(
         name,
         virtual_network,
@@ -407,6 +430,7 @@ async def subnet_present(hub, ctx, name, address_prefix, virtual_network, resour
         if not ret['changes']:
             ret['result'] = True
             ret['comment'] = 'Subnet {0} is already present.'.format(name)
+            await hub.exec.utils.fingerprint.record(fingerprint, snet)
             return ret
 
         if ctx['test']:
@@ -446,6 +470,7 @@ async def subnet_present(hub, ctx, name, address_prefix, virtual_network, resour
     if 'error' not in snet:
         ret['result'] = True
         ret['comment'] = 'Subnet {0} has been created.'.format(name)
+        await hub.exec.utils.fingerprint.record(fingerprint, snet)
         return ret
 
     ret['comment'] = 'Failed to create subnet {0}! ({1})'.format(name, snet.get('error'))
@@ -244,6 +244,20 @@ async def connection_present(hub, ctx, name, resource_group, virtual_network_gat
         ret['comment'] = 'Connection information must be specified via connection_auth dictionary!'
         return ret
 
+    fingerprint = await hub.exec.utils.fingerprint.check_present(
+        ret, 'azurerm.network.virtual_network_gateway.connection_present', 'Virtual network gateway connection', dict(
+            kwargs, name=name, resource_group=resource_group, virtual_network_gateway=virtual_network_gateway,
+            connection_type=connection_type, virtual_network_gateway2=virtual_network_gateway2,
+            local_network_gateway2=local_network_gateway2, peer=peer, connection_protocol=connection_protocol,
+            shared_key=shared_key, enable_bgp=enable_bgp, ipsec_policies=ipsec_policies,
+            use_policy_based_traffic_selectors=use_policy_based_traffic_selectors, routing_weight=routing_weight,
+            express_route_gateway_bypass=express_route_gateway_bypass, authorization_key=authorization_key, tags=tags,
+            connection_auth=connection_auth
+        )
+    )
+    if fingerprint['unchanged']:
+        return ret
+
     connection = await hub.exec.azurerm.network.virtual_network_gateway.connection_get(
         name,
         resource_group,
@@ -347,6 +361,7 @@ async def connection_present(hub, ctx, name, resource_group, virtual_network_gat
         if not ret['changes']:
             ret['result'] = True
             ret['comment'] = 'Virtual network gateway connection {0} is already present.'.format(name)
+            await hub.exec.utils.fingerprint.record(fingerprint, connection)
             return ret
 
         if ctx['test']:
@@ -431,6 +446,7 @@ async def connection_present(hub, ctx, name, resource_group, virtual_network_gat
     if 'error' not in con:
         ret['result'] = True
         ret['comment'] = 'Virtual network gateway connection {0} has been created.'.format(name)
+        await hub.exec.utils.fingerprint.record(fingerprint, con)
         return ret
 
     ret['comment'] = 'Failed to create virtual network gateway connection {0}! ({1})'.format(name, con.get('error'))
@@ -644,10 +660,22 @@ async def present(hub, ctx, name, resource_group, virtual_network, ip_configurat
         ret['comment'] = 'Connection information must be specified via connection_auth dictionary!'
         return ret
 
+    fingerprint = await hub.exec.utils.fingerprint.check_present(
+        ret, 'azurerm.network.virtual_network_gateway.present', 'Virtual network gateway', dict(
+            kwargs, name=name, resource_group=resource_group, virtual_network=virtual_network,
+            ip_configurations=ip_configurations, gateway_type=gateway_type, vpn_type=vpn_type, sku=sku,
+            enable_bgp=enable_bgp, active_active=active_active, bgp_settings=bgp_settings,
+            address_prefixes=address_prefixes, tags=tags, connection_auth=connection_auth
+        )
+    )
+    if fingerprint['unchanged']:
+        return ret
+
     gateway = await hub.exec.azurerm.network.virtual_network_gateway.get(
         name,
         resource_group,
         azurearm_log_level='info',
+        ctx=ctx,
         **connection_auth
     )
 
@@ -715,6 +743,7 @@ async def present(hub, ctx, name, resource_group, virtual_network, ip_configurat
         if not ret['changes']:
             ret['result'] = True
             ret['comment'] = 'Virtual network gateway {0} is already present.'.format(name)
+            await hub.exec.utils.fingerprint.record(fingerprint, gateway)
             return ret
 
         if ctx['test']:
@@ -777,6 +806,7 @@ async def present(hub, ctx, name, resource_group, virtual_network, ip_configurat
     if 'error' not in gateway:
         ret['result'] = True
         ret['comment'] = 'Virtual network gateway {0} has been created.'.format(name)
+        await hub.exec.utils.fingerprint.record(fingerprint, gateway)
         return ret
 
     ret['comment'] = 'Failed to create virtual network gateway {0}! ({1})'.format(name, gateway.get('error'))
@@ -824,6 +854,7 @@ async def absent(hub, ctx, name, resource_group, connection_auth=None):
         name,
         resource_group,
         azurearm_log_level='info',
+        ctx=ctx,
         **connection_auth
     )
 
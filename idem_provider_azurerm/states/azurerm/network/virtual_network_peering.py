@@ -176,11 +176,24 @@ async def present(hub, ctx, name, remote_virtual_network, virtual_network, resou
         ret['comment'] = 'Connection information must be specified via connection_auth dictionary!'
         return ret
 
+    fingerprint = await hub.exec.utils.fingerprint.check_present(
+        ret, 'azurerm.network.virtual_network_peering.present', 'Peering object', dict(
+            kwargs, name=name, remote_virtual_network=remote_virtual_network, virtual_network=virtual_network,
+            resource_group=resource_group, remote_vnet_group=remote_vnet_group,
+            allow_virtual_network_access=allow_virtual_network_access, allow_forwarded_traffic=allow_forwarded_traffic,
+            allow_gateway_transit=allow_gateway_transit, use_remote_gateways=use_remote_gateways,
+            connection_auth=connection_auth
+        )
+    )
+    if fingerprint['unchanged']:
+        return ret
+
     peering = await hub.exec.azurerm.network.virtual_network_peering.get(
         name,
         virtual_network,
         resource_group,
         azurearm_log_level='info',
+        ctx=ctx,
         **connection_auth
     )
 
@@ -205,6 +218,7 @@ async def present(hub, ctx, name, remote_virtual_network, virtual_network, resou
         if not ret['changes']:
             ret['result'] = True
             ret['comment'] = 'Peering object {0} is already present.'.format(name)
+            await hub.exec.utils.fingerprint.record(fingerprint, peering)
             return ret
 
         if ctx['test']:
@@ -258,6 +272,7 @@ async def present(hub, ctx, name, remote_virtual_network, virtual_network, resou
             virtual_network=remote_virtual_network,
             resource_group=remote_vnet_group,
             azurearm_log_level='info',
+            ctx=ctx,
             **connection_auth
         )
 
@@ -290,6 +305,7 @@ async def present(hub, ctx, name, remote_virtual_network, virtual_network, resou
     if 'error' not in peering:
         ret['result'] = True
         ret['comment'] = 'Peering object {0} has been created.'.format(name)
+        await hub.exec.utils.fingerprint.record(fingerprint, peering)
         return ret
 
     ret['comment'] = 'Failed to create peering object {0}! ({1})'.format(name, peering.get('error'))
@@ -331,6 +347,7 @@ async def absent(hub, ctx, name, virtual_network, resource_group, connection_aut
         virtual_network,
         resource_group,
         azurearm_log_level='info',
+        ctx=ctx,
         **connection_auth
     )
 
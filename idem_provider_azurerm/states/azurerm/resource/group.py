@@ -141,7 +141,7 @@ async def present(hub, ctx, name, location, managed_by=None, tags=None, connecti
     present = await hub.exec.azurerm.resource.group.check_existence(name, **connection_auth)
 
     if present:
-        group = await hub.exec.azurerm.resource.group.get(name, **connection_auth)
+        group = await hub.exec.azurerm.resource.group.get(name, ctx=ctx, **connection_auth)
         ret['changes'] = await hub.exec.utils.dictdiffer.deep_diff(group.get('tags', {}), tags or {})
 
         if not ret['changes']:
@@ -231,7 +231,7 @@ async def absent(hub, ctx, name, connection_auth=None):
         return ret
 
     elif ctx['test']:
-        group = await hub.exec.azurerm.resource.group.get(name, **connection_auth)
+        group = await hub.exec.azurerm.resource.group.get(name, ctx=ctx, **connection_auth)
 
         ret['comment'] = 'Resource group {0} would be deleted.'.format(name)
         ret['result'] = None
@@ -241,7 +241,7 @@ async def absent(hub, ctx, name, connection_auth=None):
         }
         return ret
 
-    group = await hub.exec.azurerm.resource.group.get(name, **connection_auth)
+    group = await hub.exec.azurerm.resource.group.get(name, ctx=ctx, **connection_auth)
     deleted = await hub.exec.azurerm.resource.group.delete(name, **connection_auth)
 
     if deleted:
@@ -20,6 +20,9 @@ SETUP_DIRNAME = os.path.dirname(__file__)
 if not SETUP_DIRNAME:
     SETUP_DIRNAME = os.getcwd()
 
+with open(os.path.join(SETUP_DIRNAME, 'requirements.txt')) as rfh:
+    REQUIREMENTS = [line.strip() for line in rfh if line.strip() and not line.startswith('#')]
+
 
 class Clean(Command):
     user_options = []
@@ -30,7 +33,7 @@ class Clean(Command):
         pass
 
     def run(self):
-        for subdir in (NAME, 'tests'):
+        for subdir in (NAME, 'tests', 'tools'):
             for root, dirs, files in os.walk(os.path.join(os.path.dirname(__file__), subdir)):
                 for dir_ in dirs:
                     if dir_ == '__pycache__':
@@ -61,5 +64,6 @@ setup(name=PYPI_NAME,
           'Development Status :: 5 - Production/Stable',
           ],
       packages=discover_packages(),
+      install_requires=REQUIREMENTS,
       cmdclass={'clean': Clean},
       )
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+'''
+Fixtures shared by the tests
+'''
+# Import third party libs
+import pop.hub
+import pytest
+
+# Import local libs
+from idem_provider_azurerm.conf import CONFIG
+from tools.emulator import SUBSCRIPTION_ID, ArmEmulator
+
+
+@pytest.fixture
+def hub_options(tmp_path):
+    '''
+    The idem options the hub is built with, on top of the defaults. Override this fixture to change them.
+    '''
+    return {'azurerm_cache_dir': str(tmp_path)}
+
+
+@pytest.fixture
+def hub(hub_options):
+    '''
+    A hub with the exec modules loaded and the idem options set to the defaults of the provider configuration
+    '''
+    hub = pop.hub.Hub()
+    hub.OPT = {'idem': dict(
+        (name, opt['default']) for name, opt in CONFIG.items() if opt.get('dyne') == 'idem'
+    )}
+    hub.OPT['idem'].update(hub_options)
+    hub.pop.sub.add(dyne_name='exec')
+    hub.pop.sub.load_subdirs(hub.exec, recurse=True)
+
+    return hub
+
+
+@pytest.fixture
+def emulator():
+    '''
+    A running ARM emulator
+    '''
+    with ArmEmulator() as arm:
+        yield arm
+
+
+@pytest.fixture
+def connection_auth(emulator):
+    '''
+    Provider credentials for the emulator, which accepts any bearer token
+    '''
+    return {
+        'subscription_id': SUBSCRIPTION_ID,
+        'access_token': 'test',
+        'cloud_environment': emulator.url,
+    }
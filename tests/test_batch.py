@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+'''
+Tests for reading resources through the ARM batch endpoint with batch_get
+'''
+# Import python libs
+import asyncio
+import json
+import time
+import urllib.request
+
+# Import third party libs
+import pytest
+from msrestazure.azure_exceptions import CloudError
+
+# Import local libs
+from tools.emulator import SUBSCRIPTION_ID
+
+GROUP = '/subscriptions/{0}/resourceGroups/batched'.format(SUBSCRIPTION_ID)
+
+PUBLIC_IPS = GROUP + '/providers/Microsoft.Network/publicIPAddresses/'
+
+
+def _put(emulator, path, body):
+    request = urllib.request.Request(
+        emulator.url + path + '?api-version=2020-04-01', data=json.dumps(body).encode('utf-8'), method='PUT',
+        headers={'Content-Type': 'application/json'}
+    )
+    with urllib.request.urlopen(request, timeout=10) as resp:
+        return resp.status
+
+
+@pytest.fixture
+def public_ip(emulator):
+    '''
+    A resource group holding a public IP address, and a public IP address path which always fails
+    '''
+    _put(emulator, GROUP, {'location': 'eastus'})
+    _put(emulator, PUBLIC_IPS + 'found', {'location': 'eastus'})
+    emulator.fail(PUBLIC_IPS + 'failing', 500, 'InternalServerError')
+
+    return PUBLIC_IPS + 'found'
+
+
+async def _batch_get(hub, connection_auth, names):
+    netconn = await hub.exec.utils.azurerm.get_client('network', **connection_auth)
+    return await asyncio.gather(*[
+        hub.exec.utils.azurerm.batch_get(netconn.public_ip_addresses, 'PublicIPAddress', PUBLIC_IPS + name)
+        for name in names
+    ], return_exceptions=True)
+
+
+def test_mixed_batch(hub, emulator, connection_auth, public_ip):
+    found, missing, failing = asyncio.run(_batch_get(hub, connection_auth, ['found', 'missing', 'failing']))
+
+    assert found['id'] == public_ip
+    assert found['name'] == 'found'
+
+    assert isinstance(missing, CloudError)
+    assert missing.status_code == 404
+    assert missing.error.error == 'ResourceNotFound'
+    assert missing.response.reason == 'Not Found'
+
+    assert isinstance(failing, CloudError)
+    assert failing.status_code == 500
+    assert failing.error.error == 'InternalServerError'
+    assert failing.response.reason == 'Internal Server Error'
+
+    # All three reads were sent in a single batch
+    assert asyncio.run(hub.exec.utils.azurerm.batch_stats()) == {'requests': 3, 'batches': 1}
+    assert emulator.stats['batched'] == 3
+    assert ('network', 'batch.send', '200') in hub.exec.utils.azurerm.METRICS
+
+
+def test_batch_counts_reads(hub, emulator, connection_auth, public_ip):
+    # With no reads left, the batch waits for the maximum throttle delay; writes are untouched
+    hub.OPT['idem']['azurerm_throttle_max_delay'] = 0.3
+    hub.exec.utils.azurerm.RATE_LIMITS[SUBSCRIPTION_ID] = {'reads': 0, 'writes': 1200}
+
+    start = time.monotonic()
+    found, = asyncio.run(_batch_get(hub, connection_auth, ['found']))
+
+    assert found['name'] == 'found'
+    assert time.monotonic() - start >= 0.3
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+'''
+Tests for coalescing identical concurrent reads made through run
+'''
+# Import python libs
+import asyncio
+import json
+import os
+
+# Import third party libs
+import pytest
+
+# Import local libs
+from tools.emulator import SUBSCRIPTION_ID
+
+RECORDING = os.path.join(os.path.dirname(__file__), 'files', 'public_ip_addresses_list.json')
+RECORDED_PATH = '/subscriptions/{0}/resourceGroups/recorded/providers/Microsoft.Network/publicIPAddresses'.format(
+    SUBSCRIPTION_ID
+)
+
+
+@pytest.fixture
+def recorded(emulator):
+    '''
+    Replay the recorded pages for the recorded resource group, returning them
+    '''
+    with open(RECORDING) as recording:
+        pages = json.load(recording)
+    emulator.replay(RECORDED_PATH, pages)
+
+    return pages
+
+
+def test_concurrent_lists_are_not_shared(hub, emulator, connection_auth, recorded):
+    async def _list(netconn):
+        paged = await hub.exec.utils.azurerm.run(netconn.public_ip_addresses.list, resource_group_name='recorded')
+        return await hub.exec.utils.azurerm.paged_object_to_list(paged)
+
+    async def _lists():
+        netconn = await hub.exec.utils.azurerm.get_client('network', **connection_auth)
+        return await asyncio.gather(_list(netconn), _list(netconn))
+
+    first, second = asyncio.run(_lists())
+
+    names = [item['name'] for page in recorded for item in page['value']]
+    assert [item['name'] for item in first] == names
+    assert [item['name'] for item in second] == names
+    assert emulator.stats['replayed'] == 2 * len(recorded)
+    assert hub.exec.utils.azurerm.INFLIGHT_STATS['coalesced'] == 0
+
+
+def test_concurrent_gets_are_shared(hub, emulator, connection_auth):
+    async def _gets():
+        resconn = await hub.exec.utils.azurerm.get_client('resource', **connection_auth)
+        await hub.exec.utils.azurerm.run(resconn.resource_groups.create_or_update, 'coalesced', {'location': 'eastus'})
+        requests = emulator.stats['requests']
+        groups = await asyncio.gather(*[
+            hub.exec.utils.azurerm.run(resconn.resource_groups.get, 'coalesced') for _ in range(4)
+        ])
+        return groups, emulator.stats['requests'] - requests
+
+    groups, requests = asyncio.run(_gets())
+
+    assert [group.name for group in groups] == ['coalesced'] * 4
+    assert requests == 1
+    assert hub.exec.utils.azurerm.INFLIGHT_STATS['coalesced'] == 3
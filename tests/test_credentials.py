@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+'''
+Tests for caching and refreshing service principal tokens, issued by a stub ADFS token endpoint
+'''
+# Import python libs
+import asyncio
+import datetime
+import ipaddress
+import json
+import ssl
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Import third party libs
+import pytest
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+TOKEN_LIFETIME = 4
+
+REFRESH_MARGIN = 3
+
+
+class _TokenHandler(BaseHTTPRequestHandler):
+    '''
+    Serve the cloud metadata endpoint and an ADFS token endpoint which issues a new token to any client
+    '''
+    def do_GET(self):  # pylint: disable=invalid-name
+        base_url = 'https://{0}'.format(self.headers['Host'])
+        self._send({
+            'galleryEndpoint': base_url + '/',
+            'graphEndpoint': base_url + '/',
+            'portalEndpoint': base_url + '/',
+            'authentication': {'loginEndpoint': base_url + '/adfs', 'audiences': [base_url + '/']},
+        })
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        self.server.tokens += 1
+        now = int(time.time())
+        self._send({
+            'token_type': 'Bearer',
+            'access_token': str(uuid.uuid4()),
+            'expires_in': str(TOKEN_LIFETIME),
+            'expires_on': str(now + TOKEN_LIFETIME),
+            'not_before': str(now),
+            'resource': 'https://{0}/'.format(self.headers['Host']),
+        })
+
+    def _send(self, body):
+        payload = json.dumps(body).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+
+@pytest.fixture(scope='module')
+def certificate(tmp_path_factory):
+    '''
+    Write a self-signed certificate and key for 127.0.0.1, returning their paths
+    '''
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, '127.0.0.1')])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    builder = x509.CertificateBuilder().subject_name(name).issuer_name(name).public_key(key.public_key())
+    builder = builder.serial_number(x509.random_serial_number())
+    builder = builder.not_valid_before(now - datetime.timedelta(minutes=5))
+    builder = builder.not_valid_after(now + datetime.timedelta(days=1))
+    builder = builder.add_extension(
+        x509.SubjectAlternativeName([x509.IPAddress(ipaddress.ip_address('127.0.0.1'))]), critical=False
+    )
+    builder = builder.add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+    cert = builder.sign(key, hashes.SHA256())
+
+    directory = tmp_path_factory.mktemp('tls')
+    certfile = directory / 'cert.pem'
+    keyfile = directory / 'key.pem'
+    certfile.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+    keyfile.write_bytes(key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ))
+
+    return str(certfile), str(keyfile)
+
+
+@pytest.fixture
+def token_server(certificate, monkeypatch):
+    '''
+    An HTTPS token endpoint, trusted through REQUESTS_CA_BUNDLE since ADAL only authenticates over HTTPS
+    '''
+    monkeypatch.setenv('REQUESTS_CA_BUNDLE', certificate[0])
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _TokenHandler)
+    server.daemon_threads = True
+    server.tokens = 0
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(*certificate)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+@pytest.fixture
+def hub_options(tmp_path):
+    '''
+    Refresh tokens REFRESH_MARGIN seconds before they expire
+    '''
+    return {'azurerm_cache_dir': str(tmp_path), 'azurerm_token_refresh_margin': REFRESH_MARGIN}
+
+
+@pytest.fixture
+def service_principal(token_server):
+    '''
+    Service principal credentials for the stub token endpoint
+    '''
+    return {
+        'subscription_id': '00000000-0000-0000-0000-000000000000',
+        'client_id': 'client',
+        'secret': 'secret',
+        'tenant': 'adfs',
+        'cloud_environment': 'https://127.0.0.1:{0}'.format(token_server.server_address[1]),
+    }
+
+
+def test_token_is_cached(hub, token_server, service_principal):
+    async def _clients():
+        try:
+            clients = await asyncio.gather(*[
+                hub.exec.utils.azurerm.get_client(client_type, **service_principal)
+                for client_type in ('network', 'compute', 'resource', 'network')
+            ])
+            clients.append(await hub.exec.utils.azurerm.get_client('dns', **service_principal))
+            return clients
+        finally:
+            await hub.exec.utils.azurerm.clear_token_cache()
+
+    clients = asyncio.run(_clients())
+
+    assert token_server.tokens == 1
+    assert len(set(id(client.config.credentials) for client in clients)) == 1
+
+
+def test_token_is_refreshed_before_expiry(hub, token_server, service_principal):
+    async def _refresh():
+        try:
+            client = await hub.exec.utils.azurerm.get_client('network', **service_principal)
+            credentials = client.config.credentials
+            first = dict(credentials.token)
+            started = time.time()
+
+            while credentials.token['access_token'] == first['access_token'] and \
+                    time.time() - started < TOKEN_LIFETIME:
+                await asyncio.sleep(0.1)
+            refreshed = time.time()
+
+            client = await hub.exec.utils.azurerm.get_client('resource', **service_principal)
+            return first, refreshed, started, dict(client.config.credentials.token)
+        finally:
+            await hub.exec.utils.azurerm.clear_token_cache()
+
+    first, refreshed, started, second = asyncio.run(_refresh())
+
+    assert token_server.tokens == 2
+    assert second['access_token'] != first['access_token']
+    # The refresh was due REFRESH_MARGIN seconds before the first token expired, and happened well before expiry
+    assert refreshed - started < TOKEN_LIFETIME - REFRESH_MARGIN + 1
+    assert float(second['expires_on']) > float(first['expires_on'])
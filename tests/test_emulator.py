@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+'''
+Tests for the routes served by the local ARM emulator, made over plain HTTP
+'''
+# Import python libs
+import http.client
+import json
+from urllib.parse import urlsplit
+
+# Import third party libs
+import pytest
+
+# Import local libs
+from tools.emulator import ArmEmulator
+
+SUBSCRIPTION = '/subscriptions/00000000-0000-0000-0000-000000000000'
+
+GROUP = SUBSCRIPTION + '/resourceGroups/emulated'
+
+NETWORK = GROUP + '/providers/Microsoft.Network'
+
+
+def _request(emulator, method, url, body=None, headers=None):
+    '''
+    Make a request of the emulator, returning the status, the lower cased response headers and the decoded body
+    '''
+    parts = urlsplit(url)
+    path = '{0}?{1}'.format(parts.path, parts.query) if parts.query else parts.path
+    conn = http.client.HTTPConnection(urlsplit(emulator.url).netloc, timeout=10)
+    try:
+        conn.request(method, path, body=None if body is None else json.dumps(body),
+                     headers=dict(headers or {}, **{'Content-Type': 'application/json'}))
+        resp = conn.getresponse()
+        raw = resp.read()
+        return resp.status, dict((key.lower(), value) for key, value in resp.getheaders()), \
+            json.loads(raw.decode('utf-8')) if raw else None
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def arm():
+    '''
+    A running emulator with a resource group, whose long-running operations complete after two polls
+    '''
+    with ArmEmulator(page_size=2, lro_polls=2) as emulator:
+        status, _, _ = _request(emulator, 'PUT', GROUP, {'location': 'eastus'})
+        assert status == 201
+        yield emulator
+
+
+def test_metadata_points_at_the_emulator(arm):
+    status, _, body = _request(arm, 'GET', '/metadata/endpoints?api-version=2019-05-01')
+
+    assert status == 200
+    assert body['authentication']['audiences'] == [arm.url + '/']
+    assert body['galleryEndpoint'] == arm.url + '/'
+
+
+def test_subscription(arm):
+    status, headers, body = _request(arm, 'GET', SUBSCRIPTION)
+
+    assert status == 200
+    assert body['subscriptionId'] == SUBSCRIPTION.split('/')[-1]
+    assert int(headers['x-ms-ratelimit-remaining-subscription-reads']) > 0
+
+
+def test_resource_group_lifecycle(arm):
+    status, headers, body = _request(arm, 'GET', GROUP)
+    assert status == 200
+    assert body['name'] == 'emulated'
+    assert body['location'] == 'eastus'
+    assert headers['etag'] == body['etag']
+
+    status, _, _ = _request(arm, 'GET', GROUP, headers={'If-None-Match': body['etag']})
+    assert status == 304
+
+    status, _, updated = _request(arm, 'PUT', GROUP, {'location': 'eastus', 'tags': {'env': 'test'}})
+    assert status == 200
+    assert updated['tags'] == {'env': 'test'}
+    assert updated['etag'] != body['etag']
+
+    status, _, groups = _request(arm, 'GET', SUBSCRIPTION + '/resourcegroups')
+    assert [group['name'] for group in groups['value']] == ['emulated']
+
+    status, _, _ = _request(arm, 'DELETE', GROUP)
+    assert status == 200
+    status, _, body = _request(arm, 'GET', GROUP)
+    assert status == 404
+    assert body['error']['code'] == 'ResourceNotFound'
+
+
+def test_missing_resource_group(arm):
+    status, _, body = _request(arm, 'GET', SUBSCRIPTION + '/resourceGroups/missing/providers/'
+                                          'Microsoft.Network/publicIPAddresses/pip')
+
+    assert status == 404
+    assert body['error']['code'] == 'ResourceGroupNotFound'
+
+
+def test_write_is_a_long_running_operation(arm):
+    pip = NETWORK + '/publicIPAddresses/pip'
+    status, headers, body = _request(arm, 'PUT', pip, {'location': 'eastus', 'properties': {}})
+    assert status == 201
+    assert body['properties']['provisioningState'] == 'Succeeded'
+    assert body['properties']['ipAddress']
+
+    statuses = [_request(arm, 'GET', headers['azure-asyncoperation'])[2]['status'] for _ in range(3)]
+    assert statuses == ['InProgress', 'InProgress', 'Succeeded']
+
+    status, headers, _ = _request(arm, 'DELETE', pip)
+    assert status == 202
+    assert _request(arm, 'GET', headers['location'])[0] == 202
+    assert _request(arm, 'GET', headers['location'])[0] == 202
+    assert _request(arm, 'GET', headers['location'])[0] == 200
+    assert _request(arm, 'GET', pip)[0] == 404
+
+
+def test_embedded_children(arm):
+    vnet = NETWORK + '/virtualNetworks/vnet'
+    _request(arm, 'PUT', vnet, {
+        'location': 'eastus',
+        'properties': {
+            'addressSpace': {'addressPrefixes': ['10.0.0.0/16']},
+            'subnets': [{'name': 'default', 'properties': {'addressPrefix': '10.0.0.0/24'}}],
+        },
+    })
+
+    status, _, subnet = _request(arm, 'GET', vnet + '/subnets/default')
+    assert status == 200
+    assert subnet['properties']['addressPrefix'] == '10.0.0.0/24'
+
+    _, _, body = _request(arm, 'GET', vnet)
+    assert [item['name'] for item in body['properties']['subnets']] == ['default']
+
+    status, _, body = _request(arm, 'PUT', NETWORK + '/virtualNetworks/missing/subnets/default', {'properties': {}})
+    assert status == 404
+    assert body['error']['code'] == 'ParentResourceNotFound'
+
+
+def test_list_pages(arm):
+    names = ['pip{0}'.format(num) for num in range(5)]
+    for name in reversed(names):
+        _request(arm, 'PUT', NETWORK + '/publicIPAddresses/' + name, {'location': 'eastus'})
+
+    listed = []
+    pages = 0
+    url = NETWORK + '/publicIPAddresses?api-version=2020-04-01'
+    while url:
+        status, _, body = _request(arm, 'GET', url)
+        assert status == 200
+        assert len(body['value']) <= 2
+        listed.extend(item['name'] for item in body['value'])
+        pages += 1
+        url = body.get('nextLink')
+
+    assert listed == names
+    assert pages == 3
+
+
+def test_throttling():
+    with ArmEmulator(throttle_rate=1.0, retry_after=7) as emulator:
+        status, headers, body = _request(emulator, 'GET', SUBSCRIPTION)
+        assert status == 429
+        assert headers['retry-after'] == '7'
+        assert body['error']['code'] == 'TooManyRequests'
+        assert emulator.stats['throttled'] == 1
+
+        # Only ARM paths are throttled
+        assert _request(emulator, 'GET', '/emulator/stats')[0] == 200
+
+
+def test_rate_limit_budgets(arm):
+    reads = [
+        int(_request(arm, 'GET', GROUP)[1]['x-ms-ratelimit-remaining-subscription-reads']) for _ in range(2)
+    ]
+    writes = int(_request(arm, 'PUT', GROUP, {'location': 'eastus'})[1][
+        'x-ms-ratelimit-remaining-subscription-writes'
+    ])
+
+    assert reads[1] == reads[0] - 1
+    assert writes < reads[1]
+
+
+def test_batch(arm):
+    _request(arm, 'PUT', NETWORK + '/publicIPAddresses/pip', {'location': 'eastus'})
+
+    status, _, body = _request(arm, 'POST', '/batch?api-version=2020-06-01', {'requests': [
+        {'name': 'found', 'httpMethod': 'GET', 'url': arm.url + NETWORK + '/publicIPAddresses/pip'},
+        {'name': 'missing', 'httpMethod': 'GET', 'url': NETWORK + '/publicIPAddresses/missing'},
+    ]})
+
+    assert status == 200
+    responses = dict((response['name'], response) for response in body['responses'])
+    assert responses['found']['httpStatusCode'] == 200
+    assert responses['found']['content']['name'] == 'pip'
+    assert responses['missing']['httpStatusCode'] == 404
+    assert arm.stats['batched'] == 2
+
+
+def test_stats(arm):
+    status, _, body = _request(arm, 'GET', '/emulator/stats')
+
+    assert status == 200
+    # The resource group PUT and the stats request itself
+    assert body['requests'] == arm.stats['requests'] == 2
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+'''
+Tests for skipping the full read and diff of present states whose arguments and resource are unchanged
+'''
+# Import python libs
+import asyncio
+
+# Import third party libs
+import pytest
+
+
+@pytest.fixture
+def hub_options(tmp_path):
+    '''
+    Enable fast present
+    '''
+    return {'azurerm_cache_dir': str(tmp_path), 'azurerm_fast_present': True}
+
+
+@pytest.fixture
+def states(hub):
+    '''
+    The azurerm states, loaded onto the hub
+    '''
+    hub.pop.sub.add(dyne_name='states')
+    hub.pop.sub.load_subdirs(hub.states, recurse=True)
+
+    return hub.states.azurerm
+
+
+def test_unchanged_present_is_skipped(hub, states, emulator, connection_auth):
+    ctx = {'test': False}
+
+    async def _present(**kwargs):
+        requests = emulator.stats['requests']
+        ret = await states.network.public_ip_address.present(
+            ctx, 'pip', 'fingerprinted', connection_auth=connection_auth, **kwargs
+        )
+        return ret, emulator.stats['requests'] - requests
+
+    async def _run():
+        await states.resource.group.present(ctx, 'fingerprinted', 'eastus', connection_auth=connection_auth)
+        return [
+            await _present(idle_timeout_in_minutes=4),
+            await _present(idle_timeout_in_minutes=4),
+            await _present(idle_timeout_in_minutes=10),
+            await _present(idle_timeout_in_minutes=10, tags={'env': 'test'}),
+        ]
+
+    created, unchanged, updated, tagged = asyncio.run(_run())
+
+    assert created[0]['result'] is True
+    assert created[0]['changes']
+    # The second run only checks the ETag of the public IP address
+    assert unchanged[0] == {
+        'name': 'pip', 'result': True, 'comment': 'Public IP address pip is already present.', 'changes': {}
+    }
+    assert unchanged[1] == 1
+    # Any change to the arguments is a full run
+    assert updated[0]['result'] is True
+    assert updated[0]['changes']
+    assert tagged[0]['result'] is True
+    assert tagged[0]['changes']
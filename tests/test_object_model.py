@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+'''
+Tests for building SDK models from parameters with create_object_model and its cached build plans
+'''
+# Import python libs
+import asyncio
+import time
+
+# Import third party libs
+from azure.mgmt.network import models
+
+NETWORK_INTERFACE = {
+    'location': 'eastus',
+    'tags': {'env': 'test'},
+    'enable_accelerated_networking': True,
+    'dns_settings': {'dns_servers': ['10.0.0.4', '10.0.0.5']},
+    'ip_configurations': [
+        {
+            'name': 'ipconfig{0}'.format(num),
+            'private_ip_allocation_method': 'Dynamic',
+            'subnet': {'id': '/subscriptions/sub/resourceGroups/rg/providers/Microsoft.Network/'
+                             'virtualNetworks/vnet/subnets/default'},
+        }
+        for num in range(3)
+    ],
+    'network_security_group': '/not/a/dictionary',
+    'unknown_parameter': 'ignored',
+}
+
+
+def _build(hub, object_name='NetworkInterface', **params):
+    return asyncio.run(hub.exec.utils.azurerm.create_object_model('network', object_name, **params))
+
+
+def test_builds_nested_models(hub):
+    nic = _build(hub, **NETWORK_INTERFACE)
+
+    assert isinstance(nic, models.NetworkInterface)
+    assert nic.location == 'eastus'
+    assert nic.tags == {'env': 'test'}
+    assert nic.enable_accelerated_networking is True
+    assert isinstance(nic.dns_settings, models.NetworkInterfaceDnsSettings)
+    assert nic.dns_settings.dns_servers == ['10.0.0.4', '10.0.0.5']
+    assert [config.name for config in nic.ip_configurations] == ['ipconfig0', 'ipconfig1', 'ipconfig2']
+    assert all(isinstance(config, models.NetworkInterfaceIPConfiguration) for config in nic.ip_configurations)
+    assert all(isinstance(config.subnet, models.Subnet) for config in nic.ip_configurations)
+    assert nic.ip_configurations[0].subnet.id.endswith('/subnets/default')
+    # A parameter of the wrong type is passed through untouched, as it always was
+    assert nic.network_security_group == '/not/a/dictionary'
+
+
+def test_falsy_parameters_are_dropped(hub):
+    nic = _build(hub, location='eastus', tags={}, enable_ip_forwarding=False, ip_configurations=[])
+
+    assert nic.location == 'eastus'
+    assert nic.tags is None
+    assert nic.enable_ip_forwarding is None
+    assert nic.ip_configurations is None
+
+
+def test_plans_are_cached(hub):
+    plans = hub.exec.utils.azurerm.MODEL_PLANS
+
+    first = _build(hub, **NETWORK_INTERFACE)
+    plan = plans[('network', 'NetworkInterface')]
+    # Nested plans are compiled as they are used, not for every model the parent refers to
+    assert ('network', 'NetworkInterfaceIPConfiguration') in plans
+    assert ('network', 'Subnet') in plans
+    assert ('network', 'NetworkInterfaceTapConfiguration') not in plans
+
+    second = _build(hub, **NETWORK_INTERFACE)
+    assert plans[('network', 'NetworkInterface')] is plan
+    assert second.as_dict() == first.as_dict()
+
+
+def test_cached_builds_are_faster(hub):
+    async def _timed(clear):
+        best = None
+        for _ in range(3):
+            start = time.perf_counter()
+            for _ in range(50):
+                if clear:
+                    hub.exec.utils.azurerm.MODEL_PLANS.clear()
+                await hub.exec.utils.azurerm.create_object_model('network', 'NetworkInterface', **NETWORK_INTERFACE)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best
+
+    async def _compare():
+        return await _timed(clear=False), await _timed(clear=True)
+
+    cached, uncached = asyncio.run(_compare())
+
+    assert cached < uncached
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+'''
+Tests for reading paged list responses, replayed by the emulator from a recording of a public IP address listing
+'''
+# Import python libs
+import asyncio
+import json
+import os
+import time
+
+# Import third party libs
+import pytest
+
+# Import local libs
+from tools.emulator import SUBSCRIPTION_ID
+
+RECORDING = os.path.join(os.path.dirname(__file__), 'files', 'public_ip_addresses_list.json')
+RECORDED_PATH = '/subscriptions/{0}/resourceGroups/recorded/providers/Microsoft.Network/publicIPAddresses'.format(
+    SUBSCRIPTION_ID
+)
+
+
+@pytest.fixture
+def recorded(emulator):
+    '''
+    Replay the recorded pages for the recorded resource group, returning them
+    '''
+    with open(RECORDING) as recording:
+        pages = json.load(recording)
+    emulator.replay(RECORDED_PATH, pages)
+
+    return pages
+
+
+def _names(pages):
+    return [item['name'] for page in pages for item in page['value']]
+
+
+async def _iter_names(hub, connection_auth, limit=None, prefetch=0):
+    netconn = await hub.exec.utils.azurerm.get_client('network', **connection_auth)
+    paged = netconn.public_ip_addresses.list(resource_group_name='recorded')
+
+    return [
+        item['name'] async for item in hub.exec.utils.azurerm.paged_object_to_iter(
+            paged, limit=limit, prefetch=prefetch
+        )
+    ]
+
+
+async def _list_names(hub, connection_auth, prefetch=0):
+    netconn = await hub.exec.utils.azurerm.get_client('network', **connection_auth)
+    paged = netconn.public_ip_addresses.list(resource_group_name='recorded')
+
+    return [item['name'] for item in await hub.exec.utils.azurerm.paged_object_to_list(paged, prefetch=prefetch)]
+
+
+@pytest.mark.parametrize('prefetch', [0, 1, 3])
+def test_iter_yields_pages_in_order(hub, emulator, connection_auth, recorded, prefetch):
+    assert asyncio.run(_iter_names(hub, connection_auth, prefetch=prefetch)) == _names(recorded)
+    assert emulator.stats['replayed'] == len(recorded)
+
+
+@pytest.mark.parametrize('prefetch', [0, 2])
+def test_list_yields_pages_in_order(hub, emulator, connection_auth, recorded, prefetch):
+    assert asyncio.run(_list_names(hub, connection_auth, prefetch=prefetch)) == _names(recorded)
+    assert emulator.stats['replayed'] == len(recorded)
+
+
+@pytest.mark.parametrize('prefetch', [0, 1, 2])
+def test_iter_limit_stops_paging(hub, emulator, connection_auth, recorded, prefetch):
+    limit = len(recorded[0]['value']) + 1
+    assert asyncio.run(_iter_names(hub, connection_auth, limit=limit, prefetch=prefetch)) == \
+        _names(recorded)[:limit]
+
+    # A prefetched page already being fetched when the limit is reached may still arrive, but nothing follows it
+    time.sleep(0.5)
+    fetched = emulator.stats['replayed']
+    if prefetch:
+        assert 2 <= fetched <= 2 + prefetch + 1 < len(recorded)
+    else:
+        assert fetched == 2
+    time.sleep(0.5)
+    assert emulator.stats['replayed'] == fetched
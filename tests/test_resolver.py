@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+'''
+Tests for resolving network resource names to IDs as resources are created and deleted during a run
+'''
+# Import python libs
+import asyncio
+import json
+import urllib.request
+
+# Import local libs
+from tools.emulator import SUBSCRIPTION_ID
+
+GROUP = '/subscriptions/{0}/resourceGroups/resolved'.format(SUBSCRIPTION_ID)
+
+PUBLIC_IPS = GROUP + '/providers/Microsoft.Network/publicIPAddresses/'
+
+
+def _put(emulator, path, body):
+    request = urllib.request.Request(
+        emulator.url + path + '?api-version=2020-04-01', data=json.dumps(body).encode('utf-8'), method='PUT',
+        headers={'Content-Type': 'application/json'}
+    )
+    with urllib.request.urlopen(request, timeout=10) as resp:
+        return resp.status
+
+
+def test_missing_names_are_not_remembered(hub, emulator, connection_auth):
+    _put(emulator, GROUP, {'location': 'eastus'})
+
+    async def _resolve():
+        missing = await hub.exec.azurerm.network.resolver.resolve(
+            'public_ip_addresses', 'external', 'resolved', **connection_auth
+        )
+        # Created outside of the exec modules, so only found by loading the public IP addresses again
+        _put(emulator, PUBLIC_IPS + 'external', {'location': 'eastus'})
+        found = await hub.exec.azurerm.network.resolver.resolve(
+            'public_ip_addresses', 'external', 'resolved', **connection_auth
+        )
+        return missing, found
+
+    missing, found = asyncio.run(_resolve())
+
+    assert missing is None
+    assert found.lower() == (PUBLIC_IPS + 'external').lower()
+
+
+def test_created_and_deleted_resources_are_resolved(hub, emulator, connection_auth):
+    _put(emulator, GROUP, {'location': 'eastus'})
+    _put(emulator, PUBLIC_IPS + 'existing', {'location': 'eastus'})
+
+    async def _resolve(name):
+        return await hub.exec.azurerm.network.resolver.resolve(
+            'public_ip_addresses', name, 'resolved', **connection_auth
+        )
+
+    async def _lifecycle():
+        public_ips = hub.exec.azurerm.network.public_ip_address
+        resolved = [await _resolve('existing')]
+        await public_ips.create_or_update('created', 'resolved', location='eastus', **connection_auth)
+        resolved.append(await _resolve('created'))
+        await public_ips.delete('created', 'resolved', **connection_auth)
+        resolved.append(await _resolve('created'))
+        return resolved
+
+    existing, created, deleted = asyncio.run(_lifecycle())
+
+    assert existing.lower() == (PUBLIC_IPS + 'existing').lower()
+    assert created.lower() == (PUBLIC_IPS + 'created').lower()
+    assert deleted is None
@@ -0,0 +1,451 @@
+# -*- coding: utf-8 -*-
+'''
+Azure Resource Manager (ARM) State Benchmarks
+
+.. versionadded:: 1.0.0
+
+Drive the ``azurerm`` present and absent states against the local ARM emulator for synthetic estates of a given
+number of resources: virtual networks with subnets, network security groups with hundreds of rules, DNS zones with
+thousands of record sets, and virtual machines. Each estate is created, applied again with nothing to change, and
+removed. Each phase reports its wall time, the number of ARM requests made, the time the event loop spent blocked
+and the peak RSS of the process. The emulator runs in a process of its own, so its work is not measured.
+
+Wall time and memory depend on the machine, so there is no shared baseline. Results can be saved as a baseline on
+the machine running them and later runs compared against it, so that performance regressions in
+``exec.utils.azurerm`` or the state modules show up as a failing exit status. Run from the root of the repository:
+
+.. code-block:: bash
+
+    python -m tools.benchmark --sizes 100 1000 --save-baseline benchmark_baseline.json
+    python -m tools.benchmark --sizes 100 1000 --baseline benchmark_baseline.json --tolerance 0.2
+
+'''
+
+# Python libs
+from __future__ import absolute_import
+import argparse
+import asyncio
+import json
+import logging
+import os
+import resource
+import subprocess
+import sys
+import time
+from urllib.request import urlopen
+
+# Import pop libs
+import pop.hub
+
+# Import local libs
+from idem_provider_azurerm.conf import CONFIG
+from tools import emulator as arm_emulator
+from tools.emulator import SUBSCRIPTION_ID
+
+log = logging.getLogger(__name__)
+
+LOCATION = 'eastus'
+
+SUBNETS_PER_VNET = 4
+
+# The share of the estate given to each kind of resource
+ESTATE_SHARES = {'network': 25, 'security': 25, 'dns': 35, 'compute': 15}
+
+# Measurements compared against the baseline
+COMPARED = ('wall_time', 'api_calls', 'loop_blocked', 'peak_rss_mb')
+
+# The hourly ARM request budgets given to each subscription by the emulator. They are high enough that the
+# proactive throttling in exec.utils.azurerm never engages, so the measurements reflect the provider rather than
+# the ARM quota.
+BUDGET = 1000000
+
+
+def build_estate(size):
+    '''
+    Build the states for a synthetic estate of roughly size resources. Returns the phases of states to apply in
+    order to create the estate and the phases to apply in order to remove it. Each phase is a list of state
+    references relative to ``states.azurerm`` along with their arguments.
+    '''
+    network = size * ESTATE_SHARES['network'] // 100
+    security = size * ESTATE_SHARES['security'] // 100
+    dns = size * ESTATE_SHARES['dns'] // 100
+    compute = max(size * ESTATE_SHARES['compute'] // 100, 1)
+
+    vnet_count = max(network // (SUBNETS_PER_VNET + 1), 1)
+    nsg_count = max(size // 1000, 1)
+    rules_per_nsg = min(max(security // nsg_count - 1, 1), 1000)
+    zone_count = max(size // 5000, 1)
+    records_per_zone = max(dns // zone_count - 1, 1)
+
+    groups = [
+        ('resource.group', {'name': 'bench-{0}'.format(kind), 'location': LOCATION})
+        for kind in ('network', 'security', 'dns', 'compute')
+    ]
+    vnets = [
+        ('network.virtual_network', {
+            'name': 'vnet{0}'.format(idx),
+            'resource_group': 'bench-network',
+            'address_prefixes': ['10.{0}.0.0/16'.format(idx % 256)],
+        })
+        for idx in range(vnet_count)
+    ]
+    subnets = [
+        ('network.virtual_network.subnet', {
+            'name': 'subnet{0}'.format(sub),
+            'virtual_network': 'vnet{0}'.format(idx),
+            'resource_group': 'bench-network',
+            'address_prefix': '10.{0}.{1}.0/24'.format(idx % 256, sub),
+        })
+        for idx in range(vnet_count) for sub in range(SUBNETS_PER_VNET)
+    ]
+    nsgs = [
+        ('network.network_security_group', {'name': 'nsg{0}'.format(idx), 'resource_group': 'bench-security'})
+        for idx in range(nsg_count)
+    ]
+    rules = [
+        ('network.network_security_group.security_rule', {
+            'name': 'rule{0}'.format(rule),
+            'security_group': 'nsg{0}'.format(idx),
+            'resource_group': 'bench-security',
+            'access': 'Allow',
+            'direction': 'Inbound',
+            'priority': 100 + rule,
+            'protocol': 'Tcp',
+            'source_address_prefix': '*',
+            'source_port_range': '*',
+            'destination_address_prefix': '*',
+            'destination_port_range': str(1024 + rule),
+        })
+        for idx in range(nsg_count) for rule in range(rules_per_nsg)
+    ]
+    zones = [
+        ('dns.zone', {'name': 'zone{0}.bench.example'.format(idx), 'resource_group': 'bench-dns'})
+        for idx in range(zone_count)
+    ]
+    records = [
+        ('dns.record_set', {
+            'name': 'host{0}'.format(record),
+            'zone_name': 'zone{0}.bench.example'.format(idx),
+            'resource_group': 'bench-dns',
+            'record_type': 'A',
+            'ttl': 300,
+            'arecords': [{'ipv4_address': '192.0.2.{0}'.format(record % 254 + 1)}],
+        })
+        for idx in range(zone_count) for record in range(records_per_zone)
+    ]
+    vms = [
+        ('compute.virtual_machine', {
+            'name': 'vm{0}'.format(idx),
+            'resource_group': 'bench-compute',
+            'vm_size': 'Standard_B1s',
+            'network_resource_group': 'bench-network',
+            'virtual_network': 'vnet{0}'.format(idx % vnet_count),
+            'subnet': 'subnet{0}'.format(idx % SUBNETS_PER_VNET),
+            'admin_password': 'Benchmark-Passw0rd',
+        })
+        for idx in range(compute)
+    ]
+
+    create = [groups, vnets + nsgs + zones, subnets + rules + records, vms]
+    remove = [vms, records + rules + subnets, zones + nsgs + vnets, groups]
+
+    return create, remove
+
+
+def _state_function(hub, ref, action):
+    '''
+    Return the present or absent state function for a state reference such as ``network.virtual_network.subnet``,
+    where the last part names a sub-resource state within the module
+    '''
+    parts = ref.split('.')
+    module = hub.states.azurerm
+    for part in parts[:2]:
+        module = getattr(module, part)
+
+    if len(parts) > 2:
+        return getattr(module, '{0}_{1}'.format(parts[2], action))
+    return getattr(module, action)
+
+
+def _absent_kwargs(kwargs):
+    '''
+    Keep only the arguments the absent states accept
+    '''
+    keep = ('name', 'resource_group', 'virtual_network', 'security_group', 'zone_name', 'record_type')
+
+    return dict((key, value) for key, value in kwargs.items() if key in keep)
+
+
+class _LoopMonitor(object):
+    '''
+    Measure how long the event loop is blocked by sleeping for a short interval and recording any lateness
+    '''
+    def __init__(self, interval=0.01, threshold=0.005):
+        self.interval = interval
+        self.threshold = threshold
+        self.blocked = 0.0
+        self.max_block = 0.0
+        self.task = None
+
+    async def _watch(self):
+        loop = asyncio.get_event_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            lag = loop.time() - start - self.interval
+            if lag > self.threshold:
+                self.blocked += lag
+                self.max_block = max(self.max_block, lag)
+
+    def start(self):
+        self.task = asyncio.ensure_future(self._watch())
+
+    async def stop(self):
+        self.task.cancel()
+        try:
+            await self.task
+        except asyncio.CancelledError:
+            pass
+
+
+class _EmulatorProcess(object):
+    '''
+    Run the ARM emulator in a child process, so the time it spends answering requests does not hold the GIL of the
+    process being measured
+    '''
+    def __init__(self, latency=0.0, throttle_rate=0.0, budget=BUDGET):
+        self.args = [
+            sys.executable, os.path.abspath(arm_emulator.__file__), '--port', '0',
+            '--latency', str(latency), '--throttle-rate', str(throttle_rate),
+            '--read-budget', str(budget), '--write-budget', str(budget),
+        ]
+        self.process = None
+        self.url = None
+
+    def __enter__(self):
+        self.process = subprocess.Popen(self.args, stdout=subprocess.PIPE, universal_newlines=True)
+        self.url = self.process.stdout.readline().strip()
+        if not self.url:
+            self.process.wait()
+            raise RuntimeError('The ARM emulator exited with status {0}'.format(self.process.returncode))
+
+        return self
+
+    def __exit__(self, *args):
+        self.process.terminate()
+        self.process.wait()
+        self.process.stdout.close()
+
+    def requests(self):
+        '''
+        Return the number of requests the emulator has answered, not counting this one
+        '''
+        with urlopen(self.url + '/emulator/stats', timeout=30) as resp:
+            return json.loads(resp.read().decode('utf-8'))['requests'] - 1
+
+
+def _peak_rss_mb():
+    '''
+    Return the peak resident set size of the process in megabytes
+    '''
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes and macOS reports bytes
+    if sys.platform == 'darwin':
+        peak /= 1024.0
+
+    return round(peak / 1024.0, 1)
+
+
+async def _run_phases(hub, emulator, phases, action, connection_auth, concurrency):
+    '''
+    Apply each phase of states concurrently, waiting for a phase to finish before starting the next, and return
+    the measurements for the whole run
+    '''
+    semaphore = asyncio.Semaphore(concurrency)
+    ctx = {'test': False}
+    failures = []
+
+    async def _apply(ref, kwargs):
+        if action == 'absent':
+            kwargs = _absent_kwargs(kwargs)
+        async with semaphore:
+            try:
+                ret = await _state_function(hub, ref, action)(ctx, connection_auth=connection_auth, **kwargs)
+            except Exception as exc:  # pylint: disable=broad-except
+                # A state which raises is a failure like any other, rather than the end of the run
+                ret = {'result': False, 'changes': {}, 'comment': '{0}: {1}'.format(type(exc).__name__, exc)}
+        if not ret.get('result'):
+            failures.append('{0}.{1} {2}: {3}'.format(ref, action, kwargs['name'], ret.get('comment')))
+        return ret
+
+    monitor = _LoopMonitor()
+    requests_before = emulator.requests()
+    start = time.monotonic()
+    monitor.start()
+    try:
+        changed = 0
+        for phase in phases:
+            for ret in await asyncio.gather(*[_apply(ref, kwargs) for ref, kwargs in phase]):
+                if ret.get('changes'):
+                    changed += 1
+    finally:
+        await monitor.stop()
+
+    for failure in failures[:10]:
+        log.warning('State failed: %s', failure)
+
+    return {
+        'states': sum(len(phase) for phase in phases),
+        'changed': changed,
+        'failed': len(failures),
+        'wall_time': round(time.monotonic() - start, 3),
+        # Less the request made for the count before the run
+        'api_calls': emulator.requests() - requests_before - 1,
+        'loop_blocked': round(monitor.blocked, 3),
+        'loop_max_block': round(monitor.max_block, 3),
+        'peak_rss_mb': _peak_rss_mb(),
+    }
+
+
+def make_hub(options=None):
+    '''
+    Build a hub with the exec and state modules of every installed idem provider. The idem options are set to the
+    defaults of the Azure provider configuration, updated with any options given.
+    '''
+    hub = pop.hub.Hub()
+    hub.OPT = {'idem': dict(
+        (name, opt['default']) for name, opt in CONFIG.items() if opt.get('dyne') == 'idem'
+    )}
+    hub.OPT['idem'].update(options or {})
+    hub.pop.sub.add(dyne_name='exec')
+    hub.pop.sub.load_subdirs(hub.exec, recurse=True)
+    hub.pop.sub.add(dyne_name='states')
+    hub.pop.sub.load_subdirs(hub.states, recurse=True)
+
+    return hub
+
+
+async def benchmark(size, latency=0.0, throttle_rate=0.0, concurrency=50, options=None, budget=BUDGET):
+    '''
+    Create, reapply and remove a synthetic estate of the given size against a fresh emulator, returning the
+    measurements of each phase. options are idem options such as ``azurerm_subscription_concurrency`` to run with.
+    '''
+    hub = make_hub(options)
+    create, remove = build_estate(size)
+    results = {}
+
+    with _EmulatorProcess(latency=latency, throttle_rate=throttle_rate, budget=budget) as emulator:
+        connection_auth = {
+            'subscription_id': SUBSCRIPTION_ID,
+            'access_token': 'benchmark',
+            'cloud_environment': emulator.url,
+        }
+        for phase, phases, action in (('create', create, 'present'),
+                                      ('noop', create, 'present'),
+                                      ('remove', remove, 'absent')):
+            log.info('Running the %s phase for %s resources', phase, size)
+            results[phase] = await _run_phases(hub, emulator, phases, action, connection_auth, concurrency)
+
+    return results
+
+
+def compare(results, baseline, tolerance):
+    '''
+    Return a description of every measurement which is worse than its baseline by more than the tolerance
+    '''
+    regressions = []
+    for size, phases in results.items():
+        for phase, measured in phases.items():
+            expected = baseline.get(size, {}).get(phase, {})
+            for key in COMPARED:
+                if not expected.get(key):
+                    continue
+                if measured[key] > expected[key] * (1 + tolerance):
+                    regressions.append('{0} resources, {1} phase: {2} {3} exceeds the baseline of {4}'.format(
+                        size, phase, key, measured[key], expected[key]
+                    ))
+
+    return regressions
+
+
+def _parse_options(pairs):
+    '''
+    Turn NAME=VALUE pairs from the command line into idem options, reading each value as JSON where it is valid JSON
+    '''
+    options = {}
+    for pair in pairs:
+        name, _, value = pair.partition('=')
+        try:
+            options[name] = json.loads(value)
+        except ValueError:
+            options[name] = value
+
+    return options
+
+
+def parse():
+    '''
+    Parse the cli args
+    '''
+    parser = argparse.ArgumentParser(description='Benchmark the azurerm states against the local ARM emulator.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000],
+                        help='The number of resources in each estate to benchmark')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds the emulator waits on each request')
+    parser.add_argument('--throttle-rate', type=float, default=0.0,
+                        help='The fraction of requests the emulator answers with a 429')
+    parser.add_argument('--concurrency', type=int, default=50, help='The number of states applied at once')
+    parser.add_argument('--budget', type=int, default=BUDGET,
+                        help='The hourly ARM read and write budget of the emulated subscription')
+    parser.add_argument('--option', action='append', default=[], metavar='NAME=VALUE',
+                        help='An idem option to run with, such as azurerm_batch_gets=true. May be repeated.')
+    parser.add_argument('--baseline', default=None,
+                        help='A baseline saved on this machine to compare the results against. Nothing is '
+                             'compared unless one is given.')
+    parser.add_argument('--save-baseline', default=None, metavar='FILE',
+                        help='Save the results as a baseline for this machine')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='The fraction a measurement may exceed its baseline by before it is a regression')
+    return parser.parse_args().__dict__
+
+
+def start():
+    '''
+    Run the benchmarks, print the results and compare them against a baseline if one is given
+    '''
+    logging.basicConfig(level=logging.INFO)
+    opts = parse()
+
+    results = {}
+    loop = asyncio.get_event_loop()
+    for size in opts['sizes']:
+        results[str(size)] = loop.run_until_complete(benchmark(
+            size,
+            latency=opts['latency'],
+            throttle_rate=opts['throttle_rate'],
+            concurrency=opts['concurrency'],
+            options=_parse_options(opts['option']),
+            budget=opts['budget'],
+        ))
+
+    print(json.dumps(results, indent=2, sort_keys=True))
+
+    if opts['save_baseline']:
+        with open(opts['save_baseline'], 'w') as baseline_file:
+            json.dump(results, baseline_file, indent=2, sort_keys=True)
+        log.info('Saved the baseline to %s', opts['save_baseline'])
+
+    if not opts['baseline']:
+        return
+
+    with open(opts['baseline']) as baseline_file:
+        baseline = json.load(baseline_file)
+
+    regressions = compare(results, baseline, opts['tolerance'])
+    for regression in regressions:
+        log.error('Regression: %s', regression)
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    start()
@@ -0,0 +1,700 @@
+# -*- coding: utf-8 -*-
+'''
+Local Azure Resource Manager (ARM) Emulator
+
+.. versionadded:: 1.0.0
+
+A lightweight, in-memory stand-in for the ARM endpoints used by the exec and state modules, so they can be run and
+benchmarked without a live Azure subscription. It serves resource groups, virtual networks and subnets, network
+security groups and security rules, network interfaces, public IP addresses, load balancers, virtual machines,
+DNS zones and record sets, and template deployments, along with the ARM batch endpoint and the cloud metadata
+endpoint.
+
+Latency, throttling with 429 responses, the hourly read and write budgets reported in the
+``x-ms-ratelimit-remaining-subscription-*`` headers, the number of polls before a long-running operation completes,
+and the page size of list responses are configurable.
+
+Start the emulator from the command line, in the root of the repository:
+
+.. code-block:: bash
+
+    python -m tools.emulator --port 8080 --latency 0.05 --throttle-rate 0.01
+
+The URL of the running emulator is printed on the first line of standard output, which is useful with ``--port 0``.
+
+Or from Python:
+
+.. code-block:: python
+
+    with ArmEmulator(latency=0.05) as emulator:
+        ...
+
+Then point the provider at it with the emulator URL as the ``cloud_environment``. The emulator accepts any bearer
+token, so the ``access_token`` provider parameter can be used instead of AAD credentials:
+
+.. code-block:: yaml
+
+    cloud_environment: http://127.0.0.1:8080
+    subscription_id: 00000000-0000-0000-0000-000000000000
+    access_token: emulator
+
+List responses recorded from ARM can be served for a path with ``ArmEmulator.replay``, one recorded page per
+request, so paging can be exercised against real response bodies. Recorded Azure Resource Graph query responses are
+replayed the same way for the Resource Graph query path.
+Requests of a path can be answered with an error with ``ArmEmulator.fail``.
+
+Request counts are available from ``ArmEmulator.stats`` or by a GET of ``/emulator/stats``.
+
+'''
+
+# Python libs
+from __future__ import absolute_import
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlsplit
+import argparse
+import copy
+import json
+import logging
+import random
+import threading
+import time
+import uuid
+
+log = logging.getLogger(__name__)
+
+# Child resources which ARM also returns embedded in the properties of their parent, keyed by the lower case parent
+# type and then the lower case child type, with the name of the parent property
+EMBEDDED_CHILDREN = {
+    'virtualnetworks': {'subnets': 'subnets', 'virtualnetworkpeerings': 'virtualNetworkPeerings'},
+    'networksecuritygroups': {'securityrules': 'securityRules'},
+    'routetables': {'routes': 'routes'},
+}
+
+# Actions which complete synchronously instead of returning a long-running operation
+SYNC_ACTIONS = ('validate', 'exporttemplate', 'generalize', 'checkipaddressavailability')
+
+# DNS record set listings
+RECORD_SET_COLLECTIONS = ('recordsets', 'all')
+
+READ_BUDGET = 12000
+
+WRITE_BUDGET = 1200
+
+# The subscription used by the tests and benchmarks. Any subscription ID is served.
+SUBSCRIPTION_ID = '00000000-0000-0000-0000-000000000000'
+
+# The Azure Resource Graph query endpoint
+RESOURCE_GRAPH_PATH = '/providers/Microsoft.ResourceGraph/resources'
+
+
+def _error(status, code, message):
+    '''
+    Build an ARM error response
+    '''
+    return status, {}, {'error': {'code': code, 'message': message}}
+
+
+class ArmState(object):
+    '''
+    The in-memory resource store of the emulator. Resources are keyed by their lower case resource ID.
+    '''
+    def __init__(self, page_size=100, lro_polls=1, read_budget=READ_BUDGET, write_budget=WRITE_BUDGET):
+        self.lock = threading.RLock()
+        self.page_size = page_size
+        self.lro_polls = lro_polls
+        self.read_budget = read_budget
+        self.write_budget = write_budget
+        self.resources = {}
+        self.operations = {}
+        self.budgets = {}
+        self.recorded = {}
+        self.failures = {}
+
+    def remaining(self, subscription_id, kind):
+        '''
+        Spend one request of the subscription's hourly read or write budget and return what is left
+        '''
+        hour = int(time.time() // 3600)
+        budget = self.budgets.get(subscription_id.lower())
+        if budget is None or budget['hour'] != hour:
+            budget = {'hour': hour, 'reads': self.read_budget, 'writes': self.write_budget}
+            self.budgets[subscription_id.lower()] = budget
+        budget[kind] = max(budget[kind] - 1, 0)
+
+        return budget[kind]
+
+    def start_operation(self, result=None):
+        '''
+        Register a long-running operation which completes after the configured number of status polls
+        '''
+        operation_id = str(uuid.uuid4())
+        self.operations[operation_id] = {'polls': self.lro_polls, 'result': result}
+
+        return operation_id
+
+    def poll_operation(self, operation_id):
+        '''
+        Return the status of a long-running operation, counting the poll
+        '''
+        operation = self.operations.get(operation_id)
+        if operation is None:
+            return None, None
+        if operation['polls'] > 0:
+            operation['polls'] -= 1
+            return 'InProgress', None
+
+        return 'Succeeded', operation['result']
+
+    def children(self, parent_id, child_type=None):
+        '''
+        Return the direct children of a resource, optionally of a single type
+        '''
+        prefix = parent_id.lower() + '/'
+        depth = prefix.count('/') + 1
+        found = []
+        for key, resource in self.resources.items():
+            if not key.startswith(prefix) or key.count('/') != depth:
+                continue
+            if child_type is None or key.split('/')[-2] == child_type.lower():
+                found.append(resource)
+
+        return sorted(found, key=lambda res: res['id'].lower())
+
+    def render(self, resource):
+        '''
+        Return a copy of a stored resource with its embedded children filled in
+        '''
+        rendered = copy.deepcopy(resource)
+        parent_type = resource['type'].split('/')[-1].lower()
+        for child_type, prop in EMBEDDED_CHILDREN.get(parent_type, {}).items():
+            rendered.setdefault('properties', {})[prop] = [
+                self.render(child) for child in self.children(resource['id'], child_type)
+            ]
+
+        return rendered
+
+    def delete(self, resource_id):
+        '''
+        Remove a resource and everything beneath it
+        '''
+        key = resource_id.lower()
+        for stored in list(self.resources):
+            if stored == key or stored.startswith(key + '/'):
+                del self.resources[stored]
+
+
+class ArmEmulator(object):
+    '''
+    Run the emulator on a background thread. The URL of the running emulator is used as the ``cloud_environment``.
+    '''
+    def __init__(self, host='127.0.0.1', port=0, latency=0.0, throttle_rate=0.0, retry_after=0, page_size=100,
+                 lro_polls=1, read_budget=READ_BUDGET, write_budget=WRITE_BUDGET):
+        self.latency = latency
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.state = ArmState(page_size=page_size, lro_polls=lro_polls, read_budget=read_budget,
+                              write_budget=write_budget)
+        self.stats = {'requests': 0, 'throttled': 0, 'batched': 0, 'replayed': 0}
+        self.server = ThreadingHTTPServer((host, port), _Handler)
+        self.server.daemon_threads = True
+        self.server.emulator = self
+        self.thread = None
+
+    @property
+    def url(self):
+        '''
+        The base URL of the emulator
+        '''
+        host, port = self.server.server_address[:2]
+        return 'http://{0}:{1}'.format(host, port)
+
+    def start(self):
+        '''
+        Serve requests on a daemon thread
+        '''
+        self.thread = threading.Thread(target=self.server.serve_forever, name='arm-emulator', daemon=True)
+        self.thread.start()
+
+        return self
+
+    def stop(self):
+        '''
+        Stop serving requests
+        '''
+        self.server.shutdown()
+        self.server.server_close()
+        if self.thread:
+            self.thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def replay(self, path, pages):
+        '''
+        Serve recorded list response bodies for GET requests of a path, in order and one page per request. The
+        nextLink of each page is rewritten to request the following page from the emulator. Recorded responses for
+        RESOURCE_GRAPH_PATH answer POSTed queries instead, with the $skipToken of each page rewritten to match.
+        '''
+        with self.state.lock:
+            self.state.recorded[path.rstrip('/').lower()] = list(pages)
+
+    def fail(self, path, status=500, code='InternalServerError'):
+        '''
+        Answer every request of a path with an error, so failures can be exercised
+        '''
+        with self.state.lock:
+            self.state.failures[path.rstrip('/').lower()] = (status, code)
+
+    def handle(self, method, url, headers, body, base_url):
+        '''
+        Answer a single request, returning the status, headers and body of the response
+        '''
+        with self.state.lock:
+            self.stats['requests'] += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+        parts = urlsplit(url)
+        path = parts.path.rstrip('/')
+        query = dict((key, values[0]) for key, values in parse_qs(parts.query).items())
+
+        if self.throttle_rate and path.startswith('/subscriptions') and random.random() < self.throttle_rate:
+            with self.state.lock:
+                self.stats['throttled'] += 1
+            status, resp_headers, resp_body = _error(
+                429, 'TooManyRequests', 'The request was throttled by the ARM emulator.'
+            )
+            resp_headers['Retry-After'] = str(self.retry_after)
+            return status, resp_headers, resp_body
+
+        with self.state.lock:
+            status, resp_headers, resp_body = self.route(method, path, query, headers, body, base_url)
+
+        segments = path.strip('/').split('/')
+        if segments[0].lower() == 'subscriptions' and len(segments) > 1:
+            kind = 'reads' if method in ('GET', 'HEAD') else 'writes'
+            resp_headers['x-ms-ratelimit-remaining-subscription-{0}'.format(kind)] = str(
+                self.state.remaining(segments[1], kind)
+            )
+
+        return status, resp_headers, resp_body
+
+    def route(self, method, path, query, headers, body, base_url):
+        '''
+        Dispatch a request to the handler for its path
+        '''
+        segments = [segment for segment in path.split('/') if segment]
+        lowered = [segment.lower() for segment in segments]
+
+        if lowered == ['metadata', 'endpoints']:
+            return self.metadata(base_url)
+        if lowered == ['emulator', 'stats']:
+            return 200, {}, dict(self.stats)
+        if len(lowered) == 3 and lowered[:2] == ['emulator', 'operations']:
+            return self.operation(segments[2], query)
+        if lowered == ['batch'] and method == 'POST':
+            return self.batch(body, base_url)
+        if path.lower() in self.state.failures:
+            status, code = self.state.failures[path.lower()]
+            return _error(status, code, 'The ARM emulator was asked to fail requests of {0}.'.format(path))
+        if method == 'POST' and path.lower() == RESOURCE_GRAPH_PATH.lower() and path.lower() in self.state.recorded:
+            return self.recorded_query(self.state.recorded[path.lower()], body)
+        if method == 'GET' and path.lower() in self.state.recorded:
+            return self.recorded_page(self.state.recorded[path.lower()], path, query, base_url)
+        if not lowered or lowered[0] != 'subscriptions' or len(lowered) < 2:
+            return _error(404, 'NotFound', 'The path {0} is not served by the ARM emulator.'.format(path))
+
+        subscription = '/subscriptions/{0}'.format(segments[1])
+        if len(lowered) == 2:
+            return 200, {}, {
+                'id': subscription,
+                'subscriptionId': segments[1],
+                'displayName': 'ARM Emulator',
+                'state': 'Enabled',
+            }
+
+        if lowered[2] == 'providers' and len(lowered) == 5 and method == 'GET':
+            type_name = '{0}/{1}'.format(segments[3], segments[4]).lower()
+            found = [res for res in self.state.resources.values() if res['type'].lower() == type_name]
+            return self.page(sorted(found, key=lambda res: res['id'].lower()), path, query, base_url)
+
+        if lowered[2] != 'resourcegroups':
+            return _error(404, 'NotFound', 'The path {0} is not served by the ARM emulator.'.format(path))
+
+        if len(lowered) == 3 and method == 'GET':
+            groups = self.state.children(subscription, 'resourceGroups')
+            return self.page(groups, path, query, base_url)
+
+        group_id = '{0}/resourceGroups/{1}'.format(subscription, segments[3])
+        if len(lowered) == 4:
+            return self.resource(method, group_id, segments[3], 'Microsoft.Resources/resourceGroups', headers, body,
+                                 base_url, lro=False)
+
+        group = self.state.resources.get(group_id.lower())
+        if group is None:
+            return _error(404, 'ResourceGroupNotFound', 'Resource group {0} could not be found.'.format(segments[3]))
+
+        if lowered[4] != 'providers' or len(lowered) < 7:
+            return _error(404, 'NotFound', 'The path {0} is not served by the ARM emulator.'.format(path))
+
+        provider = segments[5:]
+        resource_id = '{0}/providers/{1}'.format(group['id'], '/'.join(provider))
+        type_name = '/'.join([provider[0]] + provider[1::2])
+
+        # namespace/type/name followed by any number of child type/name pairs
+        if len(provider) % 2 == 1:
+            if len(provider) > 3 and resource_id.rsplit('/', 2)[0].lower() not in self.state.resources:
+                return _error(404, 'ParentResourceNotFound', 'The parent resource {0} could not be found.'.format(
+                    resource_id.rsplit('/', 2)[0]
+                ))
+            # DNS zones and record sets are written synchronously
+            return self.resource(method, resource_id, provider[-1], type_name, headers, body, base_url,
+                                 lro=provider[1].lower() != 'dnszones')
+
+        if len(provider) == 2 and method == 'GET':
+            found = [
+                res for res in self.state.resources.values()
+                if res['type'].lower() == type_name.lower() and
+                res['id'].lower().startswith(group['id'].lower() + '/') and
+                res['id'].count('/') == resource_id.count('/') + 1
+            ]
+            return self.page(sorted(found, key=lambda res: res['id'].lower()), path, query, base_url)
+
+        parent_id = resource_id.rsplit('/', 1)[0]
+        parent = self.state.resources.get(parent_id.lower())
+        if parent is None:
+            return _error(404, 'ParentResourceNotFound', 'The parent resource {0} could not be found.'.format(
+                parent_id
+            ))
+
+        if method == 'GET':
+            if provider[-1].lower() in RECORD_SET_COLLECTIONS:
+                found = self.state.children(parent_id)
+            else:
+                found = self.state.children(parent_id, provider[-1])
+            return self.page([self.state.render(res) for res in found], path, query, base_url)
+
+        if method == 'POST':
+            return self.action(provider[-1], parent, base_url)
+
+        return _error(405, 'MethodNotAllowed', 'The method {0} is not allowed on {1}.'.format(method, path))
+
+    def metadata(self, base_url):
+        '''
+        Serve the cloud metadata endpoint used to build a cloud environment from the emulator URL
+        '''
+        return 200, {}, {
+            'galleryEndpoint': base_url + '/',
+            'graphEndpoint': base_url + '/',
+            'portalEndpoint': base_url + '/',
+            'authentication': {
+                'loginEndpoint': base_url + '/',
+                'audiences': [base_url + '/'],
+            },
+        }
+
+    def operation(self, operation_id, query):
+        '''
+        Serve the status of a long-running operation, as both its Azure-AsyncOperation and Location URLs
+        '''
+        status, result = self.state.poll_operation(operation_id)
+        if status is None:
+            return _error(404, 'NotFound', 'The operation {0} could not be found.'.format(operation_id))
+
+        if query.get('location'):
+            if status == 'InProgress':
+                return 202, {'Retry-After': '0'}, None
+            return 200, {}, result
+
+        return 200, {'Retry-After': '0'}, {'status': status}
+
+    def page(self, items, path, query, base_url):
+        '''
+        Return one page of a list response, with a nextLink while there are more
+        '''
+        try:
+            start = int(query.get('$skiptoken', 0))
+        except ValueError:
+            start = 0
+        end = start + self.state.page_size
+
+        ret = {'value': [self.state.render(item) for item in items[start:end]]}
+        if end < len(items):
+            next_query = dict(query, **{'$skiptoken': str(end)})
+            ret['nextLink'] = '{0}{1}?{2}'.format(base_url, path, urlencode(next_query))
+
+        return 200, {}, ret
+
+    def recorded_page(self, pages, path, query, base_url):
+        '''
+        Return one page of a recorded list response, with its nextLink pointing at the next recorded page
+        '''
+        try:
+            index = int(query.get('$skiptoken', 0))
+        except ValueError:
+            index = 0
+        if index >= len(pages):
+            return _error(404, 'NotFound', 'There is no recorded page {0} for {1}.'.format(index, path))
+        self.stats['replayed'] += 1
+
+        ret = copy.deepcopy(pages[index])
+        if ret.get('nextLink') and index + 1 < len(pages):
+            next_query = dict(query, **{'$skiptoken': str(index + 1)})
+            ret['nextLink'] = '{0}{1}?{2}'.format(base_url, path, urlencode(next_query))
+        else:
+            ret.pop('nextLink', None)
+
+        return 200, {}, ret
+
+    def recorded_query(self, pages, body):
+        '''
+        Return one page of a recorded Resource Graph query response, chosen by the skip token of the query
+        '''
+        try:
+            index = int(((body or {}).get('options') or {}).get('$skipToken') or 0)
+        except ValueError:
+            index = 0
+        if index >= len(pages):
+            return _error(400, 'BadRequest', 'There is no recorded page {0} for the query.'.format(index))
+        self.stats['replayed'] += 1
+
+        ret = copy.deepcopy(pages[index])
+        if ret.get('$skipToken') and index + 1 < len(pages):
+            ret['$skipToken'] = str(index + 1)
+        else:
+            ret.pop('$skipToken', None)
+
+        return 200, {}, ret
+
+    def accepted(self, base_url, status=202, body=None, result=None):
+        '''
+        Start a long-running operation and return the response announcing it
+        '''
+        operation_url = '{0}/emulator/operations/{1}'.format(base_url, self.state.start_operation(result))
+
+        return status, {
+            'Azure-AsyncOperation': operation_url,
+            'Location': operation_url + '?location=1',
+            'Retry-After': '0',
+        }, body
+
+    def resource(self, method, resource_id, name, type_name, headers, body, base_url, lro=True):
+        '''
+        Read, write or delete a single resource
+        '''
+        key = resource_id.lower()
+        existing = self.state.resources.get(key)
+
+        if method in ('GET', 'HEAD'):
+            if existing is None:
+                if method == 'HEAD':
+                    return 404, {}, None
+                return _error(404, 'ResourceNotFound', 'The resource {0} could not be found.'.format(resource_id))
+            if method == 'HEAD':
+                return 204, {}, None
+            rendered = self.state.render(existing)
+            if headers.get('If-None-Match') and headers['If-None-Match'] == existing.get('etag'):
+                return 304, {'ETag': existing['etag']}, None
+            return 200, {'ETag': existing.get('etag', '')}, rendered
+
+        if method == 'DELETE':
+            if existing is None:
+                return 204, {}, None
+            self.state.delete(resource_id)
+            if lro:
+                return self.accepted(base_url)
+            return 200, {}, None
+
+        if method == 'PATCH':
+            if existing is None:
+                return _error(404, 'ResourceNotFound', 'The resource {0} could not be found.'.format(resource_id))
+            if isinstance((body or {}).get('tags'), dict):
+                existing['tags'] = body['tags']
+            existing['etag'] = 'W/"{0}"'.format(uuid.uuid4())
+            return 200, {}, self.state.render(existing)
+
+        if method == 'PUT':
+            return self.put(resource_id, name, type_name, existing, body or {}, base_url, lro)
+
+        if method == 'POST':
+            return _error(404, 'NotFound', 'The action could not be found.')
+
+        return _error(405, 'MethodNotAllowed', 'The method {0} is not allowed.'.format(method))
+
+    def put(self, resource_id, name, type_name, existing, body, base_url, lro):
+        '''
+        Create or replace a resource from the body of a PUT request
+        '''
+        resource = {
+            'id': resource_id,
+            'name': name,
+            'type': type_name,
+            'etag': 'W/"{0}"'.format(uuid.uuid4()),
+        }
+        for field in ('location', 'tags', 'sku', 'kind', 'zones', 'identity', 'plan', 'managedBy'):
+            if field in body:
+                resource[field] = body[field]
+
+        properties = copy.deepcopy(body.get('properties') or {})
+        properties['provisioningState'] = 'Succeeded'
+
+        # Named sub-resources such as IP configurations are given IDs beneath the resource
+        for prop, value in properties.items():
+            if isinstance(value, list):
+                for item in value:
+                    if isinstance(item, dict) and item.get('name') and not item.get('id'):
+                        item['id'] = '{0}/{1}/{2}'.format(resource_id, prop, item['name'])
+
+        parent_type = type_name.split('/')[-1].lower()
+        for child_type, prop in EMBEDDED_CHILDREN.get(parent_type, {}).items():
+            children = properties.pop(prop, None)
+            if children is None:
+                continue
+            for stale in self.state.children(resource_id, child_type):
+                self.state.delete(stale['id'])
+            for child in children:
+                child_id = '{0}/{1}/{2}'.format(resource_id, prop, child['name'])
+                self.put(child_id, child['name'], '{0}/{1}'.format(type_name, prop), None, child, base_url, False)
+
+        if parent_type == 'publicipaddresses' and 'ipAddress' not in properties:
+            properties['ipAddress'] = '203.0.113.{0}'.format(len(self.state.resources) % 254 + 1)
+        elif parent_type == 'virtualmachines':
+            properties.setdefault('vmId', (existing or {}).get('properties', {}).get('vmId') or str(uuid.uuid4()))
+        elif parent_type == 'deployments':
+            properties.pop('template', None)
+            properties.setdefault('outputs', {})
+            properties['timestamp'] = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+            properties['correlationId'] = str(uuid.uuid4())
+        elif len(type_name.split('/')) == 3 and type_name.split('/')[1].lower() == 'dnszones':
+            zone = resource_id.split('/')[-3]
+            properties['fqdn'] = '{0}.{1}.'.format(name, zone) if name != '@' else '{0}.'.format(zone)
+
+        resource['properties'] = properties
+        self.state.resources[resource_id.lower()] = resource
+
+        status = 200 if existing else 201
+        if lro:
+            return self.accepted(base_url, status=status, body=self.state.render(resource))
+        return status, {'ETag': resource['etag']}, self.state.render(resource)
+
+    def action(self, action, resource, base_url):
+        '''
+        Run a POST action on a resource, such as starting a virtual machine or validating a deployment
+        '''
+        if action.lower() == 'validate':
+            return 200, {}, {'properties': copy.deepcopy(resource.get('properties', {}))}
+        if action.lower() == 'exporttemplate':
+            return 200, {}, {'template': {'resources': []}}
+        if action.lower() in SYNC_ACTIONS:
+            return 200, {}, None
+
+        return self.accepted(base_url)
+
+    def batch(self, body, base_url):
+        '''
+        Serve the ARM batch endpoint by answering each request in the batch
+        '''
+        responses = []
+        for request in (body or {}).get('requests', []):
+            self.stats['batched'] += 1
+            url = request.get('url', '')
+            if url.startswith(base_url):
+                url = url[len(base_url):]
+            status, headers, content = self.route(
+                request.get('httpMethod', 'GET').upper(),
+                urlsplit(url).path.rstrip('/'),
+                dict((key, values[0]) for key, values in parse_qs(urlsplit(url).query).items()),
+                request.get('requestHeaderDetails') or {},
+                request.get('content'),
+                base_url,
+            )
+            responses.append({
+                'name': request.get('name'),
+                'httpStatusCode': status,
+                'headers': headers,
+                'content': content,
+            })
+
+        return 200, {}, {'responses': responses}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    '''
+    HTTP request handler which hands every request to the emulator
+    '''
+    protocol_version = 'HTTP/1.1'
+
+    def _respond(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        raw = self.rfile.read(length) if length else b''
+        try:
+            body = json.loads(raw.decode('utf-8')) if raw else None
+        except ValueError:
+            body = None
+
+        base_url = 'http://{0}'.format(self.headers.get('Host') or '{0}:{1}'.format(*self.server.server_address[:2]))
+        status, headers, resp_body = self.server.emulator.handle(
+            self.command, self.path, self.headers, body, base_url
+        )
+
+        payload = json.dumps(resp_body).encode('utf-8') if resp_body is not None else b''
+        self.send_response(status)
+        for header, value in headers.items():
+            self.send_header(header, value)
+        if payload:
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(payload)))
+        self.send_header('x-ms-request-id', str(uuid.uuid4()))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(payload)
+
+    do_GET = do_PUT = do_POST = do_PATCH = do_DELETE = do_HEAD = _respond
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        log.debug('ARM emulator: ' + format, *args)
+
+
+def parse():
+    '''
+    Parse the cli args
+    '''
+    parser = argparse.ArgumentParser(description='Run a local Azure Resource Manager emulator.')
+    parser.add_argument('--host', default='127.0.0.1', help='The address to listen on')
+    parser.add_argument('--port', type=int, default=8080, help='The port to listen on')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds to wait before answering each request')
+    parser.add_argument('--throttle-rate', type=float, default=0.0,
+                        help='The fraction of requests answered with a 429')
+    parser.add_argument('--retry-after', type=int, default=0, help='The Retry-After sent with a 429, in seconds')
+    parser.add_argument('--page-size', type=int, default=100, help='The number of items in each list page')
+    parser.add_argument('--lro-polls', type=int, default=1,
+                        help='The number of status polls before a long-running operation completes')
+    parser.add_argument('--read-budget', type=int, default=READ_BUDGET,
+                        help='The number of reads each subscription may make per hour')
+    parser.add_argument('--write-budget', type=int, default=WRITE_BUDGET,
+                        help='The number of writes each subscription may make per hour')
+    return parser.parse_args().__dict__
+
+
+def start():
+    '''
+    Run the emulator in the foreground until interrupted
+    '''
+    logging.basicConfig(level=logging.INFO)
+    opts = parse()
+    emulator = ArmEmulator(**dict((key.replace('-', '_'), value) for key, value in opts.items()))
+    log.info('ARM emulator listening on %s', emulator.url)
+    print(emulator.url, flush=True)
+    try:
+        emulator.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        emulator.server.server_close()
+
+
+if __name__ == '__main__':
+    start()
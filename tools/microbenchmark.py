@@ -0,0 +1,412 @@
+# -*- coding: utf-8 -*-
+'''
+Azure Resource Manager (ARM) Utility Microbenchmarks
+
+.. versionadded:: 1.0.0
+
+Time the diff and model building functions which run for every state against realistic payloads: a network
+security group with 1000 rules, a route table with 500 routes, a network interface and a fully populated virtual
+machine. Model building is timed both with the compiled model plans cached, as in a state run, and with them
+compiled on every call. Each case is run for a number of rounds, and the fastest and median time per call are
+reported in microseconds.
+
+Results can be saved as a baseline on the machine running them and later runs compared against it. Run from the
+root of the repository:
+
+.. code-block:: bash
+
+    python -m tools.microbenchmark --save-baseline microbenchmark_baseline.json
+    python -m tools.microbenchmark --baseline microbenchmark_baseline.json --tolerance 0.2
+
+'''
+
+# Python libs
+from __future__ import absolute_import
+import argparse
+import asyncio
+import copy
+import json
+import logging
+import statistics
+import sys
+import time
+
+# Import local libs
+from tools.benchmark import make_hub
+from tools.emulator import SUBSCRIPTION_ID
+
+log = logging.getLogger(__name__)
+
+NETWORK_PREFIX = '/subscriptions/{0}/resourceGroups/bench/providers/Microsoft.Network'.format(SUBSCRIPTION_ID)
+
+COMPUTE_PREFIX = '/subscriptions/{0}/resourceGroups/bench/providers/Microsoft.Compute'.format(SUBSCRIPTION_ID)
+
+
+def security_rule(idx):
+    '''
+    Return a security rule as returned by the SDK
+    '''
+    return {
+        'id': '{0}/networkSecurityGroups/nsg/securityRules/rule{1}'.format(NETWORK_PREFIX, idx),
+        'name': 'rule{0}'.format(idx),
+        'etag': 'W/"{0:08x}-0000-0000-0000-000000000000"'.format(idx),
+        'description': 'Allow inbound traffic on port {0}'.format(1024 + idx),
+        'protocol': 'Tcp',
+        'source_port_range': '*',
+        'destination_port_range': str(1024 + idx),
+        'source_address_prefix': '10.{0}.0.0/16'.format(idx % 256),
+        'destination_address_prefix': '*',
+        'source_address_prefixes': [],
+        'destination_address_prefixes': [],
+        'source_port_ranges': [],
+        'destination_port_ranges': [],
+        'access': 'Allow',
+        'priority': 100 + idx,
+        'direction': 'Inbound',
+        'provisioning_state': 'Succeeded',
+    }
+
+
+def network_security_group(rules=1000):
+    '''
+    Return a network security group with the given number of rules as returned by the SDK
+    '''
+    return {
+        'id': '{0}/networkSecurityGroups/nsg'.format(NETWORK_PREFIX),
+        'name': 'nsg',
+        'type': 'Microsoft.Network/networkSecurityGroups',
+        'location': 'eastus',
+        'tags': {'environment': 'benchmark', 'owner': 'platform'},
+        'etag': 'W/"00000000-0000-0000-0000-000000000000"',
+        'resource_guid': '00000000-0000-0000-0000-000000000001',
+        'provisioning_state': 'Succeeded',
+        'security_rules': [security_rule(idx) for idx in range(rules)],
+        'default_security_rules': [
+            dict(security_rule(idx), name=name, priority=65000 + idx)
+            for idx, name in enumerate(('AllowVnetInBound', 'AllowAzureLoadBalancerInBound', 'DenyAllInBound',
+                                        'AllowVnetOutBound', 'AllowInternetOutBound', 'DenyAllOutBound'))
+        ],
+        'network_interfaces': [
+            {'id': '{0}/networkInterfaces/nic{1}'.format(NETWORK_PREFIX, idx)} for idx in range(20)
+        ],
+    }
+
+
+def route(idx):
+    '''
+    Return a route as returned by the SDK
+    '''
+    return {
+        'id': '{0}/routeTables/rt/routes/route{1}'.format(NETWORK_PREFIX, idx),
+        'name': 'route{0}'.format(idx),
+        'etag': 'W/"{0:08x}-0000-0000-0000-000000000000"'.format(idx),
+        'address_prefix': '10.{0}.{1}.0/24'.format(idx // 256, idx % 256),
+        'next_hop_type': 'VirtualAppliance',
+        'next_hop_ip_address': '192.168.0.4',
+        'provisioning_state': 'Succeeded',
+    }
+
+
+def virtual_machine():
+    '''
+    Return a fully populated virtual machine as returned by the SDK
+    '''
+    return {
+        'id': '{0}/virtualMachines/vm'.format(COMPUTE_PREFIX),
+        'name': 'vm',
+        'type': 'Microsoft.Compute/virtualMachines',
+        'location': 'eastus',
+        'tags': {'environment': 'benchmark', 'owner': 'platform', 'cost_center': '1234'},
+        'zones': ['1'],
+        'identity': {'type': 'SystemAssigned', 'principal_id': '00000000-0000-0000-0000-000000000002',
+                     'tenant_id': '00000000-0000-0000-0000-000000000003'},
+        'hardware_profile': {'vm_size': 'Standard_D4s_v3'},
+        'storage_profile': {
+            'image_reference': {'publisher': 'Canonical', 'offer': 'UbuntuServer', 'sku': '18.04-LTS',
+                                'version': 'latest'},
+            'os_disk': {
+                'os_type': 'Linux',
+                'name': 'vm_OsDisk_1',
+                'caching': 'ReadWrite',
+                'create_option': 'FromImage',
+                'disk_size_gb': 30,
+                'managed_disk': {'id': '{0}/disks/vm_OsDisk_1'.format(COMPUTE_PREFIX),
+                                 'storage_account_type': 'Premium_LRS'},
+            },
+            'data_disks': [
+                {
+                    'lun': lun,
+                    'name': 'vm_DataDisk_{0}'.format(lun),
+                    'caching': 'ReadOnly',
+                    'create_option': 'Empty',
+                    'disk_size_gb': 128,
+                    'managed_disk': {'id': '{0}/disks/vm_DataDisk_{1}'.format(COMPUTE_PREFIX, lun),
+                                     'storage_account_type': 'Premium_LRS'},
+                }
+                # LUN 0 is left free, as create_object_model drops falsy arguments such as lun=0
+                for lun in range(1, 5)
+            ],
+        },
+        'os_profile': {
+            'computer_name': 'vm',
+            'admin_username': 'idem',
+            'linux_configuration': {
+                'disable_password_authentication': True,
+                'ssh': {'public_keys': [
+                    {'path': '/home/idem/.ssh/authorized_keys', 'key_data': 'ssh-rsa ' + 'A' * 372 + ' idem'},
+                ]},
+                'provision_vm_agent': True,
+            },
+            'secrets': [],
+            'allow_extension_operations': True,
+        },
+        'network_profile': {'network_interfaces': [
+            {'id': '{0}/networkInterfaces/vm-nic{1}'.format(NETWORK_PREFIX, idx), 'primary': idx == 0}
+            for idx in range(2)
+        ]},
+        'diagnostics_profile': {'boot_diagnostics': {'enabled': True,
+                                                     'storage_uri': 'https://benchdiag.blob.core.windows.net/'}},
+        'provisioning_state': 'Succeeded',
+        'vm_id': '00000000-0000-0000-0000-000000000004',
+    }
+
+
+def network_interface():
+    '''
+    Return the arguments a network interface state passes to create_object_model
+    '''
+    return {
+        'location': 'eastus',
+        'tags': {'environment': 'benchmark'},
+        'network_security_group': {'id': '{0}/networkSecurityGroups/nsg'.format(NETWORK_PREFIX)},
+        'enable_accelerated_networking': True,
+        'dns_settings': {'dns_servers': ['10.0.0.4', '10.0.0.5']},
+        'ip_configurations': [
+            {
+                'name': 'ipconfig{0}'.format(idx),
+                'primary': idx == 0,
+                'private_ip_allocation_method': 'Dynamic',
+                'subnet': {'id': '{0}/virtualNetworks/vnet/subnets/default'.format(NETWORK_PREFIX)},
+                'public_ip_address': {'id': '{0}/publicIPAddresses/pip{1}'.format(NETWORK_PREFIX, idx)},
+            }
+            for idx in range(2)
+        ],
+    }
+
+
+def _state_view(items, keys):
+    '''
+    Return the subset of each dictionary a state passes in, which omits read-only data such as IDs and etags
+    '''
+    return [dict((key, item[key]) for key in keys if key in item) for item in items]
+
+
+class _Item(object):
+    '''
+    An item of a paged listing, converted to a dictionary like an SDK model
+    '''
+    def __init__(self, data):
+        self.data = data
+
+    def as_dict(self):
+        return copy.deepcopy(self.data)
+
+
+class _Paged(object):
+    '''
+    A paged listing which serves fixed pages, shaped like an SDK pager
+    '''
+    def __init__(self, pages):
+        self.pages = pages
+        self.fetched = 0
+
+    def advance_page(self):
+        if self.fetched >= len(self.pages):
+            raise StopIteration('End of paging')
+        self.fetched += 1
+        return self.pages[self.fetched - 1]
+
+
+def build_cases(hub):
+    '''
+    Return the benchmark cases as a list of names and coroutine functions taking no arguments
+    '''
+    nsg = network_security_group()
+    nsg_changed = copy.deepcopy(nsg)
+    nsg_changed['security_rules'][500]['destination_port_range'] = '8443'
+    routes = [route(idx) for idx in range(500)]
+    vm = virtual_machine()
+    vm_changed = copy.deepcopy(vm)
+    vm_changed['tags']['owner'] = 'security'
+    vm_changed['storage_profile']['data_disks'][2]['disk_size_gb'] = 256
+
+    rule_keys = ('name', 'protocol', 'source_port_range', 'destination_port_range', 'source_address_prefix',
+                 'destination_address_prefix', 'access', 'priority', 'direction')
+    local_rules = _state_view(nsg['security_rules'], rule_keys)
+    local_routes = _state_view(routes, ('name', 'address_prefix', 'next_hop_type', 'next_hop_ip_address'))
+
+    rule_pages = [[_Item(rule) for rule in nsg['security_rules'][start:start + 100]] for start in range(0, 1000, 100)]
+    route_models = [dict((key, value) for key, value in item.items() if key not in ('id', 'etag'))
+                    for item in routes]
+
+    nic = network_interface()
+    vm_model = dict((key, value) for key, value in vm.items() if key not in ('id', 'type'))
+
+    async def _uncached_model(module_name, object_name, **kwargs):
+        hub.exec.utils.azurerm.MODEL_PLANS.clear()
+        return await hub.exec.utils.azurerm.create_object_model(module_name, object_name, **kwargs)
+
+    async def _recursive_diff(past, current):
+        diff = await hub.exec.utils.dictdiffer.recursive_diff(past, current)
+        return (diff.added(), diff.removed(), diff.changed(), diff.new_values, diff.old_values,
+                diff.changes_str)
+
+    return [
+        ('deep_diff.nsg_1000_rules.unchanged', lambda: hub.exec.utils.dictdiffer.deep_diff(nsg, nsg)),
+        ('deep_diff.nsg_1000_rules.one_rule_changed', lambda: hub.exec.utils.dictdiffer.deep_diff(nsg, nsg_changed)),
+        ('deep_diff.vm.changed', lambda: hub.exec.utils.dictdiffer.deep_diff(vm, vm_changed)),
+        ('recursive_diff.nsg_1000_rules.one_rule_changed', lambda: _recursive_diff(nsg, nsg_changed)),
+        ('recursive_diff.vm.changed', lambda: _recursive_diff(vm, vm_changed)),
+        ('compare_list_of_dicts.nsg_1000_rules', lambda: hub.exec.utils.azurerm.compare_list_of_dicts(
+            nsg['security_rules'], local_rules
+        )),
+        ('compare_list_of_dicts.route_table_500_routes', lambda: hub.exec.utils.azurerm.compare_list_of_dicts(
+            routes, local_routes
+        )),
+        ('create_object_model.nsg_1000_rules', lambda: hub.exec.utils.azurerm.create_object_model(
+            'network', 'NetworkSecurityGroup', location='eastus', security_rules=local_rules
+        )),
+        ('create_object_model.route_table_500_routes', lambda: hub.exec.utils.azurerm.create_object_model(
+            'network', 'RouteTable', location='eastus', routes=route_models
+        )),
+        ('create_object_model.vm', lambda: hub.exec.utils.azurerm.create_object_model(
+            'compute', 'VirtualMachine', **vm_model
+        )),
+        ('create_object_model.vm.uncached', lambda: _uncached_model('compute', 'VirtualMachine', **vm_model)),
+        ('create_object_model.network_interface', lambda: hub.exec.utils.azurerm.create_object_model(
+            'network', 'NetworkInterface', **nic
+        )),
+        ('create_object_model.network_interface.uncached', lambda: _uncached_model(
+            'network', 'NetworkInterface', **nic
+        )),
+        ('paged_object_to_list.nsg_1000_rules', lambda: hub.exec.utils.azurerm.paged_object_to_list(
+            _Paged(rule_pages)
+        )),
+    ]
+
+
+async def _time_case(func, rounds, min_time):
+    '''
+    Time a case, calibrating the number of calls per round so each round runs for at least min_time seconds, and
+    return the time per call of every round
+    '''
+    calls = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(calls):
+            await func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        calls *= 2 if elapsed < min_time / 10 else max(int(min_time / elapsed) + 1, 2)
+
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(calls):
+            await func()
+        timings.append((time.perf_counter() - start) / calls)
+
+    return timings, calls
+
+
+async def run(cases, rounds=5, min_time=0.1, match=None):
+    '''
+    Run the benchmark cases, returning the fastest, median and mean time per call of each in microseconds
+    '''
+    results = {}
+    for name, func in cases:
+        if match and match not in name:
+            continue
+        try:
+            timings, calls = await _time_case(func, rounds, min_time)
+        except (Exception, SystemExit) as exc:  # pylint: disable=broad-except
+            log.warning('Skipping %s: %s', name, exc)
+            continue
+        results[name] = {
+            'min_us': round(min(timings) * 1e6, 2),
+            'median_us': round(statistics.median(timings) * 1e6, 2),
+            'mean_us': round(statistics.mean(timings) * 1e6, 2),
+            'calls_per_round': calls,
+            'rounds': rounds,
+        }
+        log.info('%s: %.2fus', name, results[name]['min_us'])
+
+    return results
+
+
+def compare(results, baseline, tolerance):
+    '''
+    Return a description of every case whose fastest time is worse than its baseline by more than the tolerance
+    '''
+    regressions = []
+    for name, measured in results.items():
+        expected = baseline.get(name, {}).get('min_us')
+        if expected and measured['min_us'] > expected * (1 + tolerance):
+            regressions.append('{0}: {1}us exceeds the baseline of {2}us'.format(name, measured['min_us'], expected))
+
+    return regressions
+
+
+def parse():
+    '''
+    Parse the cli args
+    '''
+    parser = argparse.ArgumentParser(description='Time the azurerm diff and model building functions.')
+    parser.add_argument('--rounds', type=int, default=5, help='The number of timed rounds for each case')
+    parser.add_argument('--min-time', type=float, default=0.1, help='The minimum number of seconds in each round')
+    parser.add_argument('--match', default=None, help='Only run the cases whose name contains this string')
+    parser.add_argument('--baseline', default=None,
+                        help='A baseline saved on this machine to compare the results against. Nothing is '
+                             'compared unless one is given.')
+    parser.add_argument('--save-baseline', default=None, metavar='FILE',
+                        help='Save the results as a baseline for this machine')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='The fraction a case may exceed its baseline by before it is a regression')
+    return parser.parse_args().__dict__
+
+
+def start():
+    '''
+    Run the microbenchmarks, print the results and compare them against a baseline if one is given
+    '''
+    logging.basicConfig(level=logging.INFO)
+    opts = parse()
+
+    hub = make_hub()
+    results = asyncio.get_event_loop().run_until_complete(
+        run(build_cases(hub), rounds=opts['rounds'], min_time=opts['min_time'], match=opts['match'])
+    )
+
+    print(json.dumps(results, indent=2, sort_keys=True))
+
+    if opts['save_baseline']:
+        with open(opts['save_baseline'], 'w') as baseline_file:
+            json.dump(results, baseline_file, indent=2, sort_keys=True)
+        log.info('Saved the baseline to %s', opts['save_baseline'])
+
+    if not opts['baseline']:
+        return
+
+    with open(opts['baseline']) as baseline_file:
+        baseline = json.load(baseline_file)
+
+    regressions = compare(results, baseline, opts['tolerance'])
+    for regression in regressions:
+        log.error('Regression: %s', regression)
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    start()